@@ -9,9 +9,10 @@ from .conversion import float32_to_int16, int16_to_float32
 from .decoder import OpusDecoder, OpusStreamDecoder
 from .encoder import OpusEncoder
 from .opus_batch import OpusBatchDecoder, OpusBatchEncoder
-from .vad import SileroVAD, VADProbSmoother
+from .vad import MultiStreamVAD, SileroVAD, VADProbSmoother
 
 __all__ = [
+    "MultiStreamVAD",
     "OpusBatchDecoder",
     "OpusBatchEncoder",
     "OpusDecoder",
@@ -6,6 +6,8 @@ import wave
 import numpy as np
 import opuslib
 
+from ..ring_buffer import RingBuffer
+
 MAX_BUFFER_SECONDS = int(os.getenv("MATILDA_EARS_MAX_STREAM_BUFFER_SECONDS", "120"))
 
 # Setup standardized logging
@@ -38,10 +40,9 @@ class OpusDecoder:
         # Initialize Opus decoder
         self.decoder = opuslib.Decoder(sample_rate, channels)
 
-        # PCM audio buffer (accumulates decoded audio)
-        self.pcm_buffer = io.BytesIO()
+        # Decoded PCM, capped at the most recent MAX_BUFFER_SECONDS
+        self.pcm_buffer = RingBuffer(sample_rate * channels * MAX_BUFFER_SECONDS, dtype=np.int16)
         self.sample_count = 0
-        self.max_pcm_bytes = sample_rate * channels * 2 * MAX_BUFFER_SECONDS
 
         logger.info(f"Opus decoder initialized: {sample_rate}Hz, {channels} channel(s)")
 
@@ -59,14 +60,8 @@ class OpusDecoder:
             # Decode Opus to PCM, explicitly providing the frame size
             pcm_data = self.decoder.decode(opus_data, self.frame_size)
 
-            # Write decoded PCM to buffer
-            self.pcm_buffer.write(pcm_data)
-            if self.pcm_buffer.tell() > self.max_pcm_bytes:
-                pcm_tail = self.pcm_buffer.getvalue()[-self.max_pcm_bytes :]
-                self.pcm_buffer = io.BytesIO()
-                self.pcm_buffer.write(pcm_tail)
-
             pcm_samples = np.frombuffer(pcm_data, dtype=np.int16)
+            self.pcm_buffer.append(pcm_samples)
             samples_decoded = len(pcm_samples)
             self.sample_count += samples_decoded
 
@@ -84,10 +79,6 @@ class OpusDecoder:
             Complete WAV file data ready for Whisper
 
         """
-        # Get PCM data from buffer
-        self.pcm_buffer.seek(0)
-        pcm_data = self.pcm_buffer.read()
-
         # Create WAV file in memory
         wav_buffer = io.BytesIO()
 
@@ -95,7 +86,7 @@ class OpusDecoder:
             wav_file.setnchannels(self.channels)
             wav_file.setsampwidth(2)  # 16-bit audio
             wav_file.setframerate(self.sample_rate)
-            wav_file.writeframes(pcm_data)
+            wav_file.writeframes(self.pcm_buffer.view())
 
         # Return complete WAV data
         wav_buffer.seek(0)
@@ -111,21 +102,14 @@ class OpusDecoder:
         """Get accumulated audio as numpy array.
 
         Returns:
-            PCM audio data as int16 numpy array
+            PCM audio data as a read-only int16 view, valid until the next decode_chunk()
 
         """
-        # Get PCM data
-        self.pcm_buffer.seek(0)
-        pcm_data = self.pcm_buffer.read()
-
-        # Convert to numpy array
-        audio_array = np.frombuffer(pcm_data, dtype=np.int16)
-
-        return audio_array
+        return self.pcm_buffer.view()
 
     def reset(self):
         """Reset decoder and clear buffers."""
-        self.pcm_buffer = io.BytesIO()
+        self.pcm_buffer.clear()
         self.sample_count = 0
         logger.debug("Decoder reset")
 
@@ -141,7 +125,7 @@ class OpusDecoder:
             "frame_size": self.frame_size,
             "samples_accumulated": self.sample_count,
             "duration_seconds": self.get_duration(),
-            "buffer_size_bytes": self.pcm_buffer.tell(),
+            "buffer_size_bytes": self.pcm_buffer.nbytes,
         }
 
 
@@ -0,0 +1,98 @@
+"""Fixed-capacity sample ring buffer for long-running audio streams."""
+
+import numpy as np
+import numpy.typing as npt
+
+
+class RingBuffer:
+    """Keeps the most recent ``max_samples`` samples of a stream.
+
+    Appending copies only the new samples and, once the buffer is full,
+    overwrites the oldest ones, so memory and per-chunk cost stay flat however
+    long the stream runs. Every sample is stored twice, ``capacity`` apart,
+    which makes the retained window one contiguous slice: :meth:`view`
+    returns it without copying.
+
+    Storage starts small and doubles up to ``max_samples``, so short streams
+    do not pay for the full window.
+    """
+
+    def __init__(self, max_samples: int, dtype: npt.DTypeLike = np.int16, initial_samples: int = 1 << 16):
+        """Create an empty buffer.
+
+        Args:
+            max_samples: Most samples retained; older ones are dropped
+            dtype: Sample type (int16 PCM, float32, ...)
+            initial_samples: Capacity allocated up front
+
+        """
+        if max_samples <= 0:
+            raise ValueError("max_samples must be positive")
+        self.max_samples = int(max_samples)
+        self.dtype = np.dtype(dtype)
+        self.capacity = max(1, min(self.max_samples, int(initial_samples)))
+        self._storage = np.zeros(2 * self.capacity, dtype=self.dtype)
+        self._end = 0  # next write position in [0, capacity)
+        self._size = 0
+        self.total_samples = 0  # every sample ever appended, including dropped ones
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def dropped_samples(self) -> int:
+        return self.total_samples - self._size
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes of retained audio (not of the allocation)."""
+        return int(self._size * self.dtype.itemsize)
+
+    def append(self, samples: np.ndarray) -> None:
+        """Append samples, dropping the oldest ones beyond ``max_samples``."""
+        samples = np.asarray(samples).reshape(-1)
+        n = samples.size
+        if n == 0:
+            return
+        self.total_samples += n
+        if n > self.max_samples:
+            samples = samples[-self.max_samples :]
+            n = self.max_samples
+        if self._size + n > self.capacity and self.capacity < self.max_samples:
+            self._grow(min(self.max_samples, max(2 * self.capacity, self._size + n)))
+
+        cap = self.capacity
+        first = min(n, cap - self._end)
+        self._storage[self._end : self._end + first] = samples[:first]
+        self._storage[self._end + cap : self._end + cap + first] = samples[:first]
+        rest = n - first
+        if rest:
+            self._storage[:rest] = samples[first:]
+            self._storage[cap : cap + rest] = samples[first:]
+        self._end = (self._end + n) % cap
+        self._size = min(cap, self._size + n)
+
+    def view(self) -> np.ndarray:
+        """Retained samples, oldest first, as a read-only view.
+
+        The view aliases the buffer: it is only valid until the next append.
+        Copy it to keep the samples.
+        """
+        start = (self._end - self._size) % self.capacity
+        window = self._storage[start : start + self._size]
+        window.flags.writeable = False
+        return window
+
+    def clear(self) -> None:
+        self._end = 0
+        self._size = 0
+        self.total_samples = 0
+
+    def _grow(self, capacity: int) -> None:
+        retained = self.view()
+        storage = np.zeros(2 * capacity, dtype=self.dtype)
+        storage[: self._size] = retained
+        storage[capacity : capacity + self._size] = retained
+        self._storage = storage
+        self.capacity = capacity
+        self._end = self._size % capacity
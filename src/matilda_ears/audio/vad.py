@@ -8,6 +8,7 @@ Significantly more accurate than simple amplitude-based detection.
 from typing import Any
 import asyncio
 import logging
+import threading
 
 try:
     import numpy as np
@@ -30,6 +31,7 @@ try:
 except ImportError:
     TORCH_AVAILABLE = False
 
+from ..core.metrics import stage_timer
 from .conversion import int16_to_float32
 
 
@@ -328,6 +330,201 @@ class SileroVAD:
         }
 
 
+class MultiStreamVAD:
+    """One Silero VAD model scoring many independent audio streams.
+
+    Silero is recurrent: every stream needs its own state, so a single SileroVAD
+    must not be shared between sessions. This engine keeps the state of each
+    stream in a VADStream and scores the frames of all streams that are waiting
+    in one batched model call per frame step.
+    """
+
+    # Attributes of the silero-vad wrappers (ONNX and JIT) that hold the recurrent state
+    _STATE_ATTRS = ("_state", "_context", "_last_sr", "_last_batch_size")
+
+    def __init__(self, sample_rate: int = 16000, threshold: float = 0.5, use_onnx: bool = True, model: Any = None):
+        """Initialize the shared model.
+
+        Args:
+            sample_rate: Audio sample rate (8000 or 16000 Hz)
+            threshold: Speech detection threshold (0.0-1.0)
+            use_onnx: Use ONNX model for 4-5x faster inference
+            model: Already loaded Silero model (loaded with SileroVAD when omitted)
+
+        """
+        if sample_rate not in [8000, 16000]:
+            raise ValueError(f"Sample rate must be 8000 or 16000 Hz, got {sample_rate}")
+
+        self.sample_rate = sample_rate
+        self.threshold = threshold
+        self.use_onnx = use_onnx
+        self.frame_size = 512 if sample_rate == 16000 else 256
+        self.context_size = 64 if sample_rate == 16000 else 32
+        self.logger = logging.getLogger(__name__)
+
+        if model is None:
+            model = SileroVAD(sample_rate=sample_rate, threshold=threshold, use_onnx=use_onnx).model
+        self.model = model
+        # Without access to the recurrent state, every stream gets its own model instead
+        self.batched = all(hasattr(model, attr) for attr in self._STATE_ATTRS)
+        if not self.batched:
+            self.logger.warning("Silero model does not expose its state; using one model per stream")
+
+        self._lock = threading.Lock()
+        self._pending: list[tuple[VADStream, np.ndarray, asyncio.Future]] = []
+        self._flush_scheduled = False
+
+    def stream(self) -> "VADStream":
+        """Create the VAD state for a new stream (one per session)."""
+        return VADStream(self)
+
+    def score(self, chunks: list[tuple["VADStream", np.ndarray]]) -> list[float]:
+        """Score one chunk per stream and return the speech probability of each chunk.
+
+        Each chunk is split into model frames; the frames of all streams are
+        stepped together through the model. A chunk's probability is the maximum
+        over its frames. Samples that do not fill a frame are kept for the next
+        chunk of the same stream.
+        """
+        frames = [stream._frames(int16_to_float32(chunk).squeeze()) for stream, chunk in chunks]
+        probs = [[] for _ in chunks]
+
+        with self._lock, torch.no_grad():
+            for step in range(max((len(f) for f in frames), default=0)):
+                active = [i for i, f in enumerate(frames) if step < len(f)]
+                if self.batched:
+                    step_probs = self._step([chunks[i][0] for i in active], [frames[i][step] for i in active])
+                else:
+                    step_probs = [chunks[i][0]._step_own_model(frames[i][step]) for i in active]
+                for i, prob in zip(active, step_probs, strict=True):
+                    probs[i].append(prob)
+
+        results = []
+        for (stream, _), chunk_probs in zip(chunks, probs, strict=True):
+            if chunk_probs:
+                stream.last_probability = max(chunk_probs)
+            results.append(stream.last_probability)
+        return results
+
+    def _step(self, streams: list["VADStream"], frames: list[np.ndarray]) -> list[float]:
+        batch_size = len(streams)
+        state = torch.cat([s._state if s._state is not None else torch.zeros(2, 1, 128) for s in streams], dim=1)
+        context = torch.cat(
+            [s._context if s._context is not None else torch.zeros(1, self.context_size) for s in streams], dim=0
+        )
+
+        model = self.model
+        model._state = state
+        model._context = context
+        model._last_sr = self.sample_rate
+        model._last_batch_size = batch_size
+        out = model(torch.from_numpy(np.stack(frames)), self.sample_rate)
+
+        for i, stream in enumerate(streams):
+            stream._state = model._state[:, i : i + 1].clone()
+            stream._context = model._context[i : i + 1].clone()
+        return [float(p) for p in out.reshape(batch_size, -1)[:, 0]]
+
+    async def score_async(self, stream: "VADStream", audio_chunk: np.ndarray) -> float:
+        """Score a chunk, batched with the chunks other streams submit in the same event loop iteration."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((stream, audio_chunk, future))
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            loop.call_soon(self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        self._flush_scheduled = False
+        pending, self._pending = self._pending, []
+        while pending:
+            # A stream's chunks must be stepped in order, so at most one chunk per stream per round
+            batch, rest, seen = [], [], set()
+            for item in pending:
+                (rest if id(item[0]) in seen else batch).append(item)
+                seen.add(id(item[0]))
+            pending = rest
+            try:
+                results = self.score([(stream, chunk) for stream, chunk, _ in batch])
+            except Exception as e:
+                self.logger.error(f"Error processing audio chunks: {e}")
+                results = [0.0] * len(batch)
+            for (_, _, future), prob in zip(batch, results, strict=True):
+                if not future.done():
+                    future.set_result(prob)
+
+    def get_stats(self) -> dict:
+        """Get VAD statistics."""
+        return {
+            "sample_rate": self.sample_rate,
+            "threshold": self.threshold,
+            "model_type": "ONNX" if self.use_onnx else "JIT",
+            "batched": self.batched,
+        }
+
+
+class VADStream:
+    """Per-session VAD state of a MultiStreamVAD.
+
+    Has the same process_chunk()/reset_states() surface as SileroVAD, so it can be
+    used wherever a session-owned VAD is expected.
+    """
+
+    def __init__(self, engine: MultiStreamVAD):
+        self.engine = engine
+        self.last_probability = 0.0
+        self._own_model: Any = None
+        self.reset_states()
+
+    @property
+    def threshold(self) -> float:
+        return self.engine.threshold
+
+    def reset_states(self) -> None:
+        """Forget the audio seen so far."""
+        self._state = None
+        self._context = None
+        self._remainder = np.zeros(0, dtype=np.float32)
+        if self._own_model is not None:
+            self._own_model.reset_states()
+
+    def process_chunk(self, audio_chunk: np.ndarray) -> float:
+        """Score a chunk right away, without batching. Returns the speech probability."""
+        try:
+            return self.engine.score([(self, audio_chunk)])[0]
+        except Exception as e:
+            self.engine.logger.error(f"Error processing audio chunk: {e}")
+            return 0.0
+
+    async def process_chunk_async(self, audio_chunk: np.ndarray) -> float:
+        """Score a chunk batched with the other streams of the engine."""
+        return await self.engine.score_async(self, audio_chunk)
+
+    def _frames(self, audio: np.ndarray) -> list[np.ndarray]:
+        frame_size = self.engine.frame_size
+        if self._remainder.size:
+            audio = np.concatenate([self._remainder, audio])
+        count = audio.size // frame_size
+        self._remainder = audio[count * frame_size :]
+        return [audio[i * frame_size : (i + 1) * frame_size] for i in range(count)]
+
+    def _step_own_model(self, frame: np.ndarray) -> float:
+        if self._own_model is None:
+            self._own_model = SileroVAD(
+                sample_rate=self.engine.sample_rate, threshold=self.engine.threshold, use_onnx=self.engine.use_onnx
+            ).model
+        return float(self._own_model(torch.from_numpy(frame), self.engine.sample_rate).item())
+
+
+async def speech_probability(vad: Any, audio_chunk: np.ndarray) -> float:
+    """Speech probability of a chunk; VADStreams are batched with the other streams of their engine."""
+    with stage_timer("vad"):
+        if isinstance(vad, VADStream):
+            return await vad.process_chunk_async(audio_chunk)
+        return vad.process_chunk(audio_chunk)
+
+
 class VADProbSmoother:
     """High-level VAD processor with buffering and smoothing."""
 
@@ -10,7 +10,21 @@ from typing import Any
 import tomllib
 
 DEFAULT_CONFIG: dict[str, Any] = {
-    "transcription": {"backend": "auto"},
+    "transcription": {
+        "backend": "auto",
+        # Dedicated inference pool; None sizes it from the CPU count. Parakeet always runs a single worker
+        "workers": None,
+        "max_queue": 32,
+        "latency_budget_seconds": 30,
+        # Results of byte-identical batch uploads; disk_dir adds a persistent tier
+        "result_cache": {
+            "enabled": True,
+            "max_entries": 256,
+            "ttl_seconds": 600,
+            "disk_dir": None,
+            "max_disk_entries": 4096,
+        },
+    },
     "whisper": {"model": "base", "device": "auto", "compute_type": "auto", "word_timestamps": True},
     "huggingface": {
         "model": "openai/whisper-tiny",
@@ -23,6 +37,9 @@ DEFAULT_CONFIG: dict[str, Any] = {
     "streaming": {
         "enabled": False,
         "backend": "auto",
+        "coalesce_drain": True,
+        # Minimum gap between partial_result messages of one session
+        "partial_min_interval_ms": 100,
         "simul_streaming": {
             "language": "en",
             "model_size": "tiny",
@@ -32,6 +49,7 @@ DEFAULT_CONFIG: dict[str, Any] = {
             "never_fire": True,
             "vad_enabled": True,
             "vad_threshold": 0.5,
+            "encoder_batch_window_ms": 15,
         },
         "parakeet": {"context_size": (128, 128), "depth": 1},
     },
@@ -42,8 +60,15 @@ DEFAULT_CONFIG: dict[str, Any] = {
             "bind_host": "0.0.0.0",
             "connect_host": "localhost",
             "max_message_mb": 50,
+            # Queued streaming audio per connection; overflow: drop_oldest, coalesce or disconnect
+            "ingress_queue_size": 64,
+            "ingress_overflow": "drop_oldest",
             "jwt_secret_key": "GENERATE_RANDOM_SECRET_HERE",
             "jwt_token": "",
+            # How long a verified JWT payload is reused before the signature is checked again
+            "jwt_cache_ttl_seconds": 300,
+            # Where spent one-time tokens are recorded: "log" (append-only file) or "sqlite"
+            "used_token_store": "log",
             "ssl": {
                 "enabled": False,
                 "cert_file": "ssl/server.crt",
@@ -52,7 +77,17 @@ DEFAULT_CONFIG: dict[str, Any] = {
                 "auto_generate_certs": True,
                 "cert_validity_days": 365,
             },
-        }
+        },
+        # Forked worker processes, each loading its own model (1 = single process); SIGHUP restarts them one by one
+        "workers": 1,
+        "worker_grace_seconds": 30,
+        # Token buckets per tenant (JWT client id, else IP); loopback clients are exempt
+        "rate_limit": {
+            "requests_per_minute": 30,
+            "request_burst": 10,
+            "audio_seconds_per_minute": 300,
+            "audio_burst_seconds": 600,
+        },
     },
     "audio": {
         "sample_rate": 16000,
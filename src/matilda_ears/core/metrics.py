@@ -0,0 +1,214 @@
+"""Process-wide metrics in the Prometheus text exposition format.
+
+Deliberately tiny instead of depending on prometheus_client: counters and
+histograms with fixed label names, rendered on demand by the health
+server's ``/metrics`` route. Values that are only known at scrape time
+(queue depth, open sessions) are rendered with :func:`format_gauge`, and
+counters kept in existing stats dicts with :func:`format_counter`.
+"""
+
+import math
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager
+
+# Latency buckets in seconds, from sub-millisecond decode steps up to long batch jobs
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _format_labels(labelnames: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, values, strict=True)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Counter:
+    """Monotonic counter with optional labels."""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: dict[tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, *labelvalues: str) -> None:
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0.0) + amount
+
+    def value(self, *labelvalues: str) -> float:
+        return self._values.get(labelvalues, 0.0)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for labelvalues, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.labelnames, labelvalues)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    """Cumulative-bucket histogram with optional labels."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = tuple(sorted(buckets))
+        self._series: dict[tuple[str, ...], list] = {}  # labels -> [bucket counts, sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        with self._lock:
+            series = self._series.get(labelvalues)
+            if series is None:
+                series = self._series[labelvalues] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[0][i] += 1
+                    break
+            series[1] += value
+            series[2] += 1
+
+    def count(self, *labelvalues: str) -> int:
+        series = self._series.get(labelvalues)
+        return series[2] if series else 0
+
+    @contextmanager
+    def time(self, *labelvalues: str) -> Iterator[None]:
+        """Observe the wall time of the ``with`` block, including any awaits inside it."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, *labelvalues)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for labelvalues, (counts, total, count) in sorted(self._series.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets, counts, strict=True):
+                    cumulative += bucket_count
+                    le = _format_labels(self.labelnames, labelvalues, f'le="{_format_value(bound)}"')
+                    lines.append(f"{self.name}_bucket{le} {cumulative}")
+                le = _format_labels(self.labelnames, labelvalues, 'le="+Inf"')
+                lines.append(f"{self.name}_bucket{le} {count}")
+                labels = _format_labels(self.labelnames, labelvalues)
+                lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+                lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+def format_gauge(name: str, documentation: str, samples: dict[tuple[tuple[str, str], ...], float]) -> list[str]:
+    """Render a gauge from ``{((label, value), ...): sample}``."""
+    return _format_family(name, documentation, "gauge", samples)
+
+
+def format_counter(name: str, documentation: str, samples: dict[tuple[tuple[str, str], ...], float]) -> list[str]:
+    """Render a counter kept elsewhere (e.g. in a stats dict) from ``{((label, value), ...): sample}``."""
+    return _format_family(name, documentation, "counter", samples)
+
+
+def _format_family(name: str, documentation: str, kind: str, samples: dict) -> list[str]:
+    lines = [f"# HELP {name} {documentation}", f"# TYPE {name} {kind}"]
+    for labels, sample in samples.items():
+        names = tuple(label for label, _ in labels)
+        values = tuple(label_value for _, label_value in labels)
+        lines.append(f"{name}{_format_labels(names, values)} {_format_value(sample)}")
+    return lines
+
+
+STAGE_SECONDS = Histogram(
+    "matilda_ears_stage_seconds",
+    "Time spent per processing stage (opus_decode, resample, vad, wake_word, process_chunk, finalize, "
+    "batch_transcribe, formatter, envelope_send).",
+    labelnames=("stage",),
+)
+BYTES_TOTAL = Counter(
+    "matilda_ears_websocket_bytes_total",
+    "WebSocket payload bytes received (in) and sent (out); text frames are counted as UTF-8.",
+    labelnames=("direction",),
+)
+
+
+def payload_size(message: str | bytes) -> int:
+    """Size of a WebSocket frame's payload in bytes, as it travels on the wire."""
+    if isinstance(message, str):
+        return len(message.encode("utf-8"))
+    return len(message)
+
+
+def stage_timer(stage: str) -> AbstractContextManager[None]:
+    """Context manager timing one processing stage into STAGE_SECONDS."""
+    return STAGE_SECONDS.time(stage)
+
+
+def merge_expositions(expositions: dict[str, str], label: str) -> list[str]:
+    """Merge the exposition text of several processes, telling their samples apart by ``label``.
+
+    Args:
+        expositions: Exposition text keyed by the value ``label`` takes for its samples
+        label: Label name added to every sample, e.g. ``worker``
+
+    Returns:
+        Lines with each family's HELP and TYPE once, followed by the samples of all processes
+
+    """
+    headers: dict[str, list[str]] = {}
+    samples: dict[str, list[str]] = {}
+    for label_value, text in expositions.items():
+        pair = f'{label}="{_escape(label_value)}"'
+        family = None
+        for line in text.splitlines():
+            if line.startswith("# "):
+                parts = line.split(" ", 3)
+                if len(parts) >= 3 and parts[1] in ("HELP", "TYPE"):
+                    family = parts[2]
+                    family_headers = headers.setdefault(family, [])
+                    if not any(h.startswith(f"# {parts[1]} ") for h in family_headers):
+                        family_headers.append(line)
+                    samples.setdefault(family, [])
+                continue
+            if not line.strip():
+                continue
+            name_end = min(i for i in (line.find("{"), line.find(" "), len(line)) if i >= 0)
+            name, rest = line[:name_end], line[name_end:]
+            rest = rest.removeprefix("{}")
+            if rest.startswith("{"):
+                labelled = f"{name}{{{pair},{rest[1:]}"
+            else:
+                labelled = f"{name}{{{pair}}}{rest}"
+            samples.setdefault(family or name, []).append(labelled)
+
+    lines = []
+    for family, family_samples in samples.items():
+        lines.extend(headers.get(family, []))
+        lines.extend(family_samples)
+    return lines
+
+
+def render_metrics(*extra: list[str]) -> str:
+    """Exposition text for all process-wide metrics plus ``extra`` pre-rendered families."""
+    lines = STAGE_SECONDS.render() + BYTES_TOTAL.render()
+    for family in extra:
+        lines.extend(family)
+    return "\n".join(lines) + "\n"
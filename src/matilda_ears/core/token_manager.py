@@ -4,12 +4,14 @@ Handles token generation, validation, and one-time use enforcement
 
 import base64
 import concurrent.futures
+import hashlib
 import json
 import logging
 import os
 import sys
 import threading
 import time
+from collections import OrderedDict
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -17,6 +19,8 @@ import uuid
 
 import jwt
 
+from .token_store import USED_TOKEN_STORE_LOG, USED_TOKEN_STORE_SQLITE, UsedTokenStore, open_used_token_store
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,13 +39,30 @@ def get_default_data_dir() -> Path:
 class TokenManager:
     """Manages JWT tokens for client authentication"""
 
-    def __init__(self, secret_key: str | None = None, data_dir: Path | None = None):
+    def __init__(
+        self,
+        secret_key: str | None = None,
+        data_dir: Path | None = None,
+        cache_size: int = 1024,
+        cache_ttl: float = 300.0,
+        used_token_store: str | UsedTokenStore = USED_TOKEN_STORE_LOG,
+    ):
         self.data_dir = data_dir or get_default_data_dir()
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
+        # Decoded payloads of recently verified tokens, keyed by SHA-256 of the token.
+        # Entries live until the earlier of the token's exp and cache_ttl seconds (0 disables the cache).
+        self.cache_size = max(0, int(cache_size))
+        self.cache_ttl = max(0.0, float(cache_ttl))
+        self._decoded_cache: OrderedDict[bytes, tuple[dict[str, Any], float]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
         self.secret_key = secret_key or self._get_or_create_secret()
         self.tokens_file = self.data_dir / "tokens.json"
-        self.used_tokens_file = self.data_dir / "used_tokens.json"
+        # One-time token IDs already spent ("log" or "sqlite"; a legacy used_tokens.json is migrated)
+        if isinstance(used_token_store, str):
+            used_token_store = open_used_token_store(used_token_store, self.data_dir)
+        self.used_token_store = used_token_store
 
         # In-memory token storage
         self.active_tokens: dict[str, dict[str, Any]] = {}
@@ -59,9 +80,60 @@ class TokenManager:
         # Load existing tokens
         self._load_tokens()
         self._load_used_tokens()
+        self._compact_used_tokens()
 
         logger.info(f"TokenManager initialized with {len(self.active_tokens)} active tokens")
 
+    @property
+    def secret_key(self) -> str:
+        return self._secret_key
+
+    @secret_key.setter
+    def secret_key(self, value: str):
+        # Payloads verified with the old key must be checked again
+        self._secret_key = value
+        self.clear_cache()
+
+    def clear_cache(self):
+        """Forget all cached token payloads"""
+        with self._cache_lock:
+            self._decoded_cache.clear()
+
+    def _decode(self, token: str) -> dict[str, Any]:
+        """Verify and decode a JWT, reusing the payload of a recent verification"""
+        if not self.cache_size or not self.cache_ttl:
+            return jwt.decode(token, self.secret_key, algorithms=["HS256"])
+
+        key = hashlib.sha256(token.encode()).digest()
+        now = time.time()
+        with self._cache_lock:
+            entry = self._decoded_cache.get(key)
+            if entry is not None:
+                payload, valid_until = entry
+                if now < valid_until:
+                    self._decoded_cache.move_to_end(key)
+                    return dict(payload)
+                del self._decoded_cache[key]
+
+        # Expired or unknown tokens go through jwt.decode, which raises the usual errors
+        payload = jwt.decode(token, self.secret_key, algorithms=["HS256"])
+        valid_until = now + self.cache_ttl
+        exp = payload.get("exp")
+        if isinstance(exp, int | float):
+            valid_until = min(valid_until, float(exp))
+        with self._cache_lock:
+            self._decoded_cache[key] = (payload, valid_until)
+            self._decoded_cache.move_to_end(key)
+            while len(self._decoded_cache) > self.cache_size:
+                self._decoded_cache.popitem(last=False)
+        return dict(payload)
+
+    def _evict_token_id(self, token_id: str):
+        """Drop cached payloads of one token"""
+        with self._cache_lock:
+            for key in [k for k, (payload, _) in self._decoded_cache.items() if payload.get("token_id") == token_id]:
+                del self._decoded_cache[key]
+
     def _get_or_create_secret(self) -> str:
         """Get or create JWT secret key"""
         secret_file = self.data_dir / "jwt_secret.key"
@@ -92,10 +164,7 @@ class TokenManager:
     def _load_used_tokens(self):
         """Load used tokens from storage"""
         try:
-            if self.used_tokens_file.exists():
-                data = json.loads(self.used_tokens_file.read_text())
-                self.used_tokens = set(data.get("used_tokens", []))
-
+            self.used_tokens = self.used_token_store.load()
         except Exception as e:
             logger.error(f"Failed to load used tokens: {e}")
             self.used_tokens = set()
@@ -133,13 +202,56 @@ class TokenManager:
         if (time.time() - self._last_save_time) > 60:
             self._save_tokens_async()
 
-    def _save_used_tokens(self):
-        """Save used tokens to storage"""
+    def _record_used_token(self, token_id: str) -> bool:
+        """Persist one used token ID; False if another process sharing the store spent it first"""
+        try:
+            if self.used_token_store.shared:
+                return self.used_token_store.claim(token_id)
+            self.used_token_store.add(token_id)
+        except Exception as e:
+            logger.error(f"Failed to save used token {token_id}: {e}")
+        return True
+
+    def _spent_elsewhere(self, token_id: str) -> bool:
+        """Whether another process sharing the store has spent this token"""
+        if not self.used_token_store.shared:
+            return False
+        try:
+            return self.used_token_store.contains(token_id)
+        except Exception as e:
+            logger.error(f"Failed to look up used token {token_id}: {e}")
+            return False
+
+    def share_used_tokens(self):
+        """Keep spent one-time tokens in SQLite so processes sharing data_dir see each other's
+
+        Used IDs already recorded by the current store are copied over first.
+        """
+        if self.used_token_store.shared:
+            return
+        store = open_used_token_store(USED_TOKEN_STORE_SQLITE, self.data_dir)
+        known = store.load()
+        for token_id in self.used_tokens - known:
+            store.add(token_id)
+        self.used_token_store.close()
+        self.used_token_store = store
+        self.used_tokens |= known
+        logger.info(f"Used one-time tokens are now shared through {self.data_dir / 'used_tokens.sqlite3'}")
+
+    def _compact_used_tokens(self):
+        """Forget used IDs of tokens that no longer exist; they fail validation anyway"""
+        stale = self.used_tokens - self.active_tokens.keys()
+        if not stale:
+            return
+        self.used_tokens -= stale
         try:
-            data = {"used_tokens": list(self.used_tokens)}
-            self.used_tokens_file.write_text(json.dumps(data, indent=2))
+            keep = self.used_tokens
+            if self.used_token_store.shared:
+                # Other processes may have spent tokens this one has never seen; drop only the stale IDs
+                keep = self.used_token_store.load() - stale
+            self.used_token_store.compact(keep)
         except Exception as e:
-            logger.error(f"Failed to save used tokens: {e}")
+            logger.error(f"Failed to compact used tokens: {e}")
 
     def _cleanup_expired_tokens(self):
         """Remove expired tokens from active tokens"""
@@ -167,6 +279,7 @@ class TokenManager:
 
         if expired_tokens:
             self._save_tokens()
+            self._compact_used_tokens()
 
     def generate_token(self, client_name: str, expiration_days: int = 90, one_time_use: bool = False) -> dict[str, Any]:
         """Generate a new JWT token for a client
@@ -238,8 +351,8 @@ class TokenManager:
 
         """
         try:
-            # Decode JWT token
-            payload = jwt.decode(token, self.secret_key, algorithms=["HS256"])
+            # Decode JWT token (cached for repeat callers)
+            payload = self._decode(token)
             token_id = payload.get("token_id")
 
             if not token_id:
@@ -255,7 +368,13 @@ class TokenManager:
 
             # Check if token was already used (for one-time tokens)
             if token_info.get("one_time_use", False):
-                if token_id in self.used_tokens:
+                if mark_as_used:
+                    # Claiming in the store decides between processes racing for the same token
+                    spent = token_id in self.used_tokens or not self._record_used_token(token_id)
+                else:
+                    spent = token_id in self.used_tokens or self._spent_elsewhere(token_id)
+                if spent:
+                    self.used_tokens.add(token_id)
                     logger.warning(f"One-time token {token_id} already used")
                     return None
 
@@ -263,7 +382,6 @@ class TokenManager:
                     # Mark as used
                     self.used_tokens.add(token_id)
                     self.active_tokens[token_id]["used"] = True
-                    self._save_used_tokens()
                     self._save_tokens()
                     logger.info(f"Marked one-time token {token_id} as used")
 
@@ -298,7 +416,9 @@ class TokenManager:
             if token_id in self.active_tokens:
                 client_name = self.active_tokens[token_id].get("client_name", "unknown")
                 del self.active_tokens[token_id]
+                self._evict_token_id(token_id)
                 self._save_tokens()
+                self._compact_used_tokens()
 
                 logger.info(f"Revoked token for client '{client_name}' (ID: {token_id})")
                 return True
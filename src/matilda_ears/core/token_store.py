@@ -0,0 +1,218 @@
+"""Persistent stores for used one-time token IDs.
+
+Marking a token as used is a single O(1) write instead of rewriting every
+used ID, and each write reaches the disk (fsync, or SQLite's
+``synchronous=FULL``) before validation returns, so neither a crash nor a
+power loss can forget that a one-time token was spent. Stores load without parsing
+a JSON document and migrate a legacy ``used_tokens.json`` on first open.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+LEGACY_USED_TOKENS_FILE = "used_tokens.json"
+
+# Store kinds accepted by open_used_token_store
+USED_TOKEN_STORE_LOG = "log"
+USED_TOKEN_STORE_SQLITE = "sqlite"
+
+
+class UsedTokenStore(ABC):
+    """Interface for used-token persistence"""
+
+    # Whether processes sharing the data directory see each other's writes; only such stores
+    # are asked for ``claim`` and ``contains``
+    shared = False
+
+    @abstractmethod
+    def load(self) -> set[str]:
+        """Return all used token IDs"""
+
+    @abstractmethod
+    def add(self, token_id: str) -> None:
+        """Durably record one used token ID"""
+
+    @abstractmethod
+    def compact(self, keep: set[str]) -> None:
+        """Drop every stored ID not in ``keep`` (e.g. IDs of expired or revoked tokens)"""
+
+    def claim(self, token_id: str) -> bool:
+        """Durably record one used token ID; False if any process had already recorded it.
+
+        A store that is not shared only sees this process's writes, which the caller
+        already checked in memory, so the default records the ID and reports it as new.
+        """
+        self.add(token_id)
+        return True
+
+    def contains(self, token_id: str) -> bool:
+        """Whether any process has recorded this token ID as used.
+
+        The default, for stores that are not shared, reports False: the caller's
+        in-memory set already covers the only process whose writes it could see.
+        """
+        return False
+
+    # Optional hook rather than abstract: stores that keep no handle open have nothing to release
+    def close(self) -> None:  # noqa: B027
+        """Release file handles"""
+
+
+def _read_legacy_json(path: Path) -> set[str] | None:
+    if not path.exists():
+        return None
+    try:
+        return set(json.loads(path.read_text()).get("used_tokens", []))
+    except Exception as e:
+        logger.error(f"Failed to read legacy used tokens from {path}: {e}")
+        return None
+
+
+def _retire_legacy_json(path: Path) -> None:
+    try:
+        path.replace(path.with_name(path.name + ".migrated"))
+    except OSError as e:
+        logger.warning(f"Could not rename migrated {path}: {e}")
+
+
+class AppendOnlyTokenStore(UsedTokenStore):
+    """One token ID per line, appended and fsynced on each use"""
+
+    def __init__(self, path: Path, legacy_json: Path | None = None):
+        self.path = Path(path)
+        self.legacy_json = legacy_json
+        self._lock = threading.Lock()
+        self._lines = 0
+
+    def load(self) -> set[str]:
+        with self._lock:
+            used: set[str] = set()
+            if self.path.exists():
+                with self.path.open("r", encoding="utf-8") as f:
+                    for line in f:
+                        self._lines += 1
+                        token_id = line.strip()
+                        if token_id:
+                            used.add(token_id)
+
+            legacy_path = self.legacy_json
+            legacy = _read_legacy_json(legacy_path) if legacy_path is not None else None
+            if legacy_path is not None and legacy is not None:
+                used |= legacy
+                self._rewrite(used)
+                _retire_legacy_json(legacy_path)
+                logger.info(f"Migrated {len(legacy)} used tokens to {self.path}")
+            return used
+
+    def add(self, token_id: str) -> None:
+        with self._lock, self.path.open("a", encoding="utf-8") as f:
+            f.write(token_id + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+            self._lines += 1
+
+    def compact(self, keep: set[str]) -> None:
+        with self._lock:
+            if not self.path.exists():
+                return
+            with self.path.open("r", encoding="utf-8") as f:
+                stored = {line.strip() for line in f if line.strip()}
+            live = stored & keep
+            if len(live) < self._lines:
+                self._rewrite(live)
+
+    def _rewrite(self, token_ids: set[str]) -> None:
+        # Write a new file and swap it in so a crash leaves either the old or the new log
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            f.writelines(token_id + "\n" for token_id in sorted(token_ids))
+            f.flush()
+            os.fsync(f.fileno())
+        tmp.replace(self.path)
+        self._lines = len(token_ids)
+
+
+class SqliteTokenStore(UsedTokenStore):
+    """SQLite table in WAL mode; one INSERT per used token, safe to share between processes"""
+
+    shared = True
+
+    def __init__(self, path: Path, legacy_json: Path | None = None):
+        self.path = Path(path)
+        self.legacy_json = legacy_json
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._conn = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        # FULL syncs the WAL on every commit; NORMAL could lose the last uses to an OS crash or power loss
+        conn.execute("PRAGMA synchronous=FULL")
+        conn.execute("CREATE TABLE IF NOT EXISTS used_tokens (token_id TEXT PRIMARY KEY)")
+        return conn
+
+    def _connection(self) -> sqlite3.Connection:
+        # A connection must not be used on both sides of fork(); a forked worker opens its own
+        if self._pid != os.getpid():
+            self._conn = self._connect()
+            self._pid = os.getpid()
+        return self._conn
+
+    def load(self) -> set[str]:
+        with self._lock:
+            legacy_path = self.legacy_json
+            legacy = _read_legacy_json(legacy_path) if legacy_path is not None else None
+            conn = self._connection()
+            if legacy_path is not None and legacy is not None:
+                with conn:
+                    conn.execute("BEGIN")
+                    conn.executemany("INSERT OR IGNORE INTO used_tokens (token_id) VALUES (?)", ((t,) for t in legacy))
+                _retire_legacy_json(legacy_path)
+                logger.info(f"Migrated {len(legacy)} used tokens to {self.path}")
+            return {row[0] for row in conn.execute("SELECT token_id FROM used_tokens")}
+
+    def add(self, token_id: str) -> None:
+        self.claim(token_id)
+
+    def claim(self, token_id: str) -> bool:
+        with self._lock:
+            cursor = self._connection().execute("INSERT OR IGNORE INTO used_tokens (token_id) VALUES (?)", (token_id,))
+            return cursor.rowcount == 1
+
+    def contains(self, token_id: str) -> bool:
+        with self._lock:
+            row = self._connection().execute("SELECT 1 FROM used_tokens WHERE token_id = ?", (token_id,)).fetchone()
+            return row is not None
+
+    def compact(self, keep: set[str]) -> None:
+        with self._lock:
+            conn = self._connection()
+            stored = {row[0] for row in conn.execute("SELECT token_id FROM used_tokens")}
+            stale = stored - keep
+            if stale:
+                with conn:
+                    conn.execute("BEGIN")
+                    conn.executemany("DELETE FROM used_tokens WHERE token_id = ?", ((t,) for t in stale))
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def open_used_token_store(kind: str, data_dir: Path) -> UsedTokenStore:
+    """Create the store named by ``kind`` ("log" or "sqlite") in ``data_dir``"""
+    legacy_json = data_dir / LEGACY_USED_TOKENS_FILE
+    if kind == USED_TOKEN_STORE_SQLITE:
+        return SqliteTokenStore(data_dir / "used_tokens.sqlite3", legacy_json=legacy_json)
+    if kind != USED_TOKEN_STORE_LOG:
+        raise ValueError(f"Unknown used token store: {kind}")
+    return AppendOnlyTokenStore(data_dir / "used_tokens.log", legacy_json=legacy_json)
@@ -24,6 +24,7 @@ import numpy as np
 from matilda_ears.core.config import get_config, setup_logging
 from matilda_ears.core.mode_config import ModeConfig
 from matilda_ears.audio.capture import PipeBasedAudioStreamer
+from matilda_ears.audio.conversion import int16_to_float32
 from matilda_ears.transcription.backends import get_backend_class
 
 
@@ -121,17 +122,22 @@ class BaseMode(ABC):
             if self.backend is None or not self.backend.is_ready:
                 raise RuntimeError("Backend not loaded or not ready")
 
-            # Save audio to temporary WAV file
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_file:
-                tmp_file_path = tmp_file.name
-                with wave.open(tmp_file.name, "wb") as wav_file:
-                    wav_file.setnchannels(1)  # Mono
-                    wav_file.setsampwidth(2)  # 16-bit
-                    wav_file.setframerate(self.mode_config.sample_rate)
-                    wav_file.writeframes(audio_data.astype(np.int16).tobytes())
-
-            # Transcribe using backend
-            text, info = self.backend.transcribe(tmp_file_path, language=self.mode_config.language)
+            if self.mode_config.sample_rate == 16000:
+                # Backends take 16kHz float32 directly, no need to go through a WAV file
+                samples = int16_to_float32(audio_data.astype(np.int16))
+                text, info = self.backend.transcribe_array(samples, language=self.mode_config.language)
+            else:
+                # Save audio to temporary WAV file
+                with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_file:
+                    tmp_file_path = tmp_file.name
+                    with wave.open(tmp_file.name, "wb") as wav_file:
+                        wav_file.setnchannels(1)  # Mono
+                        wav_file.setsampwidth(2)  # 16-bit
+                        wav_file.setframerate(self.mode_config.sample_rate)
+                        wav_file.writeframes(audio_data.astype(np.int16).tobytes())
+
+                # Transcribe using backend
+                text, info = self.backend.transcribe(tmp_file_path, language=self.mode_config.language)
 
             self.logger.info(f"Transcribed: '{text}' ({len(text)} chars)")
 
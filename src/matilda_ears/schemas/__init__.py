@@ -1,3 +1,13 @@
+from .frames import (
+    CODEC_OPUS,
+    CODEC_PCM16,
+    FRAME_FLAG_ACK,
+    FRAME_VERSION,
+    AudioFrame,
+    FrameError,
+    decode_frame,
+    is_frame,
+)
 from .requests import (
     AudioChunkRequest,
     AuthRequest,
@@ -14,9 +24,11 @@ from .responses import (
     ChunkReceived,
     ErrorMessage,
     PartialResult,
+    PartialResultDelta,
     PongMessage,
     ReloadResponse,
     SimpleTranscriptionResponse,
+    StreamReady,
     StreamStarted,
     StreamTranscriptionComplete,
     TokenGenerated,
@@ -27,6 +39,14 @@ from .responses import (
 )
 
 __all__ = [
+    "CODEC_OPUS",
+    "CODEC_PCM16",
+    "FRAME_FLAG_ACK",
+    "FRAME_VERSION",
+    "AudioFrame",
+    "FrameError",
+    "decode_frame",
+    "is_frame",
     "AudioChunkRequest",
     "AuthRequest",
     "EndStreamRequest",
@@ -40,9 +60,11 @@ __all__ = [
     "ChunkReceived",
     "ErrorMessage",
     "PartialResult",
+    "PartialResultDelta",
     "PongMessage",
     "ReloadResponse",
     "SimpleTranscriptionResponse",
+    "StreamReady",
     "StreamStarted",
     "StreamTranscriptionComplete",
     "TokenGenerated",
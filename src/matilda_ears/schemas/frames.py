@@ -0,0 +1,97 @@
+"""Binary audio frames for streaming protocol v2.
+
+Clients that negotiate ``"protocol": 2`` in ``start_stream`` send audio as
+binary WebSocket messages instead of JSON with base64 payloads. Every frame is
+a fixed big-endian header followed by the raw Opus packet or PCM bytes::
+
+    offset  size  field
+    0       2     magic b"ME"
+    2       1     version (2)
+    3       1     flags (FRAME_FLAG_*)
+    4       1     codec (CODEC_OPUS or CODEC_PCM16)
+    5       1     channels
+    6       4     stream_id, assigned by the server in stream_started
+    10      4     seq, starting at 0 and incremented per frame
+    14      4     sample_rate in Hz
+    18      ...   payload
+"""
+
+from __future__ import annotations
+
+import struct
+from dataclasses import dataclass
+
+FRAME_MAGIC = b"ME"
+FRAME_VERSION = 2
+FRAME_HEADER = struct.Struct("!2sBBBBIII")
+
+CODEC_OPUS = 1
+CODEC_PCM16 = 2
+CODEC_NAMES = {CODEC_OPUS: "opus", CODEC_PCM16: "pcm"}
+
+# Ask the server to answer the frame with a chunk_received message.
+FRAME_FLAG_ACK = 0x01
+
+
+class FrameError(ValueError):
+    """Raised for binary frames that cannot be decoded."""
+
+
+@dataclass(frozen=True)
+class AudioFrame:
+    stream_id: int
+    seq: int
+    codec: int
+    sample_rate: int
+    channels: int
+    payload: bytes
+    flags: int = 0
+
+    @property
+    def ack_requested(self) -> bool:
+        return bool(self.flags & FRAME_FLAG_ACK)
+
+    def encode(self) -> bytes:
+        header = FRAME_HEADER.pack(
+            FRAME_MAGIC,
+            FRAME_VERSION,
+            self.flags,
+            self.codec,
+            self.channels,
+            self.stream_id,
+            self.seq & 0xFFFFFFFF,
+            self.sample_rate,
+        )
+        return header + self.payload
+
+
+def is_frame(data: bytes) -> bool:
+    """Whether ``data`` starts with the frame magic and is long enough to hold a header."""
+    return len(data) >= FRAME_HEADER.size and data[: len(FRAME_MAGIC)] == FRAME_MAGIC
+
+
+def decode_frame(data: bytes) -> AudioFrame:
+    """Parse a v2 binary frame.
+
+    Raises:
+        FrameError: If the header is truncated, has the wrong magic or version, or names an unknown codec
+
+    """
+    if len(data) < FRAME_HEADER.size:
+        raise FrameError(f"Frame too short: {len(data)} bytes")
+    magic, version, flags, codec, channels, stream_id, seq, sample_rate = FRAME_HEADER.unpack_from(data)
+    if magic != FRAME_MAGIC:
+        raise FrameError("Not a binary audio frame")
+    if version != FRAME_VERSION:
+        raise FrameError(f"Unsupported frame version: {version}")
+    if codec not in CODEC_NAMES:
+        raise FrameError(f"Unknown codec: {codec}")
+    return AudioFrame(
+        stream_id=stream_id,
+        seq=seq,
+        codec=codec,
+        sample_rate=sample_rate,
+        channels=channels,
+        payload=bytes(data[FRAME_HEADER.size :]),
+        flags=flags,
+    )
@@ -31,6 +31,7 @@ class TranscribeRequest(BaseMessage):
     audio_data: str
     audio_format: str | None = None
     metadata: dict[str, Any] | None = None
+    no_cache: bool | None = None
 
 
 class StartStreamRequest(BaseMessage):
@@ -40,6 +41,9 @@ class StartStreamRequest(BaseMessage):
     sample_rate: int | None = None
     channels: int | None = None
     binary: bool | None = None
+    protocol: int | None = None
+    partial_mode: str | None = None
+    partial_min_interval_ms: float | None = None
     wake_word_enabled: bool | None = None
     wake_word_debug: bool | None = None
 
@@ -67,3 +71,4 @@ class EndStreamRequest(BaseMessage):
 
 class ReloadRequest(BaseMessage):
     type: str = "reload"
+    swap_model: bool | None = None
@@ -66,6 +66,21 @@ class StreamStarted(BaseModel):
     backend: str
     strategy: str
     wake_word_enabled: bool
+    ready: bool = True
+    protocol: int = 1
+    stream_id: int | None = None
+    partial_mode: str = "full"
+
+
+class StreamReady(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    type: str = "stream_ready"
+    session_id: str
+    streaming_enabled: bool
+    backend: str
+    strategy: str | None = None
+    warmup_ms: float | None = None
 
 
 class PartialResult(BaseModel):
@@ -78,6 +93,18 @@ class PartialResult(BaseModel):
     is_final: bool
 
 
+class PartialResultDelta(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    type: str = "partial_result"
+    session_id: str
+    delta: bool = True
+    offset: int
+    confirmed_delta: str
+    tentative_text: str | None = None
+    is_final: bool
+
+
 class ChunkReceived(BaseModel):
     model_config = ConfigDict(extra="allow")
 
@@ -9,28 +9,93 @@ from typing import TYPE_CHECKING
 from aiohttp import web
 
 from ..core.config import setup_logging
+from ..core.metrics import format_counter, format_gauge, render_metrics
 
 if TYPE_CHECKING:
     from ..transcription.server.core import MatildaWebSocketServer
 
 logger = setup_logging(__name__, log_filename="transcription.txt")
 
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
 
 async def health_handler(server: MatildaWebSocketServer, request: web.Request) -> web.Response:
-    return web.json_response(
-        {
-            "status": "healthy",
-            "service": "ears",
-            "backend": server.backend_name,
-            "model_loaded": server.backend.is_ready if server.backend else False,
-            "connected_clients": len(server.connected_clients),
-            "active_streaming_sessions": len(server.streaming_sessions),
-            "active_pcm_sessions": len(server.pcm_sessions),
-            "active_opus_sessions": len(server.opus_decoder.get_active_sessions()),
-            "ending_sessions": len(server.ending_sessions),
-            "timestamp": time.time(),
-        }
-    )
+    payload: dict[str, object] = {
+        "status": "healthy",
+        "service": "ears",
+        "backend": server.backend_name,
+        "model_loaded": server.backend.is_ready if server.backend else False,
+        "connected_clients": len(server.connected_clients),
+        "active_streaming_sessions": len(server.streaming_sessions),
+        "active_pcm_sessions": len(server.pcm_sessions),
+        "active_opus_sessions": len(server.opus_decoder.get_active_sessions()),
+        "ending_sessions": len(server.ending_sessions),
+        "timestamp": time.time(),
+    }
+    executor = getattr(server, "inference_executor", None)
+    if executor is not None:
+        payload["inference"] = executor.get_stats()
+    rate_limiter = getattr(server, "rate_limiter", None)
+    if rate_limiter is not None:
+        payload["rate_limit"] = rate_limiter.get_stats()
+    ingress_stats = getattr(server, "ingress_stats", None)
+    if ingress_stats is not None:
+        payload["ingress"] = dict(ingress_stats)
+    swapper = getattr(server, "backend_swapper", None)
+    if swapper is not None:
+        payload["model_swap"] = swapper.get_stats()
+    result_cache = getattr(server, "result_cache", None)
+    if result_cache is not None:
+        payload["result_cache"] = result_cache.get_stats()
+    return web.json_response(payload)
+
+
+async def metrics_handler(server: MatildaWebSocketServer, request: web.Request) -> web.Response:
+    """Prometheus text exposition: stage latency histograms plus gauges read at scrape time."""
+    families = [
+        format_gauge(
+            "matilda_ears_connected_clients", "Open WebSocket connections.", {(): len(server.connected_clients)}
+        ),
+        format_gauge(
+            "matilda_ears_active_sessions",
+            "Open audio sessions by type.",
+            {
+                (("type", "streaming"),): len(server.streaming_sessions),
+                (("type", "pcm"),): len(server.pcm_sessions),
+                (("type", "opus"),): len(server.opus_decoder.get_active_sessions()),
+                (("type", "wake_word"),): len(getattr(server, "wake_word_sessions", {})),
+                (("type", "ending"),): len(server.ending_sessions),
+            },
+        ),
+    ]
+    executor = getattr(server, "inference_executor", None)
+    if executor is not None:
+        stats = executor.get_stats()
+        families += [
+            format_gauge("matilda_ears_inference_queue_depth", "Queued inference jobs.", {(): stats["queue_depth"]}),
+            format_gauge("matilda_ears_inference_running", "Running inference jobs.", {(): stats["running"]}),
+            format_gauge("matilda_ears_inference_workers", "Inference worker threads.", {(): stats["workers"]}),
+            format_counter("matilda_ears_inference_rejected_total", "Jobs refused as busy.", {(): stats["rejected"]}),
+        ]
+    ingress_stats = getattr(server, "ingress_stats", None)
+    if ingress_stats is not None:
+        families.append(
+            format_counter(
+                "matilda_ears_ingress_overflow_total",
+                "Audio messages dropped or coalesced, and connections closed, by ingress queue overflow.",
+                {(("outcome", outcome),): count for outcome, count in sorted(ingress_stats.items())},
+            )
+        )
+    rate_limiter = getattr(server, "rate_limiter", None)
+    if rate_limiter is not None:
+        families.append(
+            format_counter(
+                "matilda_ears_rate_limited_total",
+                "Requests rejected by rate limiting.",
+                {(): rate_limiter.get_stats()["limited"]},
+            )
+        )
+    return web.Response(body=render_metrics(*families).encode("utf-8"), headers={"Content-Type": METRICS_CONTENT_TYPE})
 
 
 async def start_health_server(server: MatildaWebSocketServer, host: str, port: int) -> web.AppRunner:
@@ -39,7 +104,11 @@ async def start_health_server(server: MatildaWebSocketServer, host: str, port: i
     async def _health(req: web.Request) -> web.Response:
         return await health_handler(server, req)
 
+    async def _metrics(req: web.Request) -> web.Response:
+        return await metrics_handler(server, req)
+
     app.router.add_get("/health", _health)
+    app.router.add_get("/metrics", _metrics)
     runner = web.AppRunner(app)
     await runner.setup()
     site = web.TCPSite(runner, host, port)
@@ -54,7 +123,11 @@ async def start_health_server_unix(server: MatildaWebSocketServer, socket_path:
     async def _health(req: web.Request) -> web.Response:
         return await health_handler(server, req)
 
+    async def _metrics(req: web.Request) -> web.Response:
+        return await metrics_handler(server, req)
+
     app.router.add_get("/health", _health)
+    app.router.add_get("/metrics", _metrics)
     runner = web.AppRunner(app)
     await runner.setup()
     socket_dir = os.path.dirname(socket_path)
@@ -0,0 +1,457 @@
+"""Pre-fork supervisor: several server processes behind one listening address.
+
+The supervisor forks the workers and each loads the model itself before it
+starts serving. CUDA contexts and CTranslate2's worker threads do not survive
+fork(), so nothing that touches the inference runtime may be created before
+it; SimulWhisper checkpoints are mmapped, so their pages are still shared
+through the page cache. Each worker runs its own event loop, and Python work
+such as Opus decode, resampling, JSON and VAD glue spreads across cores
+instead of sharing one GIL.
+
+On TCP every worker binds the port with SO_REUSEPORT and the kernel spreads
+connections over them. On a unix socket, or where SO_REUSEPORT is missing,
+the supervisor binds once and all workers accept on the shared socket.
+
+Signals to the supervisor:
+
+- SIGHUP: rolling restart. Workers are replaced one at a time; each
+  replacement must report healthy before the old worker is drained.
+- SIGTERM / SIGINT: drain all workers and exit.
+
+The supervisor's health endpoint aggregates the /health of every worker, and
+its /metrics merges the workers' expositions with a ``worker`` label.
+Spent one-time tokens are kept in the SQLite store under the shared data
+directory, so a token redeemed by one worker is rejected by all others.
+Rate-limit buckets and the JWT cache stay per worker.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+import signal
+import socket
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+import websockets
+from aiohttp import web
+
+from ..core.config import get_config, setup_logging
+from ..core.metrics import format_counter, format_gauge, merge_expositions
+from .health import METRICS_CONTENT_TYPE, start_health_server_unix
+from .transcription_server import start_server, websocket_serve_kwargs
+
+if TYPE_CHECKING:
+    from ..transcription.server.core import MatildaWebSocketServer
+
+config = get_config()
+logger = setup_logging(__name__, log_filename="transcription.txt")
+
+# A worker that dies sooner than this after starting counts as a crash loop
+_QUICK_EXIT_SECONDS = 5.0
+_MAX_RESPAWN_DELAY = 30.0
+
+
+@dataclass
+class WorkerProcess:
+    index: int
+    pid: int
+    started: float
+    health_socket: str
+    retiring: bool = False
+
+
+class WorkerSupervisor:
+    """Forks, watches and restarts server worker processes."""
+
+    def __init__(
+        self,
+        server: MatildaWebSocketServer,
+        workers: int,
+        host: str | None,
+        port: int | None,
+        *,
+        unix_path: str | None = None,
+        health_port: int | None = None,
+        health_socket: str | None = None,
+        worker_health_dir: str = "/tmp/matilda",
+        grace_seconds: float = 30.0,
+        ready_timeout: float = 120.0,
+    ):
+        """Prepare the supervisor; nothing is forked until ``run``.
+
+        Args:
+            server: Server to run in every worker; each worker loads its model after the fork
+            workers: Number of worker processes
+            host: TCP bind host (ignored with unix_path)
+            port: TCP port (ignored with unix_path)
+            unix_path: Serve on this unix socket instead of TCP
+            health_port: TCP port for the aggregated health endpoint
+            health_socket: Unix socket for the aggregated health endpoint
+            worker_health_dir: Directory for the per-worker health sockets
+            grace_seconds: How long a draining worker may keep serving open connections
+            ready_timeout: How long a replacement worker may take to report healthy
+
+        """
+        self.server = server
+        self.workers = max(1, int(workers))
+        self.host = host
+        self.port = port
+        self.unix_path = unix_path
+        self.health_port = health_port
+        self.health_socket = health_socket
+        self.worker_health_dir = worker_health_dir
+        self.grace_seconds = grace_seconds
+        self.ready_timeout = ready_timeout
+        self.procs: dict[int, WorkerProcess] = {}
+        self.restarts = 0
+        self._crashes: dict[int, int] = {}
+        self._listen_sock: socket.socket | None = None
+        self._health_runner: web.AppRunner | None = None
+        self._stop: asyncio.Event | None = None
+        self._restart_task: asyncio.Task | None = None
+
+    async def run(self) -> None:
+        """Fork the workers and supervise them until SIGTERM or SIGINT."""
+        loop = asyncio.get_running_loop()
+        self._stop = stop = asyncio.Event()
+        os.makedirs(self.worker_health_dir, exist_ok=True)
+        self._listen_sock = self._bind_shared_socket()
+
+        for index in range(self.workers):
+            self._spawn(index)
+
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, stop.set)
+        loop.add_signal_handler(signal.SIGHUP, self.request_rolling_restart)
+
+        try:
+            self._health_runner = await self._start_health()
+        except Exception as e:
+            logger.warning(f"Supervisor health server disabled: {e}")
+
+        logger.info(f"Supervisor (pid {os.getpid()}) running {self.workers} worker(s)")
+        try:
+            while not stop.is_set():
+                self._reap()
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(stop.wait(), 0.5)
+        finally:
+            await self._shutdown()
+
+    def request_rolling_restart(self) -> None:
+        if self._restart_task is not None and not self._restart_task.done():
+            logger.info("Rolling restart already in progress")
+            return
+        self._restart_task = asyncio.get_running_loop().create_task(self.rolling_restart())
+
+    async def rolling_restart(self) -> bool:
+        """Replace every worker, one at a time.
+
+        Returns:
+            False if a replacement failed to become healthy (its predecessor keeps serving)
+
+        """
+        logger.info("Rolling restart of all workers")
+        for index in range(self.workers):
+            old = self._current(index)
+            new = self._spawn(index)
+            if not await self._wait_ready(new):
+                logger.error(f"Worker {index} replacement (pid {new.pid}) did not become healthy; aborting restart")
+                new.retiring = True
+                self._signal(new.pid, signal.SIGKILL)
+                return False
+            if old is not None:
+                old.retiring = True
+                self._signal(old.pid, signal.SIGTERM)
+        self.restarts += self.workers
+        return True
+
+    def _bind_shared_socket(self) -> socket.socket | None:
+        if self.unix_path:
+            from matilda_transport import prepare_unix_socket
+
+            prepare_unix_socket(self.unix_path)
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.bind(self.unix_path)
+        elif hasattr(socket, "SO_REUSEPORT"):
+            return None  # every worker binds its own socket
+        else:
+            sock = socket.create_server((self.host or "0.0.0.0", self.port or 0))
+        sock.listen(128)
+        sock.settimeout(0.0)  # non-blocking, as asyncio expects
+        return sock
+
+    def _spawn(self, index: int) -> WorkerProcess:
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 1
+            try:
+                self._reset_child_signals()
+                health_socket = self._worker_health_socket(os.getpid())
+                exit_code = asyncio.run(self._serve_worker(index, health_socket))
+            except BaseException as e:
+                logger.exception(f"Worker {index} failed: {e}")
+            finally:
+                os._exit(exit_code)
+
+        proc = WorkerProcess(
+            index=index, pid=pid, started=time.monotonic(), health_socket=self._worker_health_socket(pid)
+        )
+        self.procs[pid] = proc
+        logger.info(f"Started worker {index} (pid {pid})")
+        return proc
+
+    def _worker_health_socket(self, pid: int) -> str:
+        return os.path.join(self.worker_health_dir, f"ears-worker-{pid}.sock")
+
+    @staticmethod
+    def _reset_child_signals() -> None:
+        # The supervisor's asyncio handlers write to its loop's wakeup pipe, which the child must not use
+        signal.set_wakeup_fd(-1)
+        for sig in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP):
+            signal.signal(sig, signal.SIG_DFL)
+
+    async def _serve_worker(self, index: int, health_socket: str) -> int:
+        loop = asyncio.get_running_loop()
+        stop = asyncio.Event()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, stop.set)
+        # Ignore the terminal's SIGHUP; rolling restarts are the supervisor's job
+        loop.add_signal_handler(signal.SIGHUP, lambda: None)
+
+        server = self.server
+        # Load here rather than in the supervisor: GPU contexts and inference threads do not survive fork()
+        await server.load_model()
+        server._health_runner = await start_health_server_unix(server, health_socket)
+        serve_kwargs = websocket_serve_kwargs(server)
+        host, port = self.host, self.port
+        if self._listen_sock is not None:
+            serve_kwargs["sock"] = self._listen_sock
+            host = port = None
+        else:
+            serve_kwargs["reuse_port"] = True
+
+        async with websockets.serve(server.handle_client, host, port, **serve_kwargs) as ws_server:
+            logger.info(f"Worker {index} (pid {os.getpid()}) ready")
+            await stop.wait()
+
+            # Stop accepting; open connections may finish within the grace period
+            ws_server.server.close()
+            deadline = loop.time() + self.grace_seconds
+            while server.connected_clients and loop.time() < deadline:
+                await asyncio.sleep(0.2)
+            if server.connected_clients:
+                logger.info(f"Worker {index}: closing {len(server.connected_clients)} connection(s) after grace period")
+
+        await server._health_runner.cleanup()
+        with contextlib.suppress(OSError):
+            os.unlink(health_socket)
+        logger.info(f"Worker {index} (pid {os.getpid()}) stopped")
+        return 0
+
+    def _current(self, index: int) -> WorkerProcess | None:
+        for proc in self.procs.values():
+            if proc.index == index and not proc.retiring:
+                return proc
+        return None
+
+    def _reap(self) -> None:
+        while self.procs:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            proc = self.procs.pop(pid, None)
+            if proc is None:
+                continue
+            with contextlib.suppress(OSError):
+                os.unlink(proc.health_socket)
+            if proc.retiring or self._stopping():
+                logger.info(f"Worker {proc.index} (pid {pid}) exited")
+                continue
+
+            logger.warning(f"Worker {proc.index} (pid {pid}) died with status {status}; respawning")
+            self.restarts += 1
+            if time.monotonic() - proc.started < _QUICK_EXIT_SECONDS:
+                self._crashes[proc.index] = self._crashes.get(proc.index, 0) + 1
+            else:
+                self._crashes[proc.index] = 0
+            delay = min(_MAX_RESPAWN_DELAY, 2.0 ** self._crashes[proc.index] - 1)
+            asyncio.get_running_loop().call_later(delay, self._respawn, proc.index)
+
+    def _stopping(self) -> bool:
+        return self._stop is not None and self._stop.is_set()
+
+    def _respawn(self, index: int) -> None:
+        if self._stopping() or self._current(index) is not None:
+            return
+        self._spawn(index)
+
+    async def _wait_ready(self, proc: WorkerProcess) -> bool:
+        deadline = time.monotonic() + self.ready_timeout
+        while time.monotonic() < deadline:
+            self._reap()
+            if proc.pid not in self.procs:
+                return False
+            if (await self._worker_health(proc))["healthy"]:
+                return True
+            await asyncio.sleep(0.2)
+        return False
+
+    async def _worker_health(self, proc: WorkerProcess) -> dict[str, Any]:
+        info: dict[str, Any] = {
+            "index": proc.index,
+            "pid": proc.pid,
+            "uptime_seconds": round(time.monotonic() - proc.started, 1),
+            "retiring": proc.retiring,
+            "healthy": False,
+            "health": None,
+        }
+        try:
+            async with self._worker_session(proc) as session, session.get("http://worker/health") as response:
+                if response.status == 200:
+                    info["health"] = await response.json()
+                    info["healthy"] = True
+        except (aiohttp.ClientError, TimeoutError, OSError):
+            pass
+        return info
+
+    async def _worker_metrics(self, proc: WorkerProcess) -> str | None:
+        try:
+            async with self._worker_session(proc) as session, session.get("http://worker/metrics") as response:
+                if response.status == 200:
+                    return await response.text()
+        except (aiohttp.ClientError, TimeoutError, OSError):
+            pass
+        return None
+
+    @staticmethod
+    def _worker_session(proc: WorkerProcess) -> aiohttp.ClientSession:
+        connector = aiohttp.UnixConnector(path=proc.health_socket)
+        return aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=2))
+
+    async def health_payload(self) -> dict[str, Any]:
+        workers = await asyncio.gather(*(self._worker_health(proc) for proc in list(self.procs.values())))
+        serving = [w for w in workers if not w["retiring"]]
+        healthy = len([w for w in serving if w["healthy"]]) == self.workers
+        return {
+            "status": "healthy" if healthy else "degraded",
+            "service": "ears",
+            "mode": "supervisor",
+            "backend": self.server.backend_name,
+            "workers": sorted(workers, key=lambda w: (w["index"], w["retiring"])),
+            "connected_clients": sum((w["health"] or {}).get("connected_clients", 0) for w in workers),
+            "restarts": self.restarts,
+            "timestamp": time.time(),
+        }
+
+    async def metrics_text(self) -> str:
+        """Exposition of every serving worker, labelled by worker index, plus supervisor counters."""
+        # A retiring worker shares its index with its replacement; leave it out to keep series unique
+        serving = sorted((p for p in self.procs.values() if not p.retiring), key=lambda p: p.index)
+        texts = await asyncio.gather(*(self._worker_metrics(proc) for proc in serving))
+        expositions = {str(proc.index): text for proc, text in zip(serving, texts, strict=True) if text is not None}
+        lines = [
+            *format_gauge("matilda_ears_workers", "Worker processes answering /metrics.", {(): len(expositions)}),
+            *format_counter("matilda_ears_worker_restarts_total", "Worker processes replaced.", {(): self.restarts}),
+            *merge_expositions(expositions, "worker"),
+        ]
+        return "\n".join(lines) + "\n"
+
+    async def _start_health(self) -> web.AppRunner | None:
+        if self.health_port is None and self.health_socket is None:
+            return None
+        app = web.Application()
+
+        async def _health(_: web.Request) -> web.Response:
+            payload = await self.health_payload()
+            return web.json_response(payload, status=200 if payload["status"] == "healthy" else 503)
+
+        async def _metrics(_: web.Request) -> web.Response:
+            body = (await self.metrics_text()).encode("utf-8")
+            return web.Response(body=body, headers={"Content-Type": METRICS_CONTENT_TYPE})
+
+        app.router.add_get("/health", _health)
+        app.router.add_get("/metrics", _metrics)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        if self.health_socket is not None:
+            site: web.BaseSite = web.UnixSite(runner, self.health_socket)
+        else:
+            site = web.TCPSite(runner, self.host, self.health_port)
+        await site.start()
+        return runner
+
+    async def _shutdown(self) -> None:
+        logger.info(f"Stopping {len(self.procs)} worker(s)")
+        if self._restart_task is not None:
+            self._restart_task.cancel()
+        for proc in list(self.procs.values()):
+            self._signal(proc.pid, signal.SIGTERM)
+        deadline = time.monotonic() + self.grace_seconds + 5.0
+        while self.procs and time.monotonic() < deadline:
+            self._reap()
+            await asyncio.sleep(0.1)
+        for proc in list(self.procs.values()):
+            logger.warning(f"Worker {proc.index} (pid {proc.pid}) did not stop; killing")
+            self._signal(proc.pid, signal.SIGKILL)
+        while self.procs:
+            self._reap()
+            await asyncio.sleep(0.05)
+        if self._health_runner is not None:
+            await self._health_runner.cleanup()
+        if self._listen_sock is not None:
+            self._listen_sock.close()
+
+    @staticmethod
+    def _signal(pid: int, sig: int) -> None:
+        with contextlib.suppress(ProcessLookupError):
+            os.kill(pid, sig)
+
+
+def run_supervisor(
+    server: MatildaWebSocketServer, workers: int, host: str | None = None, port: int | None = None
+) -> None:
+    """Serve with ``workers`` forked processes, or in this process where forking is not possible."""
+    server_host = host if host is not None else (server.host or "0.0.0.0")
+    server_port = port if port is not None else (server.port or 8769)
+
+    from matilda_transport import resolve_transport
+
+    transport = resolve_transport("MATILDA_EARS_TRANSPORT", "MATILDA_EARS_ENDPOINT", server_host, server_port)
+    reason = None
+    if not hasattr(os, "fork"):
+        reason = "os.fork is not available on this platform"
+    elif transport.transport == "pipe":
+        reason = "named pipe transport cannot be shared between processes"
+    elif server.backend_name == "parakeet":
+        reason = "MLX/Metal is not fork-safe"
+    if reason:
+        logger.warning(f"Running a single process instead of {workers} workers: {reason}")
+        asyncio.run(start_server(server, host=host, port=port))
+        return
+
+    # Workers validate one-time tokens against one store instead of a set each loaded at startup
+    server.token_manager.share_used_tokens()
+
+    unix_path = transport.endpoint if transport.transport == "unix" else None
+    health_dir = os.getenv("MATILDA_EARS_WORKER_HEALTH_DIR", "/tmp/matilda")
+    supervisor = WorkerSupervisor(
+        server,
+        workers,
+        server_host,
+        server_port,
+        unix_path=unix_path,
+        health_port=None if unix_path else server_port + 1,
+        health_socket=os.getenv("MATILDA_EARS_HEALTH_ENDPOINT", "/tmp/matilda/ears-health.sock") if unix_path else None,
+        worker_health_dir=health_dir,
+        grace_seconds=float(config.get("server.worker_grace_seconds", 30)),
+    )
+    asyncio.run(supervisor.run())
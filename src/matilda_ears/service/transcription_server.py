@@ -21,6 +21,26 @@ config = get_config()
 logger = setup_logging(__name__, log_filename="transcription.txt")
 
 
+def websocket_serve_kwargs(server: MatildaWebSocketServer) -> dict[str, Any]:
+    """Keyword arguments for ``websockets.serve`` shared by all server modes."""
+    max_message_mb = config.get("server.websocket.max_message_mb", 10)
+    try:
+        max_message_mb = float(max_message_mb)
+    except (TypeError, ValueError):
+        max_message_mb = 10
+
+    max_size = None if max_message_mb <= 0 else int(max_message_mb * 1024 * 1024)
+    server_kwargs: dict[str, Any] = {
+        "ping_interval": 60,
+        "ping_timeout": 120,
+        "max_size": max_size,
+    }
+
+    if server.ssl_enabled and server.ssl_context:
+        server_kwargs["ssl"] = server.ssl_context
+    return server_kwargs
+
+
 async def start_server(server: MatildaWebSocketServer, host: str | None = None, port: int | None = None) -> None:
     """Start the WebSocket server and its health endpoint."""
     # Be defensive: older config objects sometimes treat host/port as optional.
@@ -68,22 +88,7 @@ async def start_server(server: MatildaWebSocketServer, host: str | None = None,
                 logger.warning("Health server disabled: %s", e2)
 
     protocol = "wss" if server.ssl_enabled else "ws"
-
-    max_message_mb = config.get("server.websocket.max_message_mb", 10)
-    try:
-        max_message_mb = float(max_message_mb)
-    except (TypeError, ValueError):
-        max_message_mb = 10
-
-    max_size = None if max_message_mb <= 0 else int(max_message_mb * 1024 * 1024)
-    server_kwargs: dict[str, Any] = {
-        "ping_interval": 60,
-        "ping_timeout": 120,
-        "max_size": max_size,
-    }
-
-    if server.ssl_enabled and server.ssl_context:
-        server_kwargs["ssl"] = server.ssl_context
+    server_kwargs = websocket_serve_kwargs(server)
 
     if transport.transport == "unix" and transport.endpoint:
         prepare_unix_socket(transport.endpoint)
@@ -140,6 +145,9 @@ def main() -> None:
     parser.add_argument("--host", type=str, default=None, help="Host to bind to (default: 0.0.0.0)")
     parser.add_argument("--model", type=str, default=None, help="Whisper model to use")
     parser.add_argument("--device", type=str, default=None, help="Device for inference (cuda, cpu, mlx)")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Worker processes behind one listening address (default: from config)"
+    )
     args = parser.parse_args()
 
     from ..transcription.server.core import MatildaWebSocketServer
@@ -151,8 +159,15 @@ def main() -> None:
     if args.host is not None:
         server.host = args.host
 
+    workers = args.workers if args.workers is not None else int(config.get("server.workers", 1))
+
     try:
-        asyncio.run(start_server(server, host=args.host, port=args.port))
+        if workers > 1:
+            from .supervisor import run_supervisor
+
+            run_supervisor(server, workers, host=args.host, port=args.port)
+        else:
+            asyncio.run(start_server(server, host=args.host, port=args.port))
     except KeyboardInterrupt:
         logger.info("Server shutdown requested")
     except Exception as e:
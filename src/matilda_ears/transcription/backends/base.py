@@ -1,5 +1,13 @@
+import os
+import tempfile
+import wave
 from abc import ABC, abstractmethod
 
+import numpy as np
+
+# Sample rate of the arrays passed to TranscriptionBackend.transcribe_array().
+SAMPLE_RATE = 16000
+
 
 class BackendNotAvailableError(RuntimeError):
     """Raised when a backend is requested but its optional dependencies are not installed."""
@@ -32,6 +40,41 @@ class TranscriptionBackend(ABC):
 
         """
 
+    def transcribe_array(self, audio: np.ndarray, language: str = "en") -> tuple[str, dict]:
+        """Transcribe in-memory audio.
+
+        Backends whose model accepts arrays override this to skip the disk
+        round-trip. The default writes a temporary WAV and calls transcribe().
+
+        Args:
+            audio: Mono float32 samples in [-1.0, 1.0] at 16 kHz.
+            language: Language code (e.g., "en").
+
+        Returns:
+            The same (text, metadata) tuple as transcribe().
+
+        """
+        pcm = np.clip(np.asarray(audio, dtype=np.float32) * 32768.0, -32768, 32767).astype(np.int16)
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
+            temp_path = temp_file.name
+            with wave.open(temp_file, "wb") as wav_file:
+                wav_file.setnchannels(1)
+                wav_file.setsampwidth(2)
+                wav_file.setframerate(SAMPLE_RATE)
+                wav_file.writeframes(pcm.tobytes())
+        try:
+            return self.transcribe(temp_path, language=language)
+        finally:
+            os.unlink(temp_path)
+
+    # Optional hook rather than abstract: backends without explicit teardown rely on garbage collection
+    def unload(self) -> None:  # noqa: B027
+        """Release the loaded model, e.g. after a hot swap has replaced this backend.
+
+        The default drops nothing and leaves the model to garbage collection
+        once the backend itself is no longer referenced.
+        """
+
     @property
     @abstractmethod
     def is_ready(self) -> bool:
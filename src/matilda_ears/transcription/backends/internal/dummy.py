@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from ..base import TranscriptionBackend
+import numpy as np
+
+from ..base import SAMPLE_RATE, TranscriptionBackend
 
 
 class DummyBackend(TranscriptionBackend):
@@ -20,6 +22,12 @@ class DummyBackend(TranscriptionBackend):
         # Keep output deterministic and cheap; ignore audio_path contents.
         return self._text, {"duration": 0.0, "language": language}
 
+    def transcribe_array(self, audio: np.ndarray, language: str = "en") -> tuple[str, dict]:
+        return self._text, {"duration": len(audio) / SAMPLE_RATE, "language": language}
+
+    def unload(self) -> None:
+        self._ready = False
+
     @property
     def is_ready(self) -> bool:
         return self._ready
@@ -1,6 +1,8 @@
 import asyncio
 import logging
 
+import numpy as np
+
 from ..base import TranscriptionBackend
 from ....core.config import get_config
 
@@ -56,11 +58,18 @@ class FasterWhisperBackend(TranscriptionBackend):
             raise
 
     def transcribe(self, audio_path: str, language: str = "en") -> tuple[str, dict]:
+        return self._transcribe(audio_path, language)
+
+    def transcribe_array(self, audio: np.ndarray, language: str = "en") -> tuple[str, dict]:
+        # faster-whisper takes 16 kHz float32 arrays as-is
+        return self._transcribe(np.asarray(audio, dtype=np.float32), language)
+
+    def _transcribe(self, audio: str | np.ndarray, language: str) -> tuple[str, dict]:
         if self.model is None:
             raise RuntimeError("Model not loaded")
 
         segments, info = self.model.transcribe(
-            audio_path,
+            audio,
             beam_size=5,
             language=language,
             word_timestamps=self.word_timestamps,
@@ -99,6 +108,9 @@ class FasterWhisperBackend(TranscriptionBackend):
             "words": words,
         }
 
+    def unload(self) -> None:
+        self.model = None
+
     @property
     def is_ready(self) -> bool:
         return self.model is not None
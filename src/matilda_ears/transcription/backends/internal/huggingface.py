@@ -27,7 +27,9 @@ import logging
 import time
 from typing import Any
 
-from ..base import TranscriptionBackend
+import numpy as np
+
+from ..base import SAMPLE_RATE, TranscriptionBackend
 from ....core.config import get_config
 
 logger = logging.getLogger(__name__)
@@ -206,6 +208,13 @@ class HuggingFaceBackend(TranscriptionBackend):
             Tuple of (transcribed_text, metadata_dict).
 
         """
+        return self._transcribe(audio_path, language)
+
+    def transcribe_array(self, audio: np.ndarray, language: str = "en") -> tuple[str, dict]:
+        """Transcribe 16 kHz float32 samples without writing them to disk."""
+        return self._transcribe({"raw": np.asarray(audio, dtype=np.float32), "sampling_rate": SAMPLE_RATE}, language)
+
+    def _transcribe(self, inputs: str | dict, language: str) -> tuple[str, dict]:
         if self.pipe is None:
             raise RuntimeError("Model not loaded. Call load() first.")
 
@@ -229,7 +238,7 @@ class HuggingFaceBackend(TranscriptionBackend):
 
             # Run transcription with chunking for long audio
             result = self.pipe(
-                audio_path,
+                inputs,
                 chunk_length_s=self.chunk_length_s,
                 batch_size=self.batch_size,
                 generate_kwargs=generate_kwargs or None,
@@ -263,6 +272,10 @@ class HuggingFaceBackend(TranscriptionBackend):
             logger.error(f"HuggingFace transcription failed: {e}")
             raise
 
+    def unload(self) -> None:
+        """Drop the pipeline so its model can be freed."""
+        self.pipe = None
+
     @property
     def is_ready(self) -> bool:
         """Check if the model is loaded and ready."""
@@ -9,7 +9,9 @@ import logging
 import os
 import time
 
-from ..base import TranscriptionBackend
+import numpy as np
+
+from ..base import SAMPLE_RATE, TranscriptionBackend
 from ....core.config import get_config
 
 logger = logging.getLogger(__name__)
@@ -75,30 +77,64 @@ class ParakeetBackend(TranscriptionBackend):
             result = self.model.transcribe(
                 audio_path, chunk_duration=self.chunk_duration, overlap_duration=self.overlap_duration
             )
-            text = result.text.strip()
+            return self._result(result, start_time)
 
-            # Calculate duration (approximate if not available)
-            duration = time.time() - start_time
+        except Exception as e:
+            logger.error(f"Parakeet transcription failed: {e}")
+            raise
 
-            # Attempt to get accurate duration from result if available
-            audio_duration = 0.0
-            if hasattr(result, "sentences") and result.sentences:
-                audio_duration = result.sentences[-1].end
+    def transcribe_array(self, audio: np.ndarray, language: str = "en") -> tuple[str, dict]:
+        """Transcribe 16 kHz float32 samples without writing them to disk.
 
-            # Use processing time if we couldn't get duration from audio
-            if audio_duration == 0.0:
-                audio_duration = duration
+        Audio longer than one chunk still goes through transcribe(), which owns
+        the chunking that keeps Metal command buffers bounded.
+        """
+        if self.model is None:
+            raise RuntimeError("Parakeet Model not loaded")
 
-            return text, {
-                "duration": audio_duration,
-                "language": "en",  # Parakeet is primarily English AFAIK
-                "backend": "parakeet",
-            }
+        preprocessor = getattr(self.model, "preprocessor_config", None)
+        if (
+            preprocessor is None
+            or getattr(preprocessor, "sample_rate", SAMPLE_RATE) != SAMPLE_RATE
+            or len(audio) > self.chunk_duration * SAMPLE_RATE
+        ):
+            return super().transcribe_array(audio, language)
+
+        start_time = time.time()
+
+        try:
+            import mlx.core as mx
+            from parakeet_mlx.audio import get_logmel
+
+            mel = get_logmel(mx.array(np.asarray(audio, dtype=np.float32)), preprocessor)
+            result = self.model.generate(mel)[0]
+            return self._result(result, start_time)
 
         except Exception as e:
             logger.error(f"Parakeet transcription failed: {e}")
             raise
 
+    def _result(self, result, start_time: float) -> tuple[str, dict]:
+        text = result.text.strip()
+
+        # Calculate duration (approximate if not available)
+        duration = time.time() - start_time
+
+        # Attempt to get accurate duration from result if available
+        audio_duration = 0.0
+        if hasattr(result, "sentences") and result.sentences:
+            audio_duration = result.sentences[-1].end
+
+        # Use processing time if we couldn't get duration from audio
+        if audio_duration == 0.0:
+            audio_duration = duration
+
+        return text, {
+            "duration": audio_duration,
+            "language": "en",  # Parakeet is primarily English AFAIK
+            "backend": "parakeet",
+        }
+
     @property
     def is_ready(self) -> bool:
         return self.model is not None
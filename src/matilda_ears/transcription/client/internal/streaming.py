@@ -20,6 +20,7 @@ import websockets
 from .exceptions import TranscriptionConnectionError, StreamingError
 from ....audio.encoder import OpusEncoder
 from ....core.config import setup_logging
+from ....schemas.frames import CODEC_OPUS, FRAME_VERSION, AudioFrame
 
 logger = setup_logging(__name__, log_filename="transcription.txt")
 
@@ -99,6 +100,9 @@ class StreamingAudioClient:
         debug_save_audio: bool = False,
         max_debug_chunks: int = 1000,
         on_partial_result: PartialResultCallback | None = None,
+        *,
+        binary_frames: bool = True,
+        delta_partials: bool = True,
     ):
         """Initialize streaming client.
 
@@ -108,6 +112,8 @@ class StreamingAudioClient:
             debug_save_audio: If True, save audio chunks for debugging
             max_debug_chunks: Maximum number of debug chunks to keep (default: 1000)
             on_partial_result: Optional callback for real-time partial results
+            binary_frames: Offer protocol v2 binary frames; servers without it get JSON chunks
+            delta_partials: Ask for delta-encoded partial results (reassembled before the callback)
 
         """
         self.websocket_url = websocket_url
@@ -116,6 +122,11 @@ class StreamingAudioClient:
         self.session_id = None
         self.encoder = OpusEncoder()
 
+        # Protocol v2: set from stream_started when the server accepts binary frames
+        self.binary_frames = binary_frames
+        self.stream_id: int | None = None
+        self._frame_seq = 0
+
         # Partial result callback for real-time updates
         self.on_partial_result = on_partial_result
         self._listener_task: asyncio.Task | None = None
@@ -125,6 +136,16 @@ class StreamingAudioClient:
         # Track latest partial result for callers that don't use callback
         self._latest_partial: PartialResult | None = None
 
+        # Text reassembled from delta-encoded partial results
+        self.delta_partials = delta_partials
+        self._partial_confirmed = ""
+        self._partial_tentative = ""
+
+        # Whether the server transcribes this stream live; it may only confirm
+        # that with a stream_ready message once its model has warmed up.
+        self.streaming_enabled = False
+        self.stream_ready = asyncio.Event()
+
         # Debug features with bounded collections
         self.debug_save_audio = debug_save_audio
         self.max_debug_chunks = max_debug_chunks
@@ -185,7 +206,7 @@ class StreamingAudioClient:
                     msg_type = data.get("type", "")
 
                     if msg_type == "partial_result":
-                        partial = PartialResult.from_message(data)
+                        partial = PartialResult.from_message(self._reassemble_partial(data))
                         self._latest_partial = partial
 
                         # Invoke callback if provided
@@ -199,6 +220,10 @@ class StreamingAudioClient:
                             f"Partial result: confirmed='{partial.confirmed_text[:50]}...' "
                             f"tentative='{partial.tentative_text[:30]}...'"
                         )
+                    elif msg_type == "stream_ready":
+                        self.streaming_enabled = bool(data.get("streaming_enabled", False))
+                        self.stream_ready.set()
+                        logger.debug(f"Stream ready: streaming_enabled={self.streaming_enabled}")
                     else:
                         # Queue non-partial messages for end_stream to process
                         await self._pending_messages.put(data)
@@ -219,6 +244,18 @@ class StreamingAudioClient:
         finally:
             logger.debug("Partial result listener stopped")
 
+    def _reassemble_partial(self, data: dict) -> dict:
+        """Expand a delta-encoded partial_result into full confirmed/tentative text."""
+        if data.get("delta"):
+            offset = int(data.get("offset", 0))
+            self._partial_confirmed = self._partial_confirmed[:offset] + data.get("confirmed_delta", "")
+            if "tentative_text" in data:
+                self._partial_tentative = data["tentative_text"] or ""
+            return {**data, "confirmed_text": self._partial_confirmed, "tentative_text": self._partial_tentative}
+        self._partial_confirmed = data.get("confirmed_text", "")
+        self._partial_tentative = data.get("tentative_text", "")
+        return data
+
     def _start_listener(self):
         """Start the background listener task."""
         self._stop_listener.clear()
@@ -288,6 +325,9 @@ class StreamingAudioClient:
 
         self.session_id = session_id
         self._latest_partial = None  # Reset for new session
+        self._partial_confirmed = ""
+        self._partial_tentative = ""
+        self.stream_ready.clear()
 
         # Send start stream message
         message = {
@@ -297,6 +337,10 @@ class StreamingAudioClient:
             "sample_rate": self.encoder.sample_rate,
             "channels": self.encoder.channels,
         }
+        if self.binary_frames:
+            message["protocol"] = FRAME_VERSION
+        if self.delta_partials:
+            message["partial_mode"] = "delta"
 
         await self.websocket.send(json.dumps(message))
 
@@ -306,6 +350,11 @@ class StreamingAudioClient:
 
         if response_data.get("type") == "stream_started":
             logger.info(f"Stream started: {session_id}")
+            self.streaming_enabled = bool(response_data.get("streaming_enabled", False))
+            if response_data.get("ready", True):
+                self.stream_ready.set()
+            self.stream_id = response_data.get("stream_id") if response_data.get("protocol") == FRAME_VERSION else None
+            self._frame_seq = 0
 
             # Start background listener for partial results
             self._start_listener()
@@ -356,15 +405,8 @@ class StreamingAudioClient:
                 if len(self.debug_opus_chunks) > self.max_debug_chunks:
                     self.debug_opus_chunks.pop(0)
 
-            # Send to server
-            message = {
-                "type": "audio_chunk",
-                "session_id": self.session_id,
-                "audio_data": base64.b64encode(opus_data).decode("utf-8"),
-            }
-
             try:
-                await self.websocket.send(json.dumps(message))
+                await self.websocket.send(self._opus_message(opus_data))
                 logger.info(
                     f"SENT opus packet #{self.sent_opus_packets}: {len(audio_data)} samples -> {len(opus_data)} bytes"
                 )
@@ -379,6 +421,27 @@ class StreamingAudioClient:
         else:
             logger.debug(f"Buffering audio: {len(audio_data)} samples (waiting for complete frame)")
 
+    def _opus_message(self, opus_data: bytes) -> bytes | str:
+        """Wrap an Opus packet as a binary v2 frame, or as a JSON audio_chunk for v1 servers."""
+        if self.stream_id is not None:
+            frame = AudioFrame(
+                stream_id=self.stream_id,
+                seq=self._frame_seq,
+                codec=CODEC_OPUS,
+                sample_rate=self.encoder.sample_rate,
+                channels=self.encoder.channels,
+                payload=opus_data,
+            )
+            self._frame_seq += 1
+            return frame.encode()
+        return json.dumps(
+            {
+                "type": "audio_chunk",
+                "session_id": self.session_id,
+                "audio_data": base64.b64encode(opus_data).decode("utf-8"),
+            }
+        )
+
     async def end_stream(self) -> dict:
         """End streaming session and get transcription.
 
@@ -428,13 +491,8 @@ class StreamingAudioClient:
                     self.debug_opus_chunks.pop(0)
 
             # Send the final encoded chunk directly
-            message = {
-                "type": "audio_chunk",
-                "session_id": self.session_id,
-                "audio_data": base64.b64encode(final_chunk).decode("utf-8"),
-            }
             try:
-                await self.websocket.send(json.dumps(message))
+                await self.websocket.send(self._opus_message(final_chunk))
             except websockets.exceptions.ConnectionClosed as e:
                 logger.error(f"Connection closed while sending final chunk: {e}")
                 # Save debug audio on connection failure
@@ -533,6 +591,7 @@ class StreamingAudioClient:
 
         logger.info(f"Stream ended: {self.session_id}")
         self.session_id = None
+        self.stream_id = None
         self.encoder.reset()
         self.sent_opus_packets = 0
 
@@ -6,22 +6,34 @@ wires them together.
 """
 
 import asyncio
+import contextlib
 import json
 import os
-import time
 import traceback
 import uuid
-from collections import defaultdict
 
 import websockets
 
 from ...audio.decoder import OpusStreamDecoder
 from ...core.config import get_config, setup_logging
+from ...core.metrics import BYTES_TOTAL, payload_size
+from ...schemas.frames import is_frame
 from ...utils.ssl import create_ssl_context
 from ..backends import get_backend_class
 from . import handlers
 from .internal.envelope import send_envelope
-from .internal.transcription import pcm_to_wav, send_error, transcribe_audio_from_wav
+from .internal.inference_executor import InferenceExecutor
+from .internal.ingress import (
+    INGRESS_DROP_OLDEST,
+    INGRESS_POLICIES,
+    IngressOverflowError,
+    IngressQueue,
+    is_audio_message,
+)
+from .internal.model_swap import BackendSwapper, ModelSwapError
+from .internal.rate_limit import RateLimiter
+from .internal.result_cache import create_result_cache
+from .internal.transcription import pcm_to_wav, send_error, transcribe_audio_array, transcribe_audio_from_wav
 
 # Get config instance and setup logging
 config = get_config()
@@ -36,7 +48,8 @@ class MatildaWebSocketServer:
     - JSON protocol for streaming audio (Opus/PCM)
     - Real-time streaming transcription via streaming framework
     - JWT authentication
-    - Rate limiting per client IP
+    - Token-bucket rate limiting per tenant (requests and audio seconds)
+    - Hot model swap on reload without dropping active sessions
     """
 
     def __init__(self):
@@ -49,7 +62,11 @@ class MatildaWebSocketServer:
         # Initialize JWT token manager
         from . import TokenManager as _TokenManager
 
-        self.token_manager = _TokenManager(_config.jwt_secret_key)
+        self.token_manager = _TokenManager(
+            _config.jwt_secret_key,
+            cache_ttl=float(config.get("server.websocket.jwt_cache_ttl_seconds", 300)),
+            used_token_store=config.get("server.websocket.used_token_store", "log"),
+        )
 
         # Initialize centralized auth policy
         from ...core.auth import AuthPolicy
@@ -77,6 +94,22 @@ class MatildaWebSocketServer:
             self.transcription_semaphore = asyncio.Semaphore(1)
             logger.debug("GPU serialization enabled for Parakeet")
 
+        # Dedicated inference pool shared by batch requests and streaming sessions.
+        # Parakeet gets one worker so GPU work stays serialized even after a timeout.
+        inference_workers = 1 if self.backend_name == "parakeet" else config.get("transcription.workers", None)
+        self.inference_executor = InferenceExecutor(
+            workers=inference_workers,
+            max_queue=int(config.get("transcription.max_queue", 32)),
+            latency_budget_seconds=float(config.get("transcription.latency_budget_seconds", 30)),
+        )
+        logger.debug(f"Inference executor: {self.inference_executor.workers} worker(s)")
+
+        # Transcriptions of byte-identical batch uploads (None when disabled)
+        self.result_cache = create_result_cache()
+
+        # Hot model swap: loads a replacement backend and retires the old one once idle
+        self.backend_swapper = BackendSwapper(self)
+
         # Set MPS fallback for Parakeet to allow CPU fallback for unsupported ops
         if self.backend_name == "parakeet":
             os.environ.setdefault("PYTORCH_ENABLE_MPS_FALLBACK", "1")
@@ -93,13 +126,26 @@ class MatildaWebSocketServer:
         if self.ssl_enabled:
             self.ssl_context = self._setup_ssl_context()
 
-        # Rate limiting: max 10 requests per minute per IP
-        self.rate_limits = defaultdict(list)
-        self.max_requests_per_minute = 10
+        # Token buckets per tenant for requests and seconds of audio submitted
+        self.rate_limiter = RateLimiter(
+            requests_per_minute=float(config.get("server.rate_limit.requests_per_minute", 30)),
+            request_burst=float(config.get("server.rate_limit.request_burst", 10)),
+            audio_seconds_per_minute=float(config.get("server.rate_limit.audio_seconds_per_minute", 300)),
+            audio_burst_seconds=float(config.get("server.rate_limit.audio_burst_seconds", 600)),
+        )
+        self.client_tenants = {}  # client_id -> rate-limit key of the authenticated tenant
 
         # Client tracking
         self.connected_clients = set()
 
+        # Per-connection ingress queues: bound on queued streaming audio and what to do when it is full
+        self.ingress_queue_size = int(config.get("server.websocket.ingress_queue_size", 64))
+        self.ingress_overflow = config.get("server.websocket.ingress_overflow", INGRESS_DROP_OLDEST)
+        if self.ingress_overflow not in INGRESS_POLICIES:
+            logger.warning(f"Unknown ingress_overflow policy {self.ingress_overflow!r}; using {INGRESS_DROP_OLDEST}")
+            self.ingress_overflow = INGRESS_DROP_OLDEST
+        self.ingress_stats = {"dropped": 0, "coalesced": 0, "disconnected": 0}
+
         # Opus stream decoder for handling streaming audio
         self.opus_decoder = OpusStreamDecoder()
 
@@ -112,9 +158,10 @@ class MatildaWebSocketServer:
             streaming_enabled = env_streaming_enabled.strip().lower() in {"1", "true", "yes", "on"}
         if streaming_enabled and bool(simul_config.get("vad_enabled", True)):
             try:
-                from ...audio.vad import SileroVAD
+                from ...audio.vad import MultiStreamVAD
 
-                self.streaming_vad = SileroVAD(threshold=float(simul_config.get("vad_threshold", 0.5)))
+                # One model for all sessions; every session gets its own state via streaming_vad.stream()
+                self.streaming_vad = MultiStreamVAD(threshold=float(simul_config.get("vad_threshold", 0.5)))
                 logger.info("SileroVAD initialized for streaming")
             except Exception as e:
                 logger.warning(f"SileroVAD unavailable for streaming ({e}); continuing without VAD gating")
@@ -134,6 +181,15 @@ class MatildaWebSocketServer:
         # Track binary streaming sessions per client (Opus chunks over binary frames)
         self.binary_stream_sessions = {}  # client_id -> session_id
 
+        # Partial result shaping (delta mode, minimum interval) per streaming session
+        self.partial_emitters = {}  # session_id -> PartialResultEmitter
+
+        # Stateful resamplers for sessions whose audio is not 16 kHz
+        self.resamplers = {}  # session_id -> StreamingResampler
+
+        # Protocol v2 framed binary streams per client
+        self.frame_streams = {}  # client_id -> {stream_id: {"session_id": str, "next_seq": int}}
+
         # Wake word streaming sessions
         self.wake_word_sessions = {}  # session_id -> bool
         self.wake_word_buffers = {}  # session_id -> np.ndarray
@@ -193,33 +249,6 @@ class MatildaWebSocketServer:
             logger.exception(traceback.format_exc())
             raise
 
-    def check_rate_limit(self, client_ip: str) -> bool:
-        """Check if client is within rate limits.
-
-        Args:
-            client_ip: Client IP address
-
-        Returns:
-            True if within limits, False if rate limited
-
-        """
-        if client_ip in {"127.0.0.1", "::1", "localhost"}:
-            return True
-
-        now = time.time()
-        minute_ago = now - 60
-
-        # Clean old entries
-        self.rate_limits[client_ip] = [timestamp for timestamp in self.rate_limits[client_ip] if timestamp > minute_ago]
-
-        # Check if under limit
-        if len(self.rate_limits[client_ip]) >= self.max_requests_per_minute:
-            return False
-
-        # Add current request
-        self.rate_limits[client_ip].append(now)
-        return True
-
     async def handle_client(self, websocket, path=None):
         """Handle individual WebSocket client connections.
 
@@ -239,6 +268,8 @@ class MatildaWebSocketServer:
         if forwarded_ip:
             client_ip = forwarded_ip.split(",")[0].strip()
 
+        ingress = None
+        processor = None
         try:
             self.connected_clients.add(websocket)
             logger.debug(f"Client {client_id} connected from {client_ip}")
@@ -255,24 +286,36 @@ class MatildaWebSocketServer:
                 },
             )
 
+            # The reader only enqueues; handling runs in its own task so slow audio
+            # processing never stops the socket from being drained.
+            ingress = IngressQueue(
+                max_size=self.ingress_queue_size,
+                policy=self.ingress_overflow,
+                totals=self.ingress_stats,
+            )
+            processor = asyncio.create_task(_process_ingress(self, websocket, ingress, client_ip, client_id))
+
             async for message in websocket:
+                BYTES_TOTAL.inc(payload_size(message), "in")
+                if not isinstance(message, bytes):
+                    try:
+                        message = json.loads(message)
+                    except json.JSONDecodeError:
+                        pass  # reported in order by the processing task
+                audio = is_audio_message(message, binary_stream=client_id in self.binary_stream_sessions)
                 try:
-                    # Handle binary messages (raw WAV audio data)
-                    if isinstance(message, bytes):
-                        if client_id in self.binary_stream_sessions:
-                            await handlers.handle_binary_stream_chunk(self, websocket, message, client_ip, client_id)
-                        else:
-                            await handlers.handle_binary_audio(self, websocket, message, client_ip, client_id)
-                    else:
-                        # Handle JSON messages (existing protocol)
-                        data = json.loads(message)
-                        await self.process_message(websocket, data, client_ip, client_id)
-
-                except json.JSONDecodeError:
-                    await send_error(websocket, "Invalid JSON format")
-                except Exception as e:
-                    logger.exception(f"Error processing message from {client_id}: {e}")
-                    await send_error(websocket, f"Processing error: {e!s}", code="internal_error", retryable=True)
+                    ingress.put(message, audio=audio)
+                except IngressOverflowError as e:
+                    logger.warning(f"Client {client_id}: {e}; closing connection")
+                    await send_error(websocket, f"Server overloaded: {e}", code="ingress_overflow", retryable=True)
+                    await websocket.close(code=1013, reason="Audio backlog full")
+                    break
+                if processor.done():
+                    break
+            else:
+                # Clean close: answer what the client already sent
+                ingress.close()
+                await processor
 
         except websockets.exceptions.ConnectionClosed:
             logger.debug(f"Client {client_id} disconnected")
@@ -280,8 +323,19 @@ class MatildaWebSocketServer:
             logger.exception(f"Error handling client {client_id}: {e}")
             logger.exception(traceback.format_exc())
         finally:
+            if processor is not None and not processor.done():
+                processor.cancel()
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await processor
+            if ingress is not None and ingress.stats["dropped"] + ingress.stats["coalesced"]:
+                logger.info(
+                    f"Client {client_id}: ingress dropped {ingress.stats['dropped']}, "
+                    f"coalesced {ingress.stats['coalesced']} audio message(s)"
+                )
             self.connected_clients.discard(websocket)
             self.binary_stream_sessions.pop(client_id, None)
+            self.frame_streams.pop(client_id, None)
+            self.client_tenants.pop(client_id, None)
             # Clean up any streaming sessions for this client
             if client_id in self.client_sessions:
                 orphaned_sessions = self.client_sessions.pop(client_id, set())
@@ -291,6 +345,8 @@ class MatildaWebSocketServer:
                     self.opus_decoder.remove_session(session_id)
                     self.session_chunk_counts.pop(session_id, None)
                     self.ending_sessions.discard(session_id)
+                    self.partial_emitters.pop(session_id, None)
+                    self.resamplers.pop(session_id, None)
                     # Abort new streaming framework session if active
                     if session_id in self.streaming_sessions:
                         try:
@@ -337,13 +393,32 @@ class MatildaWebSocketServer:
             # Update local references if any (most use the global get_config())
             global config
             config = get_config()
+            logger.info("Configuration reloaded successfully")
+
+            # Swap the model in the background when the backend or model size changed
+            backend_name = config.transcription_backend
+            model_size = config.whisper_model
+            model_swap = "unchanged"
+            if data.get("swap_model") or (backend_name, model_size) != (self.backend_name, self.model_size):
+                try:
+                    self.backend_swapper.start_swap(backend_name, model_size)
+                    model_swap = "started"
+                except ModelSwapError as e:
+                    await self.send_error(websocket, f"Model swap rejected: {e}", code="swap_rejected")
+                    return
 
             await send_envelope(
                 websocket,
                 "reload_response",
-                {"type": "reload_response", "status": "ok", "message": "Configuration reloaded"},
+                {
+                    "type": "reload_response",
+                    "status": "ok",
+                    "message": "Configuration reloaded",
+                    "model_swap": model_swap,
+                    "backend": backend_name,
+                    "model": model_size,
+                },
             )
-            logger.info("Configuration reloaded successfully")
 
         except Exception as e:
             logger.exception("Failed to reload configuration")
@@ -386,6 +461,19 @@ class MatildaWebSocketServer:
         """
         return await transcribe_audio_from_wav(self, wav_data, client_id)
 
+    async def transcribe_audio_array(self, audio, client_id: str):
+        """Transcribe in-memory audio.
+
+        Args:
+            audio: Mono float32 samples at 16kHz
+            client_id: Client identifier
+
+        Returns:
+            (success, text, info) tuple
+
+        """
+        return await transcribe_audio_array(self, audio, client_id)
+
     def _pcm_to_wav(self, samples, sample_rate: int, channels: int = 1) -> bytes:
         """Convert PCM samples to WAV format.
 
@@ -435,3 +523,34 @@ class EnhancedWebSocketServer(MatildaWebSocketServer):
 
 # Use enhanced server as default
 WebSocketTranscriptionServer = EnhancedWebSocketServer
+
+
+async def _process_ingress(server, websocket, ingress: IngressQueue, client_ip: str, client_id: str) -> None:
+    """Handle queued messages of one connection in arrival order."""
+    while True:
+        message = await ingress.get()
+        if message is None:
+            return
+        try:
+            if isinstance(message, bytes):
+                # Other binary messages of a client with open v2 streams still reach the legacy handlers
+                if client_id in server.frame_streams and is_frame(message):
+                    await handlers.handle_binary_frame(server, websocket, message, client_ip, client_id)
+                elif client_id in server.binary_stream_sessions:
+                    await handlers.handle_binary_stream_chunk(server, websocket, message, client_ip, client_id)
+                else:
+                    # Raw WAV audio data
+                    await handlers.handle_binary_audio(server, websocket, message, client_ip, client_id)
+            elif isinstance(message, dict):
+                await server.process_message(websocket, message, client_ip, client_id)
+            else:
+                await send_error(websocket, "Invalid JSON format")
+        except websockets.exceptions.ConnectionClosed:
+            logger.debug(f"Client {client_id} disconnected while processing")
+            return
+        except Exception as e:
+            logger.exception(f"Error processing message from {client_id}: {e}")
+            try:
+                await send_error(websocket, f"Processing error: {e!s}", code="internal_error", retryable=True)
+            except websockets.exceptions.ConnectionClosed:
+                return
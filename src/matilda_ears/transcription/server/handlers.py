@@ -7,6 +7,7 @@ from .internal.request_handlers import (
 )
 from .stream_handlers import (
     handle_audio_chunk,
+    handle_binary_frame,
     handle_binary_stream_chunk,
     handle_end_stream,
     handle_pcm_chunk,
@@ -20,6 +21,7 @@ __all__ = [
     "handle_ping",
     "handle_transcription",
     "handle_audio_chunk",
+    "handle_binary_frame",
     "handle_binary_stream_chunk",
     "handle_end_stream",
     "handle_pcm_chunk",
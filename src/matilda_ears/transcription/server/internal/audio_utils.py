@@ -3,11 +3,15 @@
 This module provides audio processing utilities for the WebSocket server:
 - Sample rate validation (accepts 8000Hz and 16000Hz)
 - Resampling to 16000Hz (required by Whisper models)
+- StreamingResampler: stateful polyphase resampling of a chunked stream
 """
 
+import math
+from functools import lru_cache
 from typing import cast
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
 from ....core.config import setup_logging
 from ....audio.conversion import float32_to_int16, int16_to_float32
@@ -45,9 +49,8 @@ def needs_resampling(sample_rate: int) -> bool:
 def resample_audio(pcm_samples: np.ndarray, source_rate: int, target_rate: int = TARGET_SAMPLE_RATE) -> np.ndarray:
     """Resample PCM audio from source_rate to target_rate.
 
-    Uses linear interpolation for simple resampling. For production use with
-    quality-critical applications, consider using scipy.signal.resample or
-    librosa.resample.
+    Uses linear interpolation on a single self-contained buffer. Chunks of a
+    stream should go through a per-session StreamingResampler instead.
 
     Args:
         pcm_samples: Input PCM samples as numpy array (int16 or float32)
@@ -114,3 +117,106 @@ def resample_to_16k(pcm_samples: np.ndarray, source_rate: int) -> np.ndarray:
 
     """
     return resample_audio(pcm_samples, source_rate, TARGET_SAMPLE_RATE)
+
+
+@lru_cache(maxsize=16)
+def _polyphase_filter(up: int, down: int, zero_crossings: int = 10, beta: float = 5.0) -> np.ndarray:
+    """Kaiser-windowed sinc low-pass split into ``up`` phases, each reversed for a dot with the input window.
+
+    Returns:
+        float32 array of shape (up, taps_per_phase)
+
+    """
+    max_rate = max(up, down)
+    half_len = zero_crossings * max_rate
+    n = np.arange(-half_len, half_len + 1)
+    cutoff = 1.0 / max_rate  # as a fraction of the upsampled Nyquist rate
+    taps = cutoff * np.sinc(cutoff * n) * np.kaiser(2 * half_len + 1, beta) * up
+    per_phase = math.ceil(len(taps) / up)
+    taps = np.concatenate([taps, np.zeros(per_phase * up - len(taps))])
+    phases = taps.reshape(per_phase, up).T  # phases[p, k] = taps[k * up + p]
+    return np.ascontiguousarray(phases[:, ::-1], dtype=np.float32)
+
+
+class StreamingResampler:
+    """Polyphase resampler that carries filter state across chunks of one stream.
+
+    Unlike :func:`resample_audio`, which resamples every chunk on its own, the
+    last input samples of each chunk stay in the filter history, so chunk
+    boundaries produce no discontinuities. Filters are designed once per rate
+    pair and shared by all streams. Output lags the input by about one
+    millisecond of filter delay; :meth:`flush` returns that tail when the
+    stream ends.
+    """
+
+    def __init__(self, source_rate: int, target_rate: int = TARGET_SAMPLE_RATE):
+        self.source_rate = source_rate
+        self.target_rate = target_rate
+        divisor = math.gcd(source_rate, target_rate)
+        self.up = target_rate // divisor
+        self.down = source_rate // divisor
+        self._filter = _polyphase_filter(self.up, self.down)
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the stream so far (history and output phase)."""
+        history = self._filter.shape[1] - 1
+        self._history = np.zeros(history, dtype=np.float32)
+        # Upsampled position of the next output sample, relative to the start of the history
+        self._position = history * self.up
+        self._dtype: np.dtype | None = None
+
+    def process(self, pcm_samples: np.ndarray) -> np.ndarray:
+        """Resample the next chunk of the stream.
+
+        Args:
+            pcm_samples: Mono int16 or float32 samples at ``source_rate``
+
+        Returns:
+            Samples at ``target_rate`` with the input's dtype
+
+        """
+        if self.up == self.down or len(pcm_samples) == 0:
+            return pcm_samples
+
+        self._dtype = pcm_samples.dtype
+        if pcm_samples.dtype == np.int16:
+            chunk = int16_to_float32(pcm_samples)
+        else:
+            chunk = pcm_samples.astype(np.float32, copy=False)
+        signal = np.concatenate([self._history, chunk])
+
+        taps = self._filter.shape[1]
+        end = len(signal) * self.up
+        count = max(0, -(-(end - self._position) // self.down))
+        output = np.empty(count, dtype=np.float32)
+        windows = sliding_window_view(signal, taps)
+        # Outputs r, r + up, r + 2*up, ... share a filter phase and step `down` input samples apart
+        for r in range(min(self.up, count)):
+            position = self._position + r * self.down
+            start = position // self.up - (taps - 1)
+            stop = start + (len(range(r, count, self.up)) - 1) * self.down + 1
+            output[r :: self.up] = windows[start : stop : self.down] @ self._filter[position % self.up]
+
+        consumed = len(signal) - (taps - 1)
+        self._position += count * self.down - consumed * self.up
+        self._history = signal[consumed:].copy()
+
+        if pcm_samples.dtype == np.int16:
+            return float32_to_int16(output)
+        return output.astype(pcm_samples.dtype, copy=False)
+
+    def flush(self) -> np.ndarray:
+        """End the stream: return the output still held back by the filter delay, then reset.
+
+        Returns:
+            Remaining samples at ``target_rate`` with the dtype of the last chunk
+            (empty if nothing was processed)
+
+        """
+        if self._dtype is None:
+            return np.zeros(0, dtype=np.float32)
+        # The filter is centred, so its delay is half a phase's taps of input
+        tail = self.process(np.zeros(self._filter.shape[1] // 2, dtype=self._dtype))
+        self.reset()
+        return tail
@@ -1,6 +1,8 @@
 import json
 import uuid
 
+from ....core.metrics import BYTES_TOTAL, payload_size, stage_timer
+
 
 def build_envelope(task: str, result: dict | None = None, error: dict | None = None) -> dict:
     payload: dict[str, object] = {
@@ -19,4 +21,7 @@ def build_envelope(task: str, result: dict | None = None, error: dict | None = N
 
 
 async def send_envelope(websocket, task: str, result: dict | None = None, error: dict | None = None) -> None:
-    await websocket.send(json.dumps(build_envelope(task, result=result, error=error)))
+    with stage_timer("envelope_send"):
+        message = json.dumps(build_envelope(task, result=result, error=error))
+        await websocket.send(message)
+    BYTES_TOTAL.inc(payload_size(message), "out")
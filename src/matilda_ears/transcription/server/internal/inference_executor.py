@@ -0,0 +1,147 @@
+"""Dedicated thread pool for model inference with admission control.
+
+All blocking transcription work (batch requests and streaming sessions) runs
+on one bounded pool instead of asyncio's default executor, so queue depth and
+wait time can be observed and new work can be turned away early - with a
+retry-after hint - instead of timing out minutes later.
+"""
+
+import math
+import os
+import threading
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any
+
+# Weight of the newest sample in the moving averages of wait and service time.
+_EWMA_ALPHA = 0.2
+
+
+def default_workers() -> int:
+    """Thread count used when none is configured, the same as ThreadPoolExecutor's default.
+
+    Streaming steps, session warm-ups and batch jobs share the pool, so it needs
+    enough threads for concurrent streams to overlap (and to fill encoder batches).
+    """
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+class ServerBusyError(RuntimeError):
+    """Raised when new work would exceed the inference queue or latency budget."""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class InferenceExecutor(Executor):
+    """Bounded inference pool that tracks queue depth and wait time.
+
+    The executor can be passed to ``loop.run_in_executor``. ``submit`` never
+    rejects, so work for admitted requests (e.g. chunks of a running stream)
+    always runs; callers starting new work call ``admit`` first.
+    """
+
+    def __init__(self, workers: int | None = None, max_queue: int = 32, latency_budget_seconds: float = 30.0):
+        """Create the pool.
+
+        Args:
+            workers: Number of inference threads (None = :func:`default_workers`)
+            max_queue: Maximum number of jobs waiting for a thread (0 = unbounded)
+            latency_budget_seconds: Reject new work whose estimated queue wait exceeds this (0 = no budget)
+
+        """
+        self.workers = default_workers() if workers is None else max(1, int(workers))
+        self.max_queue = max(0, int(max_queue))
+        self.latency_budget_seconds = max(0.0, float(latency_budget_seconds))
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="matilda-inference")
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+        self._avg_wait = 0.0
+        self._avg_service = 0.0
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        enqueued = time.monotonic()
+        with self._lock:
+            self._queued += 1
+
+        def run():
+            started = time.monotonic()
+            with self._lock:
+                self._queued -= 1
+                self._running += 1
+                self._avg_wait += _EWMA_ALPHA * ((started - enqueued) - self._avg_wait)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                elapsed = time.monotonic() - started
+                with self._lock:
+                    self._running -= 1
+                    self._completed += 1
+                    if self._completed == 1:
+                        self._avg_service = elapsed
+                    else:
+                        self._avg_service += _EWMA_ALPHA * (elapsed - self._avg_service)
+
+        try:
+            return self._pool.submit(run)
+        except BaseException:
+            with self._lock:
+                self._queued -= 1
+            raise
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        self._pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    @property
+    def queue_depth(self) -> int:
+        """Jobs submitted but not yet running."""
+        return self._queued
+
+    def estimated_wait(self) -> float:
+        """Estimated seconds a job submitted now waits before a thread picks it up."""
+        with self._lock:
+            return self._estimated_wait_locked()
+
+    def _estimated_wait_locked(self) -> float:
+        ahead = self._queued + self._running + 1 - self.workers
+        if ahead <= 0:
+            return 0.0
+        return ahead * self._avg_service / self.workers
+
+    def admit(self) -> None:
+        """Check that new work fits the queue and latency budget.
+
+        Raises:
+            ServerBusyError: If the queue is full or the estimated wait exceeds the budget
+
+        """
+        with self._lock:
+            wait = self._estimated_wait_locked()
+            if self.max_queue and self._queued >= self.max_queue:
+                reason = f"inference queue is full ({self._queued} waiting)"
+            elif self.latency_budget_seconds and wait > self.latency_budget_seconds:
+                reason = f"estimated wait {wait:.1f}s exceeds {self.latency_budget_seconds:.1f}s budget"
+            else:
+                return
+            self._rejected += 1
+        raise ServerBusyError(f"Server busy: {reason}", retry_after=float(max(1, math.ceil(wait))))
+
+    def get_stats(self) -> dict[str, Any]:
+        """Queue and timing counters for health reporting."""
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "running": self._running,
+                "queue_depth": self._queued,
+                "max_queue": self.max_queue,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "avg_wait_seconds": round(self._avg_wait, 4),
+                "avg_service_seconds": round(self._avg_service, 4),
+                "estimated_wait_seconds": round(self._estimated_wait_locked(), 4),
+                "latency_budget_seconds": self.latency_budget_seconds,
+            }
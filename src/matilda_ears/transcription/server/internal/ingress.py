@@ -0,0 +1,180 @@
+"""Per-connection ingress queue between the WebSocket reader and message handling.
+
+The connection's reader task only parses and enqueues messages, so the socket
+keeps being drained (and ping/pong answered) while a slow decode or inference
+step runs in the processing task. Only streaming audio is subject to the
+bound; control messages (start_stream, end_stream, transcribe, ...) are always
+queued so a stream is never left without its end marker.
+
+Overflow policies for audio:
+
+- ``drop_oldest``: discard the oldest queued audio message
+- ``coalesce``: merge the new audio into the queued tail message when both are
+  PCM for the same stream, otherwise behave like ``drop_oldest``
+- ``disconnect``: raise :class:`IngressOverflowError` so the connection is closed
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+from collections import deque
+from typing import Any
+
+from ....schemas.frames import CODEC_PCM16, FRAME_MAGIC, AudioFrame, FrameError, decode_frame
+
+INGRESS_DROP_OLDEST = "drop_oldest"
+INGRESS_COALESCE = "coalesce"
+INGRESS_DISCONNECT = "disconnect"
+INGRESS_POLICIES = (INGRESS_DROP_OLDEST, INGRESS_COALESCE, INGRESS_DISCONNECT)
+
+# JSON message types carrying streaming audio
+AUDIO_MESSAGE_TYPES = frozenset({"audio_chunk", "pcm_chunk"})
+
+
+class IngressOverflowError(RuntimeError):
+    """Raised by the ``disconnect`` policy when the audio backlog is full."""
+
+
+class IngressQueue:
+    """Bounded FIFO of received messages for one connection."""
+
+    def __init__(self, max_size: int = 64, policy: str = INGRESS_DROP_OLDEST, totals: dict[str, int] | None = None):
+        """Create the queue.
+
+        Args:
+            max_size: Maximum number of queued audio messages
+            policy: One of INGRESS_POLICIES
+            totals: Optional server-wide counters updated alongside this queue's own
+
+        """
+        if policy not in INGRESS_POLICIES:
+            raise ValueError(f"Unknown ingress overflow policy: {policy}")
+        self.max_size = max(1, int(max_size))
+        self.policy = policy
+        self.totals = totals
+        self._items: deque[list[Any]] = deque()  # [message, is_audio]
+        self._audio_count = 0
+        self._ready = asyncio.Event()
+        self._closed = False
+        self.stats = {"received": 0, "dropped": 0, "coalesced": 0, "high_water": 0}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def put(self, message: Any, audio: bool = False) -> None:
+        """Queue a message, applying the overflow policy to audio.
+
+        Raises:
+            IngressOverflowError: If the audio backlog is full and the policy is ``disconnect``
+
+        """
+        self.stats["received"] += 1
+        if audio and self._audio_count >= self.max_size:
+            if self.policy == INGRESS_DISCONNECT:
+                self._count("disconnected")
+                raise IngressOverflowError(f"Audio backlog exceeded {self.max_size} messages")
+            if self.policy == INGRESS_COALESCE and self._coalesce_tail(message):
+                return
+            self._drop_oldest_audio()
+
+        self._items.append([message, audio])
+        self._audio_count += audio
+        self.stats["high_water"] = max(self.stats["high_water"], len(self._items))
+        self._ready.set()
+
+    async def get(self) -> Any:
+        """Next message in arrival order, or None once the queue is closed and empty."""
+        while not self._items:
+            if self._closed:
+                return None
+            self._ready.clear()
+            await self._ready.wait()
+        message, audio = self._items.popleft()
+        self._audio_count -= audio
+        return message
+
+    def close(self) -> None:
+        """Stop accepting work; ``get`` returns None after the remaining messages."""
+        self._closed = True
+        self._ready.set()
+
+    def _coalesce_tail(self, message: Any) -> bool:
+        if not self._items or not self._items[-1][1]:
+            return False
+        merged = merge_pcm_messages(self._items[-1][0], message)
+        if merged is None:
+            return False
+        self._items[-1][0] = merged
+        self._count("coalesced")
+        return True
+
+    def _drop_oldest_audio(self) -> None:
+        for i, (_message, audio) in enumerate(self._items):
+            if audio:
+                del self._items[i]
+                self._audio_count -= 1
+                self._count("dropped")
+                return
+
+    def _count(self, key: str) -> None:
+        if key in self.stats:
+            self.stats[key] += 1
+        if self.totals is not None:
+            self.totals[key] = self.totals.get(key, 0) + 1
+
+
+def is_audio_message(message: Any, binary_stream: bool = False) -> bool:
+    """Whether a received message is streaming audio (and may be dropped or merged).
+
+    Args:
+        message: Parsed JSON dict, raw text or bytes
+        binary_stream: The client has a legacy binary Opus stream open
+
+    """
+    if isinstance(message, bytes):
+        return binary_stream or message[: len(FRAME_MAGIC)] == FRAME_MAGIC
+    return isinstance(message, dict) and message.get("type") in AUDIO_MESSAGE_TYPES
+
+
+def merge_pcm_messages(older: Any, newer: Any) -> Any | None:
+    """Concatenate two PCM audio messages of the same stream, or None if they cannot be merged.
+
+    Opus packets are never merged; they are decoded one packet at a time.
+    """
+    if isinstance(older, dict) and isinstance(newer, dict):
+        if older.get("type") != "pcm_chunk" or newer.get("type") != "pcm_chunk":
+            return None
+        keys = ("session_id", "sample_rate", "channels")
+        if any(older.get(key) != newer.get(key) for key in keys):
+            return None
+        try:
+            pcm = base64.b64decode(older.get("audio_data") or "") + base64.b64decode(newer.get("audio_data") or "")
+        except ValueError:
+            return None
+        return {**newer, "audio_data": base64.b64encode(pcm).decode("ascii")}
+
+    if isinstance(older, bytes) and isinstance(newer, bytes):
+        try:
+            first, second = decode_frame(older), decode_frame(newer)
+        except FrameError:
+            return None
+        if first.codec != CODEC_PCM16 or second.codec != CODEC_PCM16:
+            return None
+        if (first.stream_id, first.sample_rate, first.channels) != (
+            second.stream_id,
+            second.sample_rate,
+            second.channels,
+        ):
+            return None
+        return AudioFrame(
+            stream_id=second.stream_id,
+            seq=second.seq,
+            codec=CODEC_PCM16,
+            sample_rate=second.sample_rate,
+            channels=second.channels,
+            payload=first.payload + second.payload,
+            flags=first.flags | second.flags,
+        ).encode()
+
+    return None
@@ -0,0 +1,163 @@
+"""Hot swap of the transcription backend without dropping sessions.
+
+A swap loads the new backend in the background while the old one keeps
+serving. Once it is ready it becomes ``server.backend``, so new sessions and
+new batch jobs go to it. Batch jobs hold a lease on the backend they were
+submitted to until the thread running them returns, and Parakeet streaming
+sessions keep the backend they were created with; the old backend is
+unloaded once neither uses it any more.
+
+SimulStreaming sessions transcribe with process-wide Whisper models rather
+than ``server.backend``. A swap drops those models from the pool so new
+sessions load them afresh; sessions already running keep theirs, and the old
+models are collected once the last of those sessions ends.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from ....core.config import setup_logging
+from ...backends import get_backend_class
+from ...streaming.adapter import release_shared_models
+
+if TYPE_CHECKING:
+    from ..core import MatildaWebSocketServer
+
+logger = setup_logging(__name__, log_filename="transcription.txt")
+
+
+class ModelSwapError(RuntimeError):
+    """Raised when a swap cannot be started."""
+
+
+class BackendSwapper:
+    """Tracks which backends are in use and swaps ``server.backend`` when asked."""
+
+    def __init__(self, server: MatildaWebSocketServer, drain_poll_seconds: float = 0.5):
+        self.server = server
+        self.drain_poll_seconds = drain_poll_seconds
+        self.swaps = 0
+        self.last_error: str | None = None
+        self._leases: dict[int, int] = {}  # id(backend) -> batch jobs holding it
+        self._streams: dict[int, set[str]] = {}  # id(retiring backend) -> sessions on the old pooled models
+        self._retiring: list[Any] = []
+        self._swap_task: asyncio.Task | None = None
+        self._retire_tasks: set[asyncio.Task] = set()
+
+    @property
+    def swapping(self) -> bool:
+        return self._swap_task is not None and not self._swap_task.done()
+
+    def acquire(self, backend: Any) -> Callable[[], None]:
+        """Keep ``backend`` loaded until the returned release function is called.
+
+        Calling the release function more than once has no further effect.
+        """
+        key = id(backend)
+        self._leases[key] = self._leases.get(key, 0) + 1
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            if released:
+                return
+            released = True
+            self._leases[key] -= 1
+            if not self._leases[key]:
+                del self._leases[key]
+
+        return release
+
+    def users(self, backend: Any, streams: set[str] | None = None) -> int:
+        """Batch jobs and streaming sessions still using ``backend`` (plus those of ``streams`` still open)."""
+        sessions = self.server.streaming_sessions
+        in_session = sum(
+            1
+            for session in list(sessions.values())
+            if getattr(session, "backend", None) is backend and getattr(session, "uses_backend", True)
+        )
+        in_pool = len(streams & sessions.keys()) if streams else 0
+        return self._leases.get(id(backend), 0) + in_session + in_pool
+
+    def start_swap(self, backend_name: str, model_size: str | None = None) -> asyncio.Task:
+        """Begin loading ``backend_name`` in the background.
+
+        Raises:
+            ModelSwapError: If a swap is already running or the switch needs a restart
+
+        """
+        if self.swapping:
+            raise ModelSwapError("A model swap is already in progress")
+        current = self.server.backend_name
+        if backend_name != current and "parakeet" in (backend_name, current):
+            # The inference pool and GPU lock are sized for the backend the server started with
+            raise ModelSwapError(f"Switching between {current} and {backend_name} requires a restart")
+        self._swap_task = asyncio.create_task(self._swap(backend_name, model_size))
+        return self._swap_task
+
+    async def _swap(self, backend_name: str, model_size: str | None) -> bool:
+        started = time.monotonic()
+        logger.info(f"Loading {backend_name} backend for hot swap")
+        try:
+            new_backend = get_backend_class(backend_name)()
+            await new_backend.load()
+        except Exception as e:
+            self.last_error = str(e)
+            logger.exception(f"Hot swap to {backend_name} failed; keeping {self.server.backend_name}: {e}")
+            return False
+
+        old_backend = self.server.backend
+        self.server.backend = new_backend
+        self.server.backend_name = backend_name
+        if model_size is not None:
+            self.server.model_size = model_size
+        self.swaps += 1
+        self.last_error = None
+        logger.info(f"Swapped to {backend_name} backend in {time.monotonic() - started:.1f}s")
+
+        # Sessions on pooled SimulStreaming models keep them; new sessions load the models afresh
+        streams = {
+            session_id
+            for session_id, session in self.server.streaming_sessions.items()
+            if not getattr(session, "uses_backend", True)
+        }
+        release_shared_models()
+
+        if old_backend is not None and old_backend is not new_backend:
+            self._retiring.append(old_backend)
+            self._streams[id(old_backend)] = streams
+            task = asyncio.create_task(self._retire(old_backend))
+            self._retire_tasks.add(task)
+            task.add_done_callback(self._retire_tasks.discard)
+        return True
+
+    async def _retire(self, backend: Any) -> None:
+        streams = self._streams.get(id(backend))
+        while self.users(backend, streams):
+            await asyncio.sleep(self.drain_poll_seconds)
+        self._retiring.remove(backend)
+        self._streams.pop(id(backend), None)
+        unload = getattr(backend, "unload", None)
+        if unload is not None:
+            unload()
+        # Drop this frame's references too before collecting (this also frees the old pooled models)
+        del backend, unload
+        gc.collect()
+        logger.info("Released previous backend after its sessions finished")
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "backend": self.server.backend_name,
+            "model": self.server.model_size,
+            "swapping": self.swapping,
+            "swaps": self.swaps,
+            "retiring": [
+                {"backend": type(b).__name__, "users": self.users(b, self._streams.get(id(b)))} for b in self._retiring
+            ],
+            "last_error": self.last_error,
+        }
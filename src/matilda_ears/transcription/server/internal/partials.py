@@ -0,0 +1,61 @@
+"""Per-session shaping of partial_result messages.
+
+Full mode sends the whole confirmed and tentative text, as before. Delta mode
+(opt-in via ``"partial_mode": "delta"`` in start_stream) sends only the
+confirmed text added since the last message, anchored at a character offset,
+and includes tentative text only when it changed. Both modes skip unchanged
+results and keep at least ``min_interval`` seconds between messages.
+"""
+
+import time
+
+PARTIAL_MODE_FULL = "full"
+PARTIAL_MODE_DELTA = "delta"
+
+
+class PartialResultEmitter:
+    """Decides which partial results of one session are sent, and in what form."""
+
+    def __init__(self, mode: str = PARTIAL_MODE_FULL, min_interval: float = 0.0):
+        self.delta = mode == PARTIAL_MODE_DELTA
+        self.min_interval = max(0.0, min_interval)
+        self._sent_confirmed = ""
+        self._sent_tentative = ""
+        self._last_sent = None
+
+    @property
+    def mode(self) -> str:
+        return PARTIAL_MODE_DELTA if self.delta else PARTIAL_MODE_FULL
+
+    def next_message(self, session_id: str, confirmed: str, tentative: str, now: float | None = None) -> dict | None:
+        """Build the partial_result payload to send, or None to skip this update."""
+        if confirmed == self._sent_confirmed and tentative == self._sent_tentative:
+            return None
+        now = time.monotonic() if now is None else now
+        if self._last_sent is not None and now - self._last_sent < self.min_interval:
+            return None
+
+        payload: dict = {"type": "partial_result", "session_id": session_id, "is_final": False}
+        if self.delta:
+            # Confirmed text normally only grows; if it was revised, resend from the first changed character.
+            offset = len(self._sent_confirmed)
+            if not confirmed.startswith(self._sent_confirmed):
+                offset = _common_prefix_length(confirmed, self._sent_confirmed)
+            payload.update({"delta": True, "offset": offset, "confirmed_delta": confirmed[offset:]})
+            if tentative != self._sent_tentative:
+                payload["tentative_text"] = tentative
+        else:
+            payload.update({"confirmed_text": confirmed, "tentative_text": tentative})
+
+        self._sent_confirmed = confirmed
+        self._sent_tentative = tentative
+        self._last_sent = now
+        return payload
+
+
+def _common_prefix_length(a: str, b: str) -> int:
+    n = min(len(a), len(b))
+    for i in range(n):
+        if a[i] != b[i]:
+            return i
+    return n
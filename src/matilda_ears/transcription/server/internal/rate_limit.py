@@ -0,0 +1,207 @@
+"""Token-bucket rate limiting per tenant.
+
+Every tenant (the authenticated client id, or the IP address for anonymous
+requests) has two buckets:
+
+- requests: one token per transcription request or stream
+- audio: one token per second of audio submitted for inference
+
+Requests need a whole token. Audio is charged as it arrives and may drive the
+bucket into debt, so a running stream is never cut off; the tenant's next
+request or stream is refused until the debt has been refilled. Buckets that
+have refilled completely carry no state and are evicted periodically.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from typing import TYPE_CHECKING, Any
+
+from ....core.config import setup_logging
+from .transcription import send_error
+
+if TYPE_CHECKING:
+    from ..core import MatildaWebSocketServer
+
+logger = setup_logging(__name__, log_filename="transcription.txt")
+
+# Loopback clients are never limited
+_EXEMPT_IPS = frozenset({"127.0.0.1", "::1", "localhost"})
+
+
+class TokenBucket:
+    """Bucket of ``capacity`` tokens refilled at ``rate`` tokens per second."""
+
+    __slots__ = ("capacity", "rate", "tokens", "updated")
+
+    def __init__(self, capacity: float, rate: float, now: float):
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity
+        self.updated = now
+
+    def refill(self, now: float) -> float:
+        if now > self.updated:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+        return self.tokens
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until ``amount`` tokens are available (0 if they are now)."""
+        missing = amount - self.refill(now)
+        if missing <= 0:
+            return 0.0
+        return missing / self.rate if self.rate > 0 else float("inf")
+
+    def is_full(self, now: float) -> bool:
+        return self.refill(now) >= self.capacity
+
+
+class RateLimiter:
+    """Request and audio-seconds buckets per tenant key."""
+
+    def __init__(
+        self,
+        requests_per_minute: float = 30,
+        request_burst: float = 10,
+        audio_seconds_per_minute: float = 300,
+        audio_burst_seconds: float = 600,
+        evict_interval: float = 60.0,
+    ):
+        """Create the limiter.
+
+        Args:
+            requests_per_minute: Sustained request rate per tenant (0 = unlimited)
+            request_burst: Requests a tenant may make back to back
+            audio_seconds_per_minute: Sustained seconds of audio per tenant per minute (0 = unlimited)
+            audio_burst_seconds: Seconds of audio a tenant may submit at once
+            evict_interval: Seconds between sweeps for idle buckets
+
+        """
+        self.request_rate = max(0.0, float(requests_per_minute)) / 60.0
+        self.request_burst = max(1.0, float(request_burst))
+        self.audio_rate = max(0.0, float(audio_seconds_per_minute)) / 60.0
+        self.audio_burst = max(1.0, float(audio_burst_seconds))
+        self.evict_interval = evict_interval
+        self._requests: dict[str, TokenBucket] = {}
+        self._audio: dict[str, TokenBucket] = {}
+        self._last_evict = time.monotonic()
+        self._limited = 0
+
+    def acquire(self, key: str, now: float | None = None) -> float:
+        """Take one request token for a new request or stream.
+
+        Refused while the tenant's audio bucket is in debt.
+
+        Returns:
+            0.0 if the request may proceed, otherwise seconds until it may be retried
+
+        """
+        now = time.monotonic() if now is None else now
+        self._maybe_evict(now)
+
+        retry_after = 0.0
+        request_bucket = None
+        if self.request_rate:
+            request_bucket = self._bucket(self._requests, key, self.request_burst, self.request_rate, now)
+            retry_after = request_bucket.wait_time(1.0, now)
+        if self.audio_rate and key in self._audio:
+            # Any positive balance admits the request; its audio is charged as it is transcribed
+            retry_after = max(retry_after, self._audio[key].wait_time(1e-9, now))
+
+        if retry_after:
+            self._limited += 1
+            return retry_after
+        if request_bucket is not None:
+            request_bucket.tokens -= 1.0
+        return 0.0
+
+    def charge_audio(self, key: str, seconds: float, now: float | None = None) -> None:
+        """Deduct ``seconds`` of submitted audio from the tenant's audio bucket."""
+        if not self.audio_rate or seconds <= 0:
+            return
+        now = time.monotonic() if now is None else now
+        self._bucket(self._audio, key, self.audio_burst, self.audio_rate, now).tokens -= seconds
+
+    def evict_idle(self, now: float | None = None) -> int:
+        """Drop buckets that have refilled completely; returns how many were removed."""
+        now = time.monotonic() if now is None else now
+        removed = 0
+        for buckets in (self._requests, self._audio):
+            for key in [key for key, bucket in buckets.items() if bucket.is_full(now)]:
+                del buckets[key]
+                removed += 1
+        self._last_evict = now
+        return removed
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "tenants": len(self._requests.keys() | self._audio.keys()),
+            "limited": self._limited,
+            "requests_per_minute": self.request_rate * 60.0,
+            "audio_seconds_per_minute": self.audio_rate * 60.0,
+        }
+
+    def _bucket(self, buckets: dict[str, TokenBucket], key: str, capacity: float, rate: float, now: float):
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = buckets[key] = TokenBucket(capacity, rate, now)
+        return bucket
+
+    def _maybe_evict(self, now: float) -> None:
+        if now - self._last_evict >= self.evict_interval:
+            self.evict_idle(now)
+
+
+def register_tenant(server: MatildaWebSocketServer, client_id: str, client_ip: str, tenant: str | None) -> None:
+    """Remember which tenant a connection authenticated as, for metering its audio."""
+    if client_ip in _EXEMPT_IPS:
+        server.client_tenants.pop(client_id, None)
+    else:
+        server.client_tenants[client_id] = f"client:{tenant}" if tenant else f"ip:{client_ip}"
+
+
+def tenant_key(server: MatildaWebSocketServer, client_ip: str, client_id: str) -> str | None:
+    """Rate-limit key of a connection, or None if it is exempt."""
+    if client_ip in _EXEMPT_IPS:
+        return None
+    return server.client_tenants.get(client_id) or f"ip:{client_ip}"
+
+
+async def enforce_rate_limit(server: MatildaWebSocketServer, websocket, client_ip: str, client_id: str) -> bool:
+    """Take a request token for the connection's tenant, or send rate_limited.
+
+    Returns:
+        True if the request may proceed
+
+    """
+    key = tenant_key(server, client_ip, client_id)
+    if key is None:
+        return True
+    retry_after = server.rate_limiter.acquire(key)
+    if not retry_after:
+        return True
+    retry_after = float(max(1, math.ceil(retry_after)))
+    logger.warning(f"Client {client_id}: Rate limited ({key}), retry after {retry_after:.0f}s")
+    await send_error(
+        websocket,
+        f"Rate limit exceeded. Retry in {retry_after:.0f}s.",
+        code="rate_limited",
+        retryable=True,
+        retry_after=retry_after,
+    )
+    return False
+
+
+def charge_audio(server: MatildaWebSocketServer, client_id: str, seconds: float, client_ip: str | None = None) -> None:
+    """Meter seconds of audio submitted for inference.
+
+    Without ``client_ip`` only connections registered with ``register_tenant`` are charged.
+    """
+    if client_ip is None:
+        key = server.client_tenants.get(client_id)
+    else:
+        key = tenant_key(server, client_ip, client_id)
+    if key is not None:
+        server.rate_limiter.charge_audio(key, seconds)
@@ -1,3 +1,4 @@
+import asyncio
 import base64
 import ipaddress
 import os
@@ -7,7 +8,9 @@ from typing import TYPE_CHECKING
 from ....audio.opus_batch import OpusBatchDecoder
 from ....core.config import setup_logging
 from .envelope import send_envelope
-from .transcription import send_error, transcribe_audio_from_wav
+from .rate_limit import charge_audio, enforce_rate_limit, register_tenant
+from .result_cache import result_cache_key
+from .transcription import send_error, transcribe_audio_from_wav, transcription_error_kwargs
 
 if TYPE_CHECKING:
     from ..core import MatildaWebSocketServer
@@ -32,6 +35,35 @@ def allow_token_generation(client_ip: str) -> bool:
     return is_local_client(client_ip)
 
 
+async def transcribe_upload(
+    server: "MatildaWebSocketServer",
+    wav_data: bytes,
+    client_id: str,
+    bypass_cache: bool = False,
+) -> tuple[bool, str, dict, bool]:
+    """Transcribe an uploaded WAV, answering byte-identical uploads from the result cache.
+
+    Returns:
+        (success, transcribed_text, info_dict, cached)
+
+    """
+    cache = getattr(server, "result_cache", None)
+    if cache is None or bypass_cache:
+        if cache is not None:
+            cache.stats["bypassed"] += 1
+        success, text, info = await transcribe_audio_from_wav(server, wav_data, client_id)
+        return success, text, info, False
+
+    # Hashing an upload of up to 50 MB would stall every stream on the event loop
+    key = await asyncio.to_thread(result_cache_key, server, wav_data)
+    (success, text, info), cached = await cache.get_or_transcribe(
+        key, lambda: transcribe_audio_from_wav(server, wav_data, client_id)
+    )
+    if cached:
+        logger.debug(f"Client {client_id}: Served transcription from result cache")
+    return success, text, info, cached
+
+
 async def handle_binary_audio(
     server: "MatildaWebSocketServer",
     websocket,
@@ -55,8 +87,7 @@ async def handle_binary_audio(
     logger.debug(f"Client {client_id}: Received binary audio ({len(wav_data)} bytes)")
 
     # Check rate limiting
-    if not server.check_rate_limit(client_ip):
-        await send_error(websocket, "Rate limit exceeded. Max 10 requests per minute.", code="rate_limited")
+    if not await enforce_rate_limit(server, websocket, client_ip, client_id):
         return
 
     # Check if model is loaded
@@ -65,8 +96,10 @@ async def handle_binary_audio(
         return
 
     try:
-        # Use common transcription logic
-        success, text, info = await transcribe_audio_from_wav(server, wav_data, client_id)
+        # Use common transcription logic; cached results cost no inference and no audio quota
+        success, text, info, cached = await transcribe_upload(server, wav_data, client_id)
+        if not cached:
+            charge_audio(server, client_id, float(info.get("duration") or 0), client_ip)
 
         if success:
             # Send simple response format for binary protocol
@@ -76,7 +109,7 @@ async def handle_binary_audio(
                 {"type": "transcription_complete", "text": text, "is_final": True},
             )
         else:
-            await send_error(websocket, info.get("error", "Transcription failed"), code="transcription_failed")
+            await send_error(websocket, info.get("error", "Transcription failed"), **transcription_error_kwargs(info))
 
     except Exception as e:
         logger.exception(f"Client {client_id}: Binary audio transcription error: {e}")
@@ -106,6 +139,7 @@ async def handle_auth(
     jwt_payload = server.token_manager.validate_token(token)
     if jwt_payload:
         client_name = jwt_payload.get("client_id", "unknown")
+        register_tenant(server, client_id, client_ip, client_name)
         await send_envelope(
             websocket,
             "auth_success",
@@ -168,10 +202,10 @@ async def handle_transcription(
 
     if auth_result.client_id:
         logger.debug(f"Transcription request from {auth_result.client_id} via {auth_result.method}")
+    register_tenant(server, client_id, client_ip, auth_result.client_id)
 
     # Check rate limiting
-    if not server.check_rate_limit(client_ip):
-        await send_error(websocket, "Rate limit exceeded. Max 10 requests per minute.", code="rate_limited")
+    if not await enforce_rate_limit(server, websocket, client_ip, client_id):
         return
 
     # Check if model is loaded
@@ -207,8 +241,12 @@ async def handle_transcription(
                 await send_error(websocket, f"Opus decoding failed: {e}")
                 return
 
-        # Use common transcription logic
-        success, text, info = await transcribe_audio_from_wav(server, audio_bytes, client_id)
+        # Use common transcription logic; "no_cache" forces a fresh transcription
+        success, text, info, cached = await transcribe_upload(
+            server, audio_bytes, client_id, bypass_cache=bool(data.get("no_cache", False))
+        )
+        if not cached:
+            charge_audio(server, client_id, float(info.get("duration") or 0), client_ip)
 
         if success:
             # Send successful response
@@ -221,13 +259,14 @@ async def handle_transcription(
                     "success": True,
                     "audio_duration": info.get("duration", 0),
                     "language": info.get("language", "en"),
+                    "cached": cached,
                 },
             )
         else:
             await send_error(
                 websocket,
                 f"Transcription failed: {info.get('error', 'Unknown error')}",
-                code="transcription_failed",
+                **transcription_error_kwargs(info),
             )
 
     except Exception as e:
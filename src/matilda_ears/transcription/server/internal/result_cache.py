@@ -0,0 +1,244 @@
+"""Content-addressed cache of batch transcription results.
+
+Entries are keyed by the SHA-256 of the uploaded audio together with
+everything else that shapes the text: backend, model, language and the
+Ears Tuner formatting options. A bounded LRU in memory sits in front of an
+optional directory of JSON files, both with a TTL. Hashing uploads and the
+disk tier's file I/O run in worker threads, off the event loop.
+
+Identical requests that arrive while the first is still being transcribed
+(typically a client retrying after its own timeout) wait for that result
+instead of queueing a second inference job.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ....core.config import get_config, setup_logging
+
+if TYPE_CHECKING:
+    from ..core import MatildaWebSocketServer
+
+logger = setup_logging(__name__, log_filename="transcription.txt")
+
+TranscriptionResult = tuple[bool, str, dict]
+
+# Fraction of max_disk_entries left on disk after a prune
+DISK_LOW_WATER = 0.9
+
+
+def result_cache_key(server: MatildaWebSocketServer, audio: bytes, language: str = "en") -> str:
+    """Cache key for ``audio`` as transcribed by the server's current backend and formatting."""
+    config = get_config()
+    formatting = {
+        "enabled": bool(config.get("ears_tuner.enabled", False)),
+        "formatter": config.get("ears_tuner.formatter", "noop"),
+        "locale": config.get("ears_tuner.locale", None),
+        "formatting": config.get("ears_tuner.formatting", {}),
+        "filename_formats": config.get("ears_tuner.filename_formats", {}),
+    }
+    digest = hashlib.sha256(audio)
+    options = [server.backend_name, getattr(server, "model_size", None), language, formatting]
+    digest.update(json.dumps(options, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Bounded TTL cache of successful transcriptions, with optional on-disk tier."""
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl_seconds: float = 600.0,
+        disk_dir: str | Path | None = None,
+        max_disk_entries: int = 4096,
+    ):
+        self.max_entries = max(0, int(max_entries))
+        self.ttl_seconds = float(ttl_seconds)
+        self.disk_dir = Path(disk_dir).expanduser() if disk_dir else None
+        self.max_disk_entries = max(0, int(max_disk_entries))
+        self._memory: OrderedDict[str, tuple[str, dict, float]] = OrderedDict()
+        self._pending: dict[str, asyncio.Future] = {}
+        self._disk_entries = 0
+        self._disk_lock = threading.Lock()  # disk writes run in worker threads
+        self.stats = {"hits": 0, "disk_hits": 0, "misses": 0, "joined": 0, "bypassed": 0}
+        if self.disk_dir is not None:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            self._disk_entries = sum(1 for _ in self.disk_dir.glob("*.json"))
+
+    async def get_or_transcribe(
+        self, key: str, transcribe: Callable[[], Awaitable[TranscriptionResult]]
+    ) -> tuple[TranscriptionResult, bool]:
+        """Return ``(result, cached)``, running ``transcribe`` only when no result is known.
+
+        Failed transcriptions are returned but never cached.
+        """
+        cached = self._get_memory(key, time.time())
+        if cached is not None:
+            return cached, True
+
+        pending = self._pending.get(key)
+        if pending is not None:
+            self.stats["joined"] += 1
+            try:
+                return await asyncio.shield(pending), True
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+            # The request we joined was abandoned; transcribe on our own
+            return await self.get_or_transcribe(key, transcribe)
+
+        # Registered before the disk lookup so identical requests join it rather than racing
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            cached = await self._get_disk(key, time.time())
+            if cached is not None:
+                future.set_result(cached)
+                return cached, True
+            self.stats["misses"] += 1
+            result = await transcribe()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # joined waiters re-raise; don't warn when there are none
+            raise
+        else:
+            future.set_result(result)
+            if result[0]:
+                await self.put(key, result[1], result[2])
+            return result, False
+        finally:
+            del self._pending[key]
+
+    async def get(self, key: str) -> TranscriptionResult | None:
+        now = time.time()
+        cached = self._get_memory(key, now)
+        if cached is not None:
+            return cached
+        return await self._get_disk(key, now)
+
+    async def put(self, key: str, text: str, info: dict) -> None:
+        expires = time.time() + self.ttl_seconds
+        self._remember(key, text, info, expires)
+        if self.disk_dir is not None and self.max_disk_entries:
+            await asyncio.to_thread(self._write_disk, key, text, info, expires)
+
+    def get_stats(self) -> dict[str, Any]:
+        return {"entries": len(self._memory), "in_flight": len(self._pending), **self.stats}
+
+    def _get_memory(self, key: str, now: float) -> TranscriptionResult | None:
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        text, info, expires = entry
+        if now >= expires:
+            del self._memory[key]
+            return None
+        self._memory.move_to_end(key)
+        self.stats["hits"] += 1
+        return True, text, dict(info)
+
+    async def _get_disk(self, key: str, now: float) -> TranscriptionResult | None:
+        if self.disk_dir is None:
+            return None
+        # File I/O runs off the event loop, which is also serving every open stream
+        entry = await asyncio.to_thread(self._read_disk, key, now)
+        if entry is None:
+            return None
+        text, info, expires = entry
+        self._remember(key, text, info, expires)
+        self.stats["disk_hits"] += 1
+        return True, text, dict(info)
+
+    def _remember(self, key: str, text: str, info: dict, expires: float) -> None:
+        if not self.max_entries:
+            return
+        self._memory[key] = (text, dict(info), expires)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _disk_path(self, key: str) -> Path:
+        return self.disk_dir / f"{key}.json"
+
+    def _read_disk(self, key: str, now: float) -> tuple[str, dict, float] | None:
+        if self.disk_dir is None:
+            return None
+        path = self._disk_path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            text, info, expires = entry["text"], entry["info"], float(entry["expires"])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug(f"Discarding unreadable cached result {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+        if now >= expires:
+            path.unlink(missing_ok=True)
+            return None
+        return text, info, expires
+
+    def _write_disk(self, key: str, text: str, info: dict, expires: float) -> None:
+        if self.disk_dir is None or not self.max_disk_entries:
+            return
+        path = self._disk_path(key)
+        tmp = path.with_name(path.name + ".tmp")
+        try:
+            tmp.write_text(json.dumps({"text": text, "info": info, "expires": expires}), encoding="utf-8")
+            with self._disk_lock:
+                existed = path.exists()
+                tmp.replace(path)
+                if not existed:
+                    self._disk_entries += 1
+                if self._disk_entries > self.max_disk_entries:
+                    self._prune_disk()
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not write cached result {path.name}: {e}")
+            tmp.unlink(missing_ok=True)
+
+    def _prune_disk(self) -> None:
+        # Expired files are dropped first, then the oldest down to the low-water
+        # mark, so a full directory is rescanned once per batch of writes rather
+        # than on every write.
+        now = time.time()
+        entries = []
+        for path in self.disk_dir.glob("*.json"):
+            try:
+                mtime = path.stat().st_mtime
+            except OSError:
+                continue
+            if mtime + self.ttl_seconds <= now:
+                path.unlink(missing_ok=True)
+            else:
+                entries.append((mtime, path))
+        entries.sort()
+        keep = int(self.max_disk_entries * DISK_LOW_WATER)
+        for _, path in entries[: max(0, len(entries) - keep)]:
+            path.unlink(missing_ok=True)
+        self._disk_entries = min(len(entries), keep)
+
+
+def create_result_cache() -> ResultCache | None:
+    """Build the cache from ``transcription.result_cache`` config, or None when disabled."""
+    config = get_config()
+    if not config.get("transcription.result_cache.enabled", True):
+        return None
+    return ResultCache(
+        max_entries=int(config.get("transcription.result_cache.max_entries", 256)),
+        ttl_seconds=float(config.get("transcription.result_cache.ttl_seconds", 600)),
+        disk_dir=config.get("transcription.result_cache.disk_dir", None),
+        max_disk_entries=int(config.get("transcription.result_cache.max_disk_entries", 4096)),
+    )
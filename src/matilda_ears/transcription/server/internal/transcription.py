@@ -2,11 +2,14 @@
 
 This module contains the core transcription functionality including:
 - transcribe_audio_from_wav: Main transcription entry point
+- transcribe_audio_array: In-memory entry point for decoded PCM
 - _pcm_to_wav: PCM to WAV conversion
 - send_error: Error response helper
+- transcription_error_kwargs: Map a failed transcription to send_error arguments
 """
 
 import asyncio
+import contextlib
 import io
 import os
 import tempfile
@@ -16,13 +19,20 @@ from typing import TYPE_CHECKING
 import numpy as np
 import websockets
 
+from ....audio.conversion import int16_to_float32
 from ....core.config import get_config, setup_logging
+from ....core.metrics import stage_timer
+from .audio_utils import TARGET_SAMPLE_RATE
+from .inference_executor import ServerBusyError
 
 if TYPE_CHECKING:
     from ..core import MatildaWebSocketServer
 
 logger = setup_logging(__name__, log_filename="transcription.txt")
 
+MIN_AUDIO_SIZE = 1000  # Minimum bytes for valid audio (excludes header-only files)
+MIN_AUDIO_SAMPLES = (MIN_AUDIO_SIZE - 44) // 2  # The same threshold for 16-bit mono samples
+
 
 def _transcription_timeout_seconds() -> float | None:
     value = get_config().get("transcription.timeout_seconds", 180)
@@ -40,6 +50,9 @@ async def transcribe_audio_from_wav(
 ) -> tuple[bool, str, dict]:
     """Common transcription logic for both batch and streaming.
 
+    16-bit PCM WAV at 16 kHz is decoded in memory and passed to the backend as
+    an array; anything else is handed to the backend as a temporary file.
+
     Args:
         server: The MatildaWebSocketServer instance
         wav_data: WAV audio data to transcribe
@@ -50,43 +63,122 @@ async def transcribe_audio_from_wav(
 
     """
     # Validate audio size before processing
-    MIN_AUDIO_SIZE = 1000  # Minimum bytes for valid audio (excludes header-only files)
     if len(wav_data) < MIN_AUDIO_SIZE:
         logger.warning(f"Client {client_id}: Audio too small ({len(wav_data)} bytes < {MIN_AUDIO_SIZE}), skipping")
         return False, "", {"error": "Audio data too small"}
 
-    # Save to temporary file
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-        temp_file.write(wav_data)
-        temp_path = temp_file.name
+    audio = wav_to_float32(wav_data)
+    if audio is not None:
+        return await transcribe_audio_array(server, audio, client_id)
+
+    def transcribe_file(backend):
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
+            temp_file.write(wav_data)
+            temp_path = temp_file.name
+        try:
+            return backend.transcribe(temp_path, language="en")
+        finally:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                logger.warning(f"Failed to delete temp file: {temp_path}")
+
+    return await _run_transcription(server, client_id, transcribe_file)
+
+
+async def transcribe_audio_array(
+    server: "MatildaWebSocketServer",
+    audio: np.ndarray,
+    client_id: str,
+) -> tuple[bool, str, dict]:
+    """Transcribe in-memory audio without a WAV round-trip.
+
+    Args:
+        server: The MatildaWebSocketServer instance
+        audio: Mono float32 samples in [-1.0, 1.0] at 16 kHz
+        client_id: Client identifier for logging
+
+    Returns:
+        (success, transcribed_text, info_dict)
+
+    """
+    if len(audio) < MIN_AUDIO_SAMPLES:
+        logger.warning(f"Client {client_id}: Audio too small ({len(audio)} samples < {MIN_AUDIO_SAMPLES}), skipping")
+        return False, "", {"error": "Audio data too small"}
+
+    return await _run_transcription(server, client_id, lambda backend: backend.transcribe_array(audio, language="en"))
+
+
+def wav_to_float32(wav_data: bytes) -> np.ndarray | None:
+    """Decode 16-bit PCM WAV at 16 kHz to mono float32.
+
+    Returns None for anything else (other sample widths or rates, compressed or
+    malformed files), which the backend then reads from disk itself.
+    """
+    try:
+        with wave.open(io.BytesIO(wav_data), "rb") as wav_file:
+            if wav_file.getsampwidth() != 2 or wav_file.getframerate() != TARGET_SAMPLE_RATE:
+                return None
+            channels = wav_file.getnchannels()
+            frames = wav_file.readframes(wav_file.getnframes())
+    except (wave.Error, EOFError):
+        return None
+
+    samples = np.frombuffer(frames, dtype=np.int16)
+    if channels > 1:
+        samples = samples[: len(samples) // channels * channels].reshape(-1, channels).mean(axis=1)
+        return (samples / 32768.0).astype(np.float32)
+    return int16_to_float32(samples)
+
+
+def _call_soon_threadsafe(loop: asyncio.AbstractEventLoop, callback) -> None:
+    # The loop may already be closed when a job abandoned at shutdown finally returns
+    with contextlib.suppress(RuntimeError):
+        loop.call_soon_threadsafe(callback)
+
+
+async def _run_transcription(server: "MatildaWebSocketServer", client_id: str, transcribe) -> tuple[bool, str, dict]:
+    """Run `transcribe(backend)` on the inference executor and post-process its text."""
+    # Turn work away up front when the inference queue is over its latency budget
+    try:
+        server.inference_executor.admit()
+    except ServerBusyError as e:
+        logger.warning(f"Client {client_id}: {e} (retry after {e.retry_after:.0f}s)")
+        return False, "", {"error": str(e), "code": "server_busy", "retry_after": e.retry_after}
 
     try:
         # Transcribe in executor to avoid blocking
         logger.debug(f"Client {client_id}: Starting transcription...")
         loop = asyncio.get_event_loop()
+        # Bind the job to the current backend; a hot swap keeps it loaded until the job is done
+        backend = server.backend
+        swapper = getattr(server, "backend_swapper", None)
 
         def transcribe_audio():
-            backend = server.backend
             if backend is None or not backend.is_ready:
                 raise RuntimeError("Backend not ready/model not loaded")
             # Delegate to backend
-            return backend.transcribe(temp_path, language="en")
+            return transcribe(backend)
 
-        # Serialize GPU work for Parakeet to prevent MPS crashes
-        # Acquire semaphore before transcription (queues requests when limit reached)
+        def run_job() -> asyncio.Future:
+            release = swapper.acquire(backend) if swapper is not None else None
+            try:
+                # Unlike the awaiting task, this future completes only once the thread has returned
+                job = server.inference_executor.submit(transcribe_audio)
+            except BaseException:
+                if release is not None:
+                    release()
+                raise
+            if release is not None:
+                # A timeout only stops the wait; the lease lasts until the thread has returned (or never ran)
+                job.add_done_callback(lambda _job: _call_soon_threadsafe(loop, release))
+            return asyncio.wrap_future(job, loop=loop)
+
+        # The inference executor runs a single worker for Parakeet, which serializes GPU work
+        # (preventing MPS crashes) and keeps timed-out jobs from overlapping the next one.
         timeout_seconds = _transcription_timeout_seconds()
-        if server.transcription_semaphore:
-            async with server.transcription_semaphore:
-                logger.debug(f"Client {client_id}: Acquired transcription lock (serialized GPU work)")
-                task = loop.run_in_executor(None, transcribe_audio)
-                if timeout_seconds is None:
-                    text, info = await task
-                else:
-                    text, info = await asyncio.wait_for(task, timeout=timeout_seconds)
-                logger.debug(f"Client {client_id}: Released transcription lock")
-        else:
-            # No serialization needed (faster_whisper/huggingface can run concurrently)
-            task = loop.run_in_executor(None, transcribe_audio)
+        with stage_timer("batch_transcribe"):
+            task = run_job()
             if timeout_seconds is None:
                 text, info = await task
             else:
@@ -118,9 +210,10 @@ async def transcribe_audio_from_wav(
                     "formatting": formatting_config if isinstance(formatting_config, dict) else {},
                     "ears_tuner": {"filename_formats": filename_formats if isinstance(filename_formats, dict) else {}},
                 }
-                formatted_text = formatter.format(
-                    FormatterRequest(text=text, language=formatter_locale, config=request_config)
-                ).text
+                with stage_timer("formatter"):
+                    formatted_text = formatter.format(
+                        FormatterRequest(text=text, language=formatter_locale, config=request_config)
+                    ).text
                 if formatted_text != text:
                     logger.debug(
                         f"Client {client_id}: Formatted text: '{formatted_text[:50]}...' ({len(formatted_text)} chars)"
@@ -149,12 +242,6 @@ async def transcribe_audio_from_wav(
     except Exception as e:
         logger.exception(f"Client {client_id}: Transcription error: {e}")
         return False, "", {"error": str(e)}
-    finally:
-        # Clean up temp file
-        try:
-            os.unlink(temp_path)
-        except OSError:
-            logger.warning(f"Failed to delete temp file: {temp_path}")
 
 
 def pcm_to_wav(samples: np.ndarray, sample_rate: int, channels: int = 1) -> bytes:
@@ -184,23 +271,41 @@ def pcm_to_wav(samples: np.ndarray, sample_rate: int, channels: int = 1) -> byte
     return buffer.getvalue()
 
 
+def transcription_error_kwargs(info: dict, code: str = "transcription_failed", retryable: bool = False) -> dict:
+    """Build send_error keyword arguments for a failed transcription.
+
+    Rejections by the inference executor keep their ``server_busy`` code and
+    retry-after hint; other failures use the caller's code.
+    """
+    if info.get("code") == "server_busy":
+        return {"code": "server_busy", "retryable": True, "retry_after": info.get("retry_after")}
+    return {"code": code, "retryable": retryable}
+
+
 async def send_error(
     websocket,
     message: str,
     code: str = "bad_request",
     retryable: bool = False,
+    retry_after: float | None = None,
 ) -> None:
     """Send error message to client.
 
     Args:
         websocket: The WebSocket connection
         message: Error message to send
+        code: Machine-readable error code
+        retryable: Whether the client may retry the request
+        retry_after: Seconds the client should wait before retrying
 
     """
     try:
         from .envelope import send_envelope
 
-        await send_envelope(websocket, "error", error={"message": message, "code": code, "retryable": retryable})
+        error = {"message": message, "code": code, "retryable": retryable}
+        if retry_after is not None:
+            error["retry_after"] = retry_after
+        await send_envelope(websocket, "error", error=error)
     except (websockets.exceptions.ConnectionClosed, websockets.exceptions.ConnectionClosedError) as e:
         logger.warning(f"WebSocket connection closed while sending error: {e}")
     except Exception as e:
@@ -1,3 +1,4 @@
+import asyncio
 import base64
 import os
 import time
@@ -7,14 +8,28 @@ from typing import TYPE_CHECKING
 import numpy as np
 
 from ...core.config import get_config, setup_logging
+from ...core.metrics import stage_timer
+from ...schemas.frames import CODEC_OPUS, FRAME_VERSION, FrameError, decode_frame
 from ...wake_word.detector import WakeWordDetector
 from ...audio.conversion import int16_to_float32
-from .internal.audio_utils import TARGET_SAMPLE_RATE, needs_resampling, resample_to_16k, validate_sample_rate
+from ...audio.ring_buffer import RingBuffer
+from .internal.audio_utils import (
+    TARGET_SAMPLE_RATE,
+    StreamingResampler,
+    needs_resampling,
+    resample_to_16k,
+    validate_sample_rate,
+)
 from .internal.envelope import send_envelope
-from .internal.transcription import pcm_to_wav, send_error, transcribe_audio_from_wav
+from .internal.inference_executor import ServerBusyError
+from .internal.partials import PARTIAL_MODE_DELTA, PARTIAL_MODE_FULL, PartialResultEmitter
+from .internal.rate_limit import charge_audio, enforce_rate_limit, register_tenant
+from .internal.transcription import send_error, transcribe_audio_array, transcription_error_kwargs
 
 
-def _create_streaming_session(session_id: str, backend, backend_name: str, config, transcription_semaphore, vad):
+def _create_streaming_session(
+    session_id: str, backend, backend_name: str, config, transcription_semaphore, vad, *, executor=None
+):
     """Create a streaming session using SimulStreaming."""
     from ..streaming import StreamingSession, StreamingConfig
 
@@ -40,11 +55,20 @@ def _create_streaming_session(session_id: str, backend, backend_name: str, confi
         never_fire=simul_config.get("never_fire", True),
         vad_enabled=bool(simul_config.get("vad_enabled", True)) and vad is not None,
         vad_threshold=float(simul_config.get("vad_threshold", 0.5)),
+        encoder_batch_window_ms=float(simul_config.get("encoder_batch_window_ms", 15.0)),
+        coalesce_drain=bool(streaming_config.get("coalesce_drain", True)),
         parakeet_context_size=context_size,
         parakeet_depth=int(parakeet_config.get("depth", 1)),
     )
 
-    return StreamingSession(session_id=session_id, config=config, backend=backend, backend_name=backend_name, vad=vad)
+    return StreamingSession(
+        session_id=session_id,
+        config=config,
+        backend=backend,
+        backend_name=backend_name,
+        vad=vad,
+        executor=executor,
+    )
 
 
 if TYPE_CHECKING:
@@ -64,11 +88,65 @@ def _downmix_to_mono(pcm_samples: np.ndarray, channels: int) -> np.ndarray:
         return np.array([], dtype=pcm_samples.dtype)
 
     trimmed = pcm_samples[: frame_count * channels]
+    if np.issubdtype(pcm_samples.dtype, np.floating):
+        return trimmed.reshape(frame_count, channels).mean(axis=1, dtype=np.float32)
     frames = trimmed.reshape(frame_count, channels).astype(np.int32)
     mono = frames.mean(axis=1)
     return np.clip(mono, -32768, 32767).astype(np.int16)
 
 
+def _session_vad(server: "MatildaWebSocketServer"):
+    """VAD for a new streaming session: its own stream of the server's shared VAD engine."""
+    vad = getattr(server, "streaming_vad", None)
+    if vad is None or not hasattr(vad, "stream"):
+        return vad
+    return vad.stream()
+
+
+def _requested_protocol(data: dict) -> int | None:
+    """Protocol version asked for in start_stream, capped at the newest supported; None if invalid."""
+    value = data.get("protocol")
+    if value is None:
+        return 1
+    if isinstance(value, str) and value.strip().isdigit():
+        value = int(value)
+    if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+        return None
+    return min(value, FRAME_VERSION)
+
+
+def _create_partial_emitter(data: dict) -> PartialResultEmitter:
+    """Partial result shaping requested in start_stream, bounded by the configured minimum interval."""
+    config = get_config()
+    mode = PARTIAL_MODE_DELTA if data.get("partial_mode") == PARTIAL_MODE_DELTA else PARTIAL_MODE_FULL
+    min_interval_ms = float(config.get("streaming.partial_min_interval_ms", 100))
+    requested_ms = data.get("partial_min_interval_ms")
+    if requested_ms is not None:
+        # Clients may ask for fewer partials, not more than the server allows
+        min_interval_ms = max(min_interval_ms, float(requested_ms))
+    return PartialResultEmitter(mode=mode, min_interval=min_interval_ms / 1000.0)
+
+
+async def _send_partial_result(server: "MatildaWebSocketServer", websocket, session_id: str, result) -> None:
+    """Send a partial_result for `result`, shaped by the session's emitter (delta mode, minimum interval)."""
+    if not (result.confirmed_text or result.tentative_text):
+        return
+    emitter = server.partial_emitters.get(session_id)
+    if emitter is None:
+        payload = {
+            "type": "partial_result",
+            "session_id": session_id,
+            "confirmed_text": result.confirmed_text,
+            "tentative_text": result.tentative_text,
+            "is_final": False,
+        }
+    else:
+        payload = emitter.next_message(session_id, result.confirmed_text, result.tentative_text)
+        if payload is None:
+            return
+    await send_envelope(websocket, "partial_result", payload)
+
+
 def _streaming_enabled() -> bool:
     env_value = os.getenv("STT_STREAMING_ENABLED")
     if env_value is not None:
@@ -100,12 +178,36 @@ def _log_audio_stats(client_id: str, session_id: str, pcm_samples: np.ndarray) -
     )
 
 
-def _decode_and_normalize_opus(client_id: str, session_id: str, decoder, opus_data: bytes) -> np.ndarray:
-    pcm_samples = decoder.decode_chunk(opus_data)
+def _resample_session_chunk(
+    server: "MatildaWebSocketServer", session_id: str, pcm_samples: np.ndarray, source_rate: int
+) -> np.ndarray:
+    """Resample one chunk of a session to 16 kHz, keeping filter state between its chunks."""
+    with stage_timer("resample"):
+        resampler = server.resamplers.get(session_id)
+        if resampler is None or resampler.source_rate != source_rate:
+            resampler = server.resamplers[session_id] = StreamingResampler(source_rate)
+        return resampler.process(pcm_samples)
+
+
+def _flush_session_resampler(server: "MatildaWebSocketServer", session_id: str) -> np.ndarray | None:
+    """Drop the session's resampler, returning the samples its filter still held back."""
+    resampler = server.resamplers.pop(session_id, None)
+    if resampler is None:
+        return None
+    with stage_timer("resample"):
+        tail = resampler.flush()
+    return tail if len(tail) else None
+
+
+def _decode_and_normalize_opus(
+    server: "MatildaWebSocketServer", client_id: str, session_id: str, decoder, opus_data: bytes
+) -> np.ndarray:
+    with stage_timer("opus_decode"):
+        pcm_samples = decoder.decode_chunk(opus_data)
     pcm_samples = _downmix_to_mono(pcm_samples, decoder.channels)
     _log_audio_stats(client_id, session_id, pcm_samples)
     if decoder.sample_rate != TARGET_SAMPLE_RATE:
-        pcm_samples = resample_to_16k(pcm_samples, decoder.sample_rate)
+        pcm_samples = _resample_session_chunk(server, session_id, pcm_samples, decoder.sample_rate)
     return pcm_samples
 
 
@@ -142,6 +244,17 @@ async def _process_wake_word_chunk(
     if detector is None:
         return
 
+    with stage_timer("wake_word"):
+        await _score_wake_word_chunk(server, websocket, session_id, pcm_samples, detector)
+
+
+async def _score_wake_word_chunk(
+    server: "MatildaWebSocketServer",
+    websocket,
+    session_id: str,
+    pcm_samples: np.ndarray,
+    detector: WakeWordDetector,
+) -> None:
     debug_state = server.wake_word_debug_sessions.get(session_id)
     max_phrase = None
     max_confidence = 0.0
@@ -231,12 +344,30 @@ async def handle_start_stream(
 
     if auth_result.client_id:
         logger.debug(f"Stream session started by {auth_result.client_id} via {auth_result.method}")
+    register_tenant(server, client_id, client_ip, auth_result.client_id)
+
+    if not await enforce_rate_limit(server, websocket, client_ip, client_id):
+        return
 
     # Check if model is loaded
     if not server.backend.is_ready:
         await send_error(websocket, "Server not ready. Model not loaded.", code="not_ready")
         return
 
+    # Refuse new streams while inference is over its latency budget
+    try:
+        server.inference_executor.admit()
+    except ServerBusyError as e:
+        logger.warning(f"Client {client_id}: Stream rejected: {e}")
+        await send_error(websocket, str(e), code="server_busy", retryable=True, retry_after=e.retry_after)
+        return
+
+    # Protocol 2: audio arrives as binary frames addressed by a per-client stream id
+    protocol = _requested_protocol(data)
+    if protocol is None:
+        await send_error(websocket, f"Invalid protocol: {data.get('protocol')!r}")
+        return
+
     # Create session ID for this stream
     session_id = data.get("session_id", f"{client_id}_{uuid.uuid4().hex[:8]}")
 
@@ -276,6 +407,16 @@ async def handle_start_stream(
     if use_binary:
         server.binary_stream_sessions[client_id] = session_id
 
+    partial_emitter = _create_partial_emitter(data)
+    server.partial_emitters[session_id] = partial_emitter
+    server.resamplers.pop(session_id, None)
+
+    stream_id = None
+    if protocol == FRAME_VERSION:
+        frame_streams = server.frame_streams.setdefault(client_id, {})
+        stream_id = max(frame_streams, default=0) + 1
+        frame_streams[stream_id] = {"session_id": session_id, "next_seq": 0}
+
     wake_word_enabled = bool(data.get("wake_word_enabled", False))
     wake_word_debug = bool(data.get("wake_word_debug", False))
     if wake_word_enabled:
@@ -298,11 +439,12 @@ async def handle_start_stream(
                 backend_name=server.backend_name,
                 config=None,  # Config loaded internally
                 transcription_semaphore=server.transcription_semaphore,
-                vad=server.streaming_vad,
+                vad=_session_vad(server),
+                executor=server.inference_executor,
             )
 
-            # Start the session
-            await streaming_session.start()
+            # Warm the session up in the background; chunks are buffered until it is live
+            streaming_session.start_in_background()
 
             # Store session
             server.streaming_sessions[session_id] = streaming_session
@@ -310,7 +452,7 @@ async def handle_start_stream(
             strategy_name = "simul_streaming"
 
             logger.debug(
-                f"Client {client_id}: Started streaming session {session_id} "
+                f"Client {client_id}: Starting streaming session {session_id} "
                 f"with {strategy_name} strategy (backend={server.backend_name})"
             )
 
@@ -338,9 +480,89 @@ async def handle_start_stream(
             "backend": server.backend_name,
             "strategy": strategy_name,
             "wake_word_enabled": wake_word_enabled,
+            "ready": not streaming_enabled,  # stream_ready follows once the model is live
+            "protocol": protocol,
+            "stream_id": stream_id,
+            "partial_mode": partial_emitter.mode,
         },
     )
 
+    if streaming_enabled:
+        _spawn(
+            _announce_stream_ready(
+                server, websocket, session_id, streaming_session, client_id=client_id, strategy_name=strategy_name
+            )
+        )
+
+
+# Strong references to fire-and-forget tasks so they are not garbage collected mid-flight.
+_background_tasks: set[asyncio.Task] = set()
+
+
+def _spawn(coro) -> asyncio.Task:
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+async def _announce_stream_ready(
+    server: "MatildaWebSocketServer",
+    websocket,
+    session_id: str,
+    streaming_session,
+    *,
+    client_id: str,
+    strategy_name: str | None,
+) -> None:
+    """Wait for a streaming session to warm up, then tell the client it is live."""
+    started = time.monotonic()
+    try:
+        result = await streaming_session.wait_until_ready()
+    except Exception as e:
+        logger.warning(
+            f"Client {client_id}: Failed to start streaming session for {session_id}: {e}. Falling back to batch mode."
+        )
+        if server.streaming_sessions.get(session_id) is not streaming_session:
+            return
+        server.streaming_sessions.pop(session_id, None)
+        await send_envelope(
+            websocket,
+            "stream_ready",
+            {
+                "type": "stream_ready",
+                "session_id": session_id,
+                "streaming_enabled": False,
+                "backend": server.backend_name,
+                "strategy": None,
+            },
+        )
+        return
+
+    # The stream may have ended (or the client left) while the model was loading.
+    if server.streaming_sessions.get(session_id) is not streaming_session:
+        return
+
+    warmup_ms = (time.monotonic() - started) * 1000
+    logger.debug(f"Client {client_id}: Streaming session {session_id} ready after {warmup_ms:.0f}ms")
+    try:
+        await send_envelope(
+            websocket,
+            "stream_ready",
+            {
+                "type": "stream_ready",
+                "session_id": session_id,
+                "streaming_enabled": True,
+                "backend": server.backend_name,
+                "strategy": strategy_name,
+                "warmup_ms": round(warmup_ms, 1),
+            },
+        )
+        # Partials for audio that was buffered during warm-up.
+        await _send_partial_result(server, websocket, session_id, result)
+    except Exception as e:
+        logger.debug(f"Client {client_id}: Could not announce stream_ready for {session_id}: {e}")
+
 
 async def handle_audio_chunk(
     server: "MatildaWebSocketServer",
@@ -398,29 +620,19 @@ async def handle_audio_chunk(
 
         # Decode Opus chunk and append to PCM buffer
         # This returns the decoded PCM samples as numpy array
-        pcm_samples = _decode_and_normalize_opus(client_id, session_id, decoder, opus_data)
+        pcm_samples = _decode_and_normalize_opus(server, client_id, session_id, decoder, opus_data)
 
+        charge_audio(server, client_id, len(pcm_samples) / TARGET_SAMPLE_RATE)
         await _process_wake_word_chunk(server, websocket, session_id, pcm_samples)
 
         # If streaming session exists, process chunk with new framework
         if session_id in server.streaming_sessions:
             try:
                 streaming_session = server.streaming_sessions[session_id]
-                result = await streaming_session.process_chunk(pcm_samples)
+                with stage_timer("process_chunk"):
+                    result = await streaming_session.process_chunk(pcm_samples)
 
-                # Send partial result with new schema (confirmed + tentative)
-                if result.confirmed_text or result.tentative_text:
-                    await send_envelope(
-                        websocket,
-                        "partial_result",
-                        {
-                            "type": "partial_result",
-                            "session_id": session_id,
-                            "confirmed_text": result.confirmed_text,
-                            "tentative_text": result.tentative_text,
-                            "is_final": False,
-                        },
-                    )
+                await _send_partial_result(server, websocket, session_id, result)
             except Exception as e:
                 logger.warning(f"Client {client_id}: Error in streaming transcription: {e}")
                 # Continue accumulating audio even if streaming fails
@@ -456,6 +668,63 @@ async def handle_binary_stream_chunk(
         await send_error(websocket, "No active binary stream session")
         return
 
+    await _process_binary_opus(server, websocket, session_id, opus_data, client_id=client_id)
+
+
+async def handle_binary_frame(
+    server: "MatildaWebSocketServer",
+    websocket,
+    message: bytes,
+    client_ip: str,
+    client_id: str,
+) -> None:
+    """Handle a protocol v2 binary frame (see matilda_ears.schemas.frames)."""
+    try:
+        frame = decode_frame(message)
+    except FrameError as e:
+        await send_error(websocket, f"Invalid audio frame: {e}")
+        return
+
+    stream = server.frame_streams.get(client_id, {}).get(frame.stream_id)
+    if stream is None:
+        await send_error(websocket, f"Unknown stream: {frame.stream_id}")
+        return
+    session_id = stream["session_id"]
+
+    if frame.seq < stream["next_seq"]:
+        logger.warning(
+            f"Client {client_id}: Stream {frame.stream_id} frame seq {frame.seq}, expected {stream['next_seq']}"
+        )
+    elif frame.seq > stream["next_seq"]:
+        # Gaps are expected when the ingress queue drops or coalesces audio under load
+        logger.debug(f"Client {client_id}: Stream {frame.stream_id} skipped to seq {frame.seq}")
+    stream["next_seq"] = frame.seq + 1
+
+    if frame.codec == CODEC_OPUS:
+        await _process_binary_opus(
+            server, websocket, session_id, frame.payload, client_id=client_id, ack_requested=frame.ack_requested
+        )
+        return
+
+    if session_id in server.ending_sessions:
+        logger.debug(f"Client {client_id}: Ignoring chunk for ending session {session_id}")
+        return
+    pcm_session = await _get_pcm_session(
+        server, websocket, session_id, sample_rate=frame.sample_rate, channels=frame.channels, client_id=client_id
+    )
+    if pcm_session is not None:
+        await _process_pcm_bytes(server, websocket, session_id, pcm_session, frame.payload, client_id=client_id)
+
+
+async def _process_binary_opus(
+    server: "MatildaWebSocketServer",
+    websocket,
+    session_id: str,
+    opus_data: bytes,
+    *,
+    client_id: str,
+    ack_requested: bool = False,
+) -> None:
     # Skip if session is ending (prevents race condition)
     if session_id in server.ending_sessions:
         logger.debug(f"Client {client_id}: Ignoring Opus chunk for ending session {session_id}")
@@ -483,30 +752,33 @@ async def handle_binary_stream_chunk(
                 {"chunk_num": chunk_num, "size": len(opus_data), "data": opus_data}
             )
 
-        pcm_samples = _decode_and_normalize_opus(client_id, session_id, decoder, opus_data)
+        pcm_samples = _decode_and_normalize_opus(server, client_id, session_id, decoder, opus_data)
 
+        charge_audio(server, client_id, len(pcm_samples) / TARGET_SAMPLE_RATE)
         await _process_wake_word_chunk(server, websocket, session_id, pcm_samples)
 
         if session_id in server.streaming_sessions:
             try:
                 streaming_session = server.streaming_sessions[session_id]
-                result = await streaming_session.process_chunk(pcm_samples)
+                with stage_timer("process_chunk"):
+                    result = await streaming_session.process_chunk(pcm_samples)
 
-                if result.confirmed_text or result.tentative_text:
-                    await send_envelope(
-                        websocket,
-                        "partial_result",
-                        {
-                            "type": "partial_result",
-                            "session_id": session_id,
-                            "confirmed_text": result.confirmed_text,
-                            "tentative_text": result.tentative_text,
-                            "is_final": False,
-                        },
-                    )
+                await _send_partial_result(server, websocket, session_id, result)
             except Exception as e:
                 logger.warning(f"Client {client_id}: Error in streaming transcription: {e}")
 
+        if ack_requested:
+            await send_envelope(
+                websocket,
+                "chunk_received",
+                {
+                    "type": "chunk_received",
+                    "session_id": session_id,
+                    "samples_decoded": len(pcm_samples) if pcm_samples is not None else 0,
+                    "total_duration": decoder.get_duration(),
+                },
+            )
+
     except Exception as e:
         logger.exception(f"Error decoding binary audio chunk: {e}")
         await send_error(websocket, f"Audio chunk processing failed: {e!s}", code="internal_error", retryable=True)
@@ -534,39 +806,16 @@ async def handle_pcm_chunk(
         logger.debug(f"Client {client_id}: Ignoring chunk for ending session {session_id}")
         return
 
-    # Get or create PCM session
-    if session_id not in server.pcm_sessions:
-        # Initialize PCM session with default parameters
-        sample_rate = data.get("sample_rate", 16000)
-        channels = data.get("channels", 1)
-
-        # Validate sample rate for new sessions
-        is_valid, error_msg = validate_sample_rate(sample_rate)
-        if not is_valid:
-            await send_error(websocket, error_msg)
-            return
-
-        # Track if resampling is needed
-        resampling_needed = needs_resampling(sample_rate)
-
-        server.pcm_sessions[session_id] = {
-            "samples": [],
-            "sample_rate": sample_rate,
-            "channels": channels,
-            "chunk_count": 0,
-            "needs_resampling": resampling_needed,
-            "total_samples": 0,
-        }
-        server.client_sessions.setdefault(client_id, set()).add(session_id)
-        if resampling_needed:
-            logger.debug(
-                f"Client {client_id}: Created PCM session {session_id} ({sample_rate}Hz, {channels}ch) "
-                f"- will resample to {TARGET_SAMPLE_RATE}Hz"
-            )
-        else:
-            logger.debug(f"Client {client_id}: Created PCM session {session_id} ({sample_rate}Hz, {channels}ch)")
-
-    pcm_session = server.pcm_sessions[session_id]
+    pcm_session = await _get_pcm_session(
+        server,
+        websocket,
+        session_id,
+        sample_rate=data.get("sample_rate", 16000),
+        channels=data.get("channels", 1),
+        client_id=client_id,
+    )
+    if pcm_session is None:
+        return
 
     # Get PCM data (base64 encoded)
     pcm_data_b64 = data.get("audio_data")
@@ -577,6 +826,65 @@ async def handle_pcm_chunk(
     try:
         # Decode base64 to bytes
         pcm_bytes = base64.b64decode(pcm_data_b64)
+    except Exception as e:
+        logger.exception(f"Error processing PCM chunk: {e}")
+        await send_error(websocket, f"PCM chunk processing failed: {e!s}", code="internal_error", retryable=True)
+        return
+
+    await _process_pcm_bytes(server, websocket, session_id, pcm_session, pcm_bytes, client_id=client_id)
+
+
+async def _get_pcm_session(
+    server: "MatildaWebSocketServer",
+    websocket,
+    session_id: str,
+    *,
+    sample_rate: int,
+    channels: int,
+    client_id: str,
+) -> dict | None:
+    """Return the PCM session, creating it on the first chunk (None if the sample rate is unsupported)."""
+    if session_id in server.pcm_sessions:
+        return server.pcm_sessions[session_id]
+
+    # Validate sample rate for new sessions
+    is_valid, error_msg = validate_sample_rate(sample_rate)
+    if not is_valid:
+        await send_error(websocket, error_msg)
+        return None
+
+    # Track if resampling is needed
+    resampling_needed = needs_resampling(sample_rate)
+
+    server.pcm_sessions[session_id] = {
+        # float32 at 16 kHz, ready for the batch fallback without a concatenation
+        "samples": RingBuffer(TARGET_SAMPLE_RATE * MAX_PCM_BUFFER_SECONDS, dtype=np.float32),
+        "sample_rate": sample_rate,
+        "channels": channels,
+        "chunk_count": 0,
+        "needs_resampling": resampling_needed,
+    }
+    server.client_sessions.setdefault(client_id, set()).add(session_id)
+    if resampling_needed:
+        logger.debug(
+            f"Client {client_id}: Created PCM session {session_id} ({sample_rate}Hz, {channels}ch) "
+            f"- will resample to {TARGET_SAMPLE_RATE}Hz"
+        )
+    else:
+        logger.debug(f"Client {client_id}: Created PCM session {session_id} ({sample_rate}Hz, {channels}ch)")
+    return server.pcm_sessions[session_id]
+
+
+async def _process_pcm_bytes(
+    server: "MatildaWebSocketServer",
+    websocket,
+    session_id: str,
+    pcm_session: dict,
+    pcm_bytes: bytes,
+    *,
+    client_id: str,
+) -> None:
+    try:
         pcm_session["chunk_count"] += 1
 
         # Guard against empty packets
@@ -589,23 +897,18 @@ async def handle_pcm_chunk(
 
         # Resample to 16kHz if needed (e.g., 8kHz input)
         if pcm_session.get("needs_resampling", False):
-            pcm_samples = resample_to_16k(pcm_samples, pcm_session["sample_rate"])
+            pcm_samples = _resample_session_chunk(server, session_id, pcm_samples, pcm_session["sample_rate"])
 
+        charge_audio(server, client_id, len(pcm_samples) / TARGET_SAMPLE_RATE)
         await _process_wake_word_chunk(server, websocket, session_id, pcm_samples)
 
-        # Accumulate samples for batch transcription (if needed)
+        # Accumulate samples for batch transcription (if needed); the ring keeps the last MAX_PCM_BUFFER_SECONDS
         # Note: After resampling, samples are at 16kHz
-        pcm_session["samples"].append(pcm_samples)
-        pcm_session["total_samples"] += len(pcm_samples)
-        max_samples = TARGET_SAMPLE_RATE * MAX_PCM_BUFFER_SECONDS
-        while pcm_session["samples"] and pcm_session["total_samples"] > max_samples:
-            dropped = pcm_session["samples"].pop(0)
-            pcm_session["total_samples"] -= len(dropped)
+        pcm_session["samples"].append(int16_to_float32(pcm_samples))
 
         # Log periodically
         if pcm_session["chunk_count"] % 10 == 1:
-            total_samples = sum(len(s) for s in pcm_session["samples"])
-            duration = total_samples / pcm_session["sample_rate"]
+            duration = len(pcm_session["samples"]) / TARGET_SAMPLE_RATE
             logger.debug(
                 f"Client {client_id}: PCM chunk #{pcm_session['chunk_count']}, "
                 f"size: {len(pcm_bytes)} bytes, total: {duration:.2f}s"
@@ -615,21 +918,10 @@ async def handle_pcm_chunk(
         if session_id in server.streaming_sessions:
             try:
                 streaming_session = server.streaming_sessions[session_id]
-                result = await streaming_session.process_chunk(pcm_samples)
+                with stage_timer("process_chunk"):
+                    result = await streaming_session.process_chunk(pcm_samples)
 
-                # Send partial result with new schema (confirmed + tentative)
-                if result.confirmed_text or result.tentative_text:
-                    await send_envelope(
-                        websocket,
-                        "partial_result",
-                        {
-                            "type": "partial_result",
-                            "session_id": session_id,
-                            "confirmed_text": result.confirmed_text,
-                            "tentative_text": result.tentative_text,
-                            "is_final": False,
-                        },
-                    )
+                await _send_partial_result(server, websocket, session_id, result)
             except Exception as e:
                 logger.warning(f"Client {client_id}: Error in PCM streaming transcription: {e}")
                 # Continue accumulating audio even if streaming fails
@@ -659,12 +951,6 @@ async def handle_end_stream(
     # Mark session as ending FIRST (prevents race condition with incoming chunks)
     server.ending_sessions.add(session_id)
 
-    # Check rate limiting
-    if not server.check_rate_limit(client_ip):
-        server.ending_sessions.discard(session_id)
-        await send_error(websocket, "Rate limit exceeded. Max 10 requests per minute.", code="rate_limited")
-        return
-
     # Log chunk statistics (no waiting needed - WebSocket ensures order)
     expected_chunks = data.get("expected_chunks")
     if expected_chunks is not None:
@@ -698,11 +984,19 @@ async def handle_end_stream(
         await send_error(websocket, f"Unknown session: {session_id}")
         return
 
+    tail = _flush_session_resampler(server, session_id)
+    if tail is not None and pcm_session:
+        pcm_session["samples"].append(int16_to_float32(tail))
+
     try:
         # If using new streaming framework, finalize the session
         if streaming_session:
             try:
-                result = await streaming_session.finalize()
+                if tail is not None:
+                    with stage_timer("process_chunk"):
+                        await streaming_session.process_chunk(tail)
+                with stage_timer("finalize"):
+                    result = await streaming_session.finalize()
                 text = result.confirmed_text
                 duration = result.audio_duration_seconds
 
@@ -743,42 +1037,30 @@ async def handle_end_stream(
 
         # Batch mode: Use accumulated audio for transcription
         if pcm_session:
-            # PCM session: concatenate accumulated samples and create WAV
-            all_samples = (
-                np.concatenate(pcm_session["samples"]) if pcm_session["samples"] else np.array([], dtype=np.int16)
-            )
-            # Use 16kHz if samples were resampled, otherwise original rate
-            output_sample_rate = (
-                TARGET_SAMPLE_RATE if pcm_session.get("needs_resampling", False) else pcm_session["sample_rate"]
-            )
-            duration = len(all_samples) / output_sample_rate
-            wav_data = pcm_to_wav(all_samples, output_sample_rate, pcm_session["channels"])
+            # PCM session: contiguous view of the ring, already float32 and resampled to 16kHz on arrival
+            all_samples = _downmix_to_mono(pcm_session["samples"].view(), pcm_session["channels"])
+            duration = len(all_samples) / TARGET_SAMPLE_RATE
             logger.debug(
                 f"Client {client_id}: PCM stream ended (batch mode). "
-                f"Duration: {duration:.2f}s, Samples: {len(all_samples)}, Size: {len(wav_data)} bytes"
+                f"Duration: {duration:.2f}s, Samples: {len(all_samples)}"
             )
         elif decoder:
-            # Opus session: resample to 16kHz if needed before WAV
-            pcm_samples = decoder.get_pcm_array()
-            pcm_samples = _downmix_to_mono(pcm_samples, decoder.channels)
-            if decoder.sample_rate != TARGET_SAMPLE_RATE:
-                pcm_samples = resample_to_16k(pcm_samples, decoder.sample_rate)
-                duration = len(pcm_samples) / TARGET_SAMPLE_RATE
-                wav_data = pcm_to_wav(pcm_samples, TARGET_SAMPLE_RATE, 1)
-            else:
-                wav_data = pcm_to_wav(pcm_samples, decoder.sample_rate, 1)
-                duration = len(pcm_samples) / decoder.sample_rate
-
-            logger.debug(
-                f"Client {client_id}: Opus stream ended (batch mode). Duration: {duration:.2f}s, Size: {len(wav_data)} bytes"
-            )
+            # Opus session: resample to 16kHz if needed
+            all_samples = decoder.get_pcm_array()
+            all_samples = _downmix_to_mono(all_samples, decoder.channels)
+            with stage_timer("resample"):
+                all_samples = resample_to_16k(all_samples, decoder.sample_rate)
+            all_samples = int16_to_float32(all_samples)
+            duration = len(all_samples) / TARGET_SAMPLE_RATE
+
+            logger.debug(f"Client {client_id}: Opus stream ended (batch mode). Duration: {duration:.2f}s")
         else:
             # No audio data available
             await send_error(websocket, "No audio data in session")
             return
 
-        # Use common transcription logic
-        success, text, info = await transcribe_audio_from_wav(server, wav_data, client_id)
+        # Use common transcription logic, handing the samples to the backend without a WAV round-trip
+        success, text, info = await transcribe_audio_array(server, all_samples, client_id)
 
         if success:
             # Send successful response with streaming-specific fields
@@ -801,8 +1083,7 @@ async def handle_end_stream(
             await send_error(
                 websocket,
                 f"Stream transcription failed: {info.get('error', 'Unknown error')}",
-                code="internal_error",
-                retryable=True,
+                **transcription_error_kwargs(info, code="internal_error", retryable=True),
             )
 
     except Exception as e:
@@ -819,6 +1100,14 @@ async def handle_end_stream(
                 server.client_sessions.pop(client_id, None)
         if server.binary_stream_sessions.get(client_id) == session_id:
             server.binary_stream_sessions.pop(client_id, None)
+        frame_streams = server.frame_streams.get(client_id)
+        if frame_streams:
+            for stream_id in [k for k, v in frame_streams.items() if v["session_id"] == session_id]:
+                del frame_streams[stream_id]
+            if not frame_streams:
+                server.frame_streams.pop(client_id, None)
         server.wake_word_sessions.pop(session_id, None)
         server.wake_word_buffers.pop(session_id, None)
         server.wake_word_debug_sessions.pop(session_id, None)
+        server.partial_emitters.pop(session_id, None)
+        server.resamplers.pop(session_id, None)
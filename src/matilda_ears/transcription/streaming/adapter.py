@@ -8,11 +8,13 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+import sys
 from typing import Any
 
 import numpy as np
 
 from ...audio.conversion import int16_to_float32
+from ...audio.vad import VADStream, speech_probability
 from .types import StreamingConfig, StreamingResult
 
 logger = logging.getLogger(__name__)
@@ -71,8 +73,9 @@ class StreamingAdapter:
 
     SAMPLE_RATE = 16000
 
-    def __init__(self, config: StreamingConfig | None = None, vad: Any | None = None):
+    def __init__(self, config: StreamingConfig | None = None, vad: Any | None = None, executor: Any | None = None):
         self.config = config or StreamingConfig()
+        self._executor = executor
         self._wrapper: AlphaOmegaWrapper | None = None
         self._alpha_text = ""
         self._total_samples = 0
@@ -90,10 +93,23 @@ class StreamingAdapter:
         return self._initialized
 
     async def start(self) -> None:
-        """Initialize the ASR and processor."""
+        """Initialize the ASR and processor.
+
+        Model loading, hook installation and tokenizer construction are blocking,
+        so they run in an executor to keep the event loop serving other clients.
+        """
         if self._initialized:
             return
 
+        loop = asyncio.get_event_loop()
+        self._wrapper, vad = await loop.run_in_executor(self._executor, self._build)
+        if vad is not None:
+            self._vad = vad
+
+        self._initialized = True
+        logger.info("SimulStreaming initialized successfully")
+
+    def _build(self) -> tuple[AlphaOmegaWrapper, Any | None]:
         # Import vendored modules here to keep the rest of the package vendor-free.
         from .vendor import SimulWhisperASR, SimulWhisperOnline
 
@@ -123,22 +139,23 @@ class StreamingAdapter:
             static_init_prompt=None,
             max_context_tokens=None,
             logdir=None,
+            encoder_batch_window_ms=self.config.encoder_batch_window_ms,
         )
 
         online = SimulWhisperOnline(asr)
-        self._wrapper = AlphaOmegaWrapper(online)
+        wrapper = AlphaOmegaWrapper(online)
 
+        vad = None
         if self.config.vad_enabled and self._vad is None:
             try:
                 from ...audio.vad import SileroVAD
 
-                self._vad = SileroVAD(threshold=self.config.vad_threshold)
+                vad = SileroVAD(threshold=self.config.vad_threshold)
                 logger.info("SileroVAD enabled with threshold=%s", self.config.vad_threshold)
             except Exception as e:
                 logger.warning("SileroVAD unavailable (%s), continuing without VAD gating", e)
 
-        self._initialized = True
-        logger.info("SimulStreaming initialized successfully")
+        return wrapper, vad
 
     async def process_chunk(self, pcm_int16: np.ndarray) -> StreamingResult:
         if not self._initialized:
@@ -147,7 +164,7 @@ class StreamingAdapter:
         self._total_samples += len(pcm_int16)
 
         if self._vad:
-            speech_prob = self._vad.process_chunk(pcm_int16)
+            speech_prob = await speech_probability(self._vad, pcm_int16)
             if speech_prob < self._vad.threshold:
                 return self._last_result
 
@@ -170,7 +187,7 @@ class StreamingAdapter:
                     self._pending_audio = []
 
                     loop = asyncio.get_event_loop()
-                    result = await loop.run_in_executor(None, self._add_audio_chunks, pending)
+                    result = await loop.run_in_executor(self._executor, self._add_audio_chunks, pending)
 
                 alpha, omega = self._extract_alpha_omega(result)
                 self._merge_alpha(alpha)
@@ -191,6 +208,15 @@ class StreamingAdapter:
             raise RuntimeError("Adapter not started. Call start() first.")
 
         last = {"alpha": "", "omega": ""}
+        if self.config.coalesce_drain:
+            # Everything that arrived while the previous pass ran gets a single
+            # mel + encoder + decode pass, so cost tracks wall-clock audio, not packet count.
+            if not chunks:
+                return last
+            for chunk in chunks:
+                self._wrapper.insert_audio_chunk(int16_to_float32(chunk))
+            return self._wrapper.process_iter()
+
         for chunk in chunks:
             audio_f32 = int16_to_float32(chunk)
             self._wrapper.insert_audio_chunk(audio_f32)
@@ -221,7 +247,7 @@ class StreamingAdapter:
 
         try:
             loop = asyncio.get_event_loop()
-            final_result = await loop.run_in_executor(None, wrapper.finish)
+            final_result = await loop.run_in_executor(self._executor, wrapper.finish)
             alpha, _ = self._extract_alpha_omega(final_result)
             self._merge_alpha(alpha)
         finally:
@@ -238,9 +264,22 @@ class StreamingAdapter:
     async def reset(self) -> None:
         if self._wrapper is not None:
             self._wrapper.init(None)
+        if isinstance(self._vad, VADStream):
+            self._vad.reset_states()
         self._alpha_text = ""
         self._total_samples = 0
         self._pending_audio = []
         self._dirty = False
         self._inference_running = False
         self._last_result = StreamingResult()
+
+
+def release_shared_models() -> None:
+    """Drop the process-wide SimulWhisper models so the next session loads them afresh.
+
+    Sessions already running keep a reference to their model, which is freed once the last of them ends.
+    """
+    # Nothing has been loaded unless the vendored model pool was imported; do not import torch just to find out
+    pool_module = sys.modules.get(f"{__package__}.vendor.simul_whisper.model_pool")
+    if pool_module is not None:
+        pool_module.model_pool.clear()
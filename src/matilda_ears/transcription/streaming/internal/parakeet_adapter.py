@@ -6,6 +6,7 @@ from typing import Any
 
 import numpy as np
 
+from ....audio.vad import VADStream, speech_probability
 from ..types import StreamingConfig, StreamingResult
 
 logger = logging.getLogger(__name__)
@@ -19,9 +20,10 @@ class ParakeetStreamingAdapter:
     # This prevents triggering inference on every tiny chunk when VAD is unavailable
     MIN_BUFFER_SAMPLES = 4000
 
-    def __init__(self, backend, config: StreamingConfig | None = None, vad=None):
+    def __init__(self, backend, config: StreamingConfig | None = None, vad=None, executor=None):
         self.config = config or StreamingConfig(backend="parakeet")
         self._backend = backend
+        self._executor = executor
         self._initialized = False
         # Backend-provided context manager and transcriber are intentionally `Any`:
         # parakeet-mlx doesn't ship stable typing surfaces, and we treat it as a plugin.
@@ -32,7 +34,8 @@ class ParakeetStreamingAdapter:
         self._total_samples = 0
         self._pending_samples = 0  # Track pending samples for min buffer check
         self._vad = vad if self.config.vad_enabled else None
-        self._shared_vad = self._vad is not None
+        # A VADStream is this session's own state in the server's shared VAD engine
+        self._shared_vad = self._vad is not None and not isinstance(self._vad, VADStream)
         self._dirty = False
         self._inference_running = False
         self._pending_audio: list[np.ndarray] = []
@@ -48,25 +51,35 @@ class ParakeetStreamingAdapter:
             else:
                 raise RuntimeError("Parakeet backend is not ready")
 
-        self._transcriber_cm = self._backend.transcribe_stream(
+        # Entering the stream context and loading VAD block, so keep them off the event loop.
+        loop = asyncio.get_event_loop()
+        self._transcriber_cm, self._transcriber, vad = await loop.run_in_executor(self._executor, self._build)
+        if vad is not None:
+            self._vad = vad
+
+        self._initialized = True
+        logger.info("Parakeet streaming initialized successfully")
+
+    def _build(self) -> tuple[Any, Any, Any | None]:
+        transcriber_cm = self._backend.transcribe_stream(
             context_size=self.config.parakeet_context_size,
             depth=self.config.parakeet_depth,
         )
-        if self._transcriber_cm is None:
+        if transcriber_cm is None:
             raise RuntimeError("Parakeet backend returned no transcriber")
-        self._transcriber = self._transcriber_cm.__enter__()
+        transcriber = transcriber_cm.__enter__()
 
+        vad = None
         if self.config.vad_enabled and self._vad is None:
             try:
                 from ....audio.vad import SileroVAD
 
-                self._vad = SileroVAD(threshold=self.config.vad_threshold)
+                vad = SileroVAD(threshold=self.config.vad_threshold)
                 logger.info(f"SileroVAD enabled with threshold={self.config.vad_threshold}")
             except Exception as e:
                 logger.warning(f"SileroVAD unavailable ({e}), continuing without VAD gating")
 
-        self._initialized = True
-        logger.info("Parakeet streaming initialized successfully")
+        return transcriber_cm, transcriber, vad
 
     async def process_chunk(self, pcm_int16: np.ndarray) -> StreamingResult:
         if not self._initialized:
@@ -75,7 +88,7 @@ class ParakeetStreamingAdapter:
         self._total_samples += len(pcm_int16)
 
         if self._vad:
-            speech_prob = self._vad.process_chunk(pcm_int16)
+            speech_prob = await speech_probability(self._vad, pcm_int16)
             if speech_prob < self._vad.threshold:
                 return self._last_result
 
@@ -110,7 +123,7 @@ class ParakeetStreamingAdapter:
                     self._pending_samples = 0
 
                     loop = asyncio.get_event_loop()
-                    result = await loop.run_in_executor(None, self._add_audio_chunks, pending)
+                    result = await loop.run_in_executor(self._executor, self._add_audio_chunks, pending)
 
                 alpha, omega = self._extract_text(result)
                 self._merge_alpha(alpha)
@@ -131,6 +144,8 @@ class ParakeetStreamingAdapter:
         transcriber = self._transcriber
         if transcriber is None:
             raise RuntimeError("Parakeet transcriber is not initialized")
+        if self.config.coalesce_drain and len(chunks) > 1:
+            chunks = [np.concatenate(chunks)]
         for chunk in chunks:
             audio_f32 = chunk.astype(np.float32) / 32768.0
             last_result = transcriber.add_audio(audio_f32)
@@ -195,7 +210,7 @@ class ParakeetStreamingAdapter:
             transcriber = self._transcriber
             if transcriber is not None and hasattr(transcriber, "finish"):
                 loop = asyncio.get_event_loop()
-                final_result = await loop.run_in_executor(None, transcriber.finish)
+                final_result = await loop.run_in_executor(self._executor, transcriber.finish)
             alpha, _ = self._extract_text(final_result)
             self._merge_alpha(alpha)
         finally:
@@ -4,12 +4,18 @@ Wraps StreamingAdapter to provide the session interface expected by
 stream_handlers.py.
 """
 
+import asyncio
+import contextlib
+import logging
+
 import numpy as np
 from dataclasses import dataclass
 
 from .adapter import StreamingAdapter
 from .types import StreamingConfig
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class SessionResult:
@@ -26,8 +32,12 @@ class StreamingSession:
 
     Provides the interface expected by stream_handlers.py:
     - start() -> None
+    - start_in_background() -> None, then wait_until_ready() -> SessionResult
     - process_chunk(pcm_samples) -> SessionResult
     - finalize() -> SessionResult
+
+    When started in the background, chunks received while the model warms up
+    are buffered and fed to the adapter as soon as it is live.
     """
 
     def __init__(
@@ -37,13 +47,21 @@ class StreamingSession:
         backend=None,
         backend_name: str | None = None,
         vad=None,
+        *,
+        executor=None,
     ):
         self.session_id = session_id
         self.config = config or StreamingConfig()
         self.backend = backend
         self.backend_name = backend_name or ""
         self.vad = vad
+        self.executor = executor  # inference thread pool; None uses the event loop's default
+        # Whether transcription runs on ``backend``; SimulStreaming uses its own pooled Whisper model
+        self.uses_backend = False
         self._adapter = self._create_adapter()
+        self._start_task: asyncio.Task | None = None
+        self._warmup_audio: list[np.ndarray] = []
+        self._ready = False
 
     def _create_adapter(self):
         backend_name = (self.config.backend or self.backend_name).lower()
@@ -56,12 +74,50 @@ class StreamingSession:
                 raise RuntimeError("Parakeet streaming requires a backend instance")
             from .internal.parakeet_adapter import ParakeetStreamingAdapter
 
-            return ParakeetStreamingAdapter(self.backend, self.config, vad=self.vad)
-        return StreamingAdapter(self.config, vad=self.vad)
+            self.uses_backend = True
+            return ParakeetStreamingAdapter(self.backend, self.config, vad=self.vad, executor=self.executor)
+        return StreamingAdapter(self.config, vad=self.vad, executor=self.executor)
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether the adapter is live and chunks are transcribed immediately."""
+        return self._ready
 
     async def start(self) -> None:
         """Initialize the streaming session."""
         await self._adapter.start()
+        self._ready = True
+
+    def start_in_background(self) -> None:
+        """Begin initialization without blocking the caller.
+
+        Chunks passed to process_chunk() before the session is ready are
+        buffered; use wait_until_ready() to learn when it is live.
+        """
+        if self._start_task is None:
+            self._start_task = asyncio.create_task(self._warm_up())
+
+    async def wait_until_ready(self) -> SessionResult:
+        """Wait for background initialization and return the result of the buffered audio."""
+        if self._start_task is None:
+            self.start_in_background()
+        return await asyncio.shield(self._start_task)
+
+    async def _warm_up(self) -> SessionResult:
+        try:
+            await self._adapter.start()
+        except BaseException:
+            self._warmup_audio = []
+            raise
+        result = SessionResult()
+        # Drain whatever arrived while the model was loading. New chunks may be
+        # buffered while we await, so keep going until the buffer stays empty.
+        while self._warmup_audio:
+            pending = self._warmup_audio
+            self._warmup_audio = []
+            result = await self._process(np.concatenate(pending))
+        self._ready = True
+        return result
 
     async def process_chunk(self, pcm_samples: np.ndarray) -> SessionResult:
         """Process an audio chunk and return partial results.
@@ -73,6 +129,17 @@ class StreamingSession:
             SessionResult with confirmed (alpha) and tentative (omega) text
 
         """
+        if not self._ready and self._start_task is not None:
+            if self._start_task.done():
+                # Warm-up failed or was aborted; surface that instead of buffering forever.
+                if self._start_task.cancelled():
+                    raise RuntimeError(f"Streaming session {self.session_id} was aborted")
+                self._start_task.result()
+            self._warmup_audio.append(pcm_samples)
+            return SessionResult()
+        return await self._process(pcm_samples)
+
+    async def _process(self, pcm_samples: np.ndarray) -> SessionResult:
         result = await self._adapter.process_chunk(pcm_samples)
         return SessionResult(
             confirmed_text=result.alpha_text,
@@ -83,6 +150,12 @@ class StreamingSession:
 
     async def finalize(self) -> SessionResult:
         """Finalize the session and get remaining text."""
+        if self._start_task is not None and not self._ready:
+            # Let the warm-up finish so audio buffered during it is transcribed.
+            try:
+                await self.wait_until_ready()
+            except Exception as e:
+                logger.warning(f"Streaming session {self.session_id} failed to start: {e}")
         result = await self._adapter.finalize()
         return SessionResult(
             confirmed_text=result.alpha_text,
@@ -93,8 +166,14 @@ class StreamingSession:
 
     async def reset(self) -> None:
         """Reset for a new session."""
+        self._warmup_audio = []
         await self._adapter.reset()
 
     async def abort(self) -> None:
         """Abort active streaming and release resources."""
+        if self._start_task is not None and not self._start_task.done():
+            self._start_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await self._start_task
+        self._warmup_audio = []
         await self._adapter.reset()
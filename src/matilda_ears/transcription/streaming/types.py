@@ -43,6 +43,8 @@ class StreamingConfig:
     never_fire: bool = True  # Always show omega (unstable last word)
     vad_enabled: bool = True  # Skip silence with VAD gating
     vad_threshold: float = 0.5  # Speech probability threshold
+    encoder_batch_window_ms: float = 15.0  # Batch encoder calls of concurrent sessions (0 = off)
+    coalesce_drain: bool = True  # One inference pass per drain of pending chunks (False: one per chunk)
     parakeet_context_size: tuple[int, int] = (128, 128)
     parakeet_depth: int = 1
 
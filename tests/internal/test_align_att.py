@@ -0,0 +1,41 @@
+import pytest
+
+
+def _full_recompute(torch, attns, align_source, num_align_heads, content_mel_len):
+    """The aggregation infer() used to do on every step, over all stored attention matrices."""
+    from matilda_ears.transcription.streaming.vendor.simul_whisper.whisper.timing import median_filter
+
+    per_head = [[] for _ in range(num_align_heads)]
+    for layer_rank, qk in attns:
+        attn = torch.softmax(qk, dim=-1)
+        for rank, head_id in align_source.get(layer_rank, []):
+            per_head[rank].append(attn[:, head_id])
+    stacked = torch.stack([torch.cat(mats, dim=1) for mats in per_head], dim=1)
+    std, mean = torch.std_mean(stacked, dim=-2, keepdim=True, unbiased=False)
+    stacked = median_filter((stacked - mean) / std, 7).mean(dim=1)[:, :, :content_mel_len]
+    return torch.argmax(stacked[:, -1, :], dim=-1)
+
+
+def test_alignment_attention_matches_full_recompute():
+    torch = pytest.importorskip("torch")
+    from matilda_ears.transcription.streaming.vendor.simul_whisper.align_att import AlignmentAttention
+
+    torch.manual_seed(0)
+    align_source = {0: [(0, 1)], 2: [(1, 0), (2, 3)]}
+    aggregator = AlignmentAttention(align_source, num_align_heads=3)
+    beams, heads, frames = 2, 4, 50
+    attns = []
+
+    # the first pass decodes the whole prompt, then one token per step
+    for step, token_len in enumerate([4, 1, 1, 1, 1, 1]):
+        for layer_rank in range(3):
+            qk = torch.randn(beams, heads, token_len, frames) * 3
+            attns.append((layer_rank, qk))
+            aggregator.add(layer_rank, qk)
+
+        expected = _full_recompute(torch, attns, align_source, 3, content_mel_len=40)
+        assert torch.equal(aggregator.most_attended_frames(40), expected)
+        assert len(aggregator) == 4 + step
+
+    aggregator.reset()
+    assert len(aggregator) == 0
@@ -0,0 +1,70 @@
+import threading
+import time
+
+import pytest
+
+
+class RecordingEncoder:
+    def __init__(self, torch):
+        self.torch = torch
+        self.batch_sizes = []
+
+    def __call__(self, mel):
+        self.batch_sizes.append(mel.shape[0])
+        return mel * 2
+
+
+def test_concurrent_sessions_share_one_encoder_pass():
+    torch = pytest.importorskip("torch")
+    from matilda_ears.transcription.streaming.vendor.simul_whisper.encoder_batcher import EncoderBatcher
+
+    encoder = RecordingEncoder(torch)
+    batcher = EncoderBatcher(encoder, window=1.0)
+    ready = threading.Barrier(3)
+    results = {}
+
+    def session(i):
+        with batcher.pending():
+            ready.wait()
+            results[i] = batcher.encode(torch.full((1, 2, 3), float(i)))
+
+    threads = [threading.Thread(target=session, args=(i,)) for i in range(3)]
+    start = time.monotonic()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=5)
+
+    # every session arrived, so the batch was flushed without waiting for the whole window
+    assert time.monotonic() - start < 1.0
+    assert encoder.batch_sizes == [3]
+    for i in range(3):
+        assert torch.equal(results[i], torch.full((1, 2, 3), 2.0 * i))
+
+
+def test_single_session_does_not_wait_for_window():
+    torch = pytest.importorskip("torch")
+    from matilda_ears.transcription.streaming.vendor.simul_whisper.encoder_batcher import EncoderBatcher
+
+    encoder = RecordingEncoder(torch)
+    batcher = EncoderBatcher(encoder, window=5.0)
+
+    start = time.monotonic()
+    with batcher.pending():
+        out = batcher.encode(torch.ones(1, 2, 3))
+
+    assert time.monotonic() - start < 1.0
+    assert encoder.batch_sizes == [1]
+    assert torch.equal(out, torch.full((1, 2, 3), 2.0))
+
+
+def test_encoder_errors_reach_every_waiting_session():
+    torch = pytest.importorskip("torch")
+    from matilda_ears.transcription.streaming.vendor.simul_whisper.encoder_batcher import EncoderBatcher
+
+    def failing(mel):
+        raise RuntimeError("boom")
+
+    batcher = EncoderBatcher(failing, window=0.01)
+    with batcher.pending(), pytest.raises(RuntimeError, match="boom"):
+        batcher.encode(torch.ones(1, 2, 3))
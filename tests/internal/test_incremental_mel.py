@@ -0,0 +1,61 @@
+import pytest
+
+
+def _reference(torch, segments):
+    from matilda_ears.transcription.streaming.vendor.simul_whisper.whisper.audio import (
+        N_FRAMES,
+        N_SAMPLES,
+        log_mel_spectrogram,
+        pad_or_trim,
+    )
+
+    mel_padded = log_mel_spectrogram(torch.cat(segments), n_mels=80, padding=N_SAMPLES).unsqueeze(0)
+    mel = pad_or_trim(mel_padded, N_FRAMES)
+    return mel, int((mel_padded.shape[2] - mel.shape[2]) / 2)
+
+
+def test_incremental_mel_matches_full_recompute():
+    torch = pytest.importorskip("torch")
+    from matilda_ears.transcription.streaming.vendor.simul_whisper.incremental_mel import IncrementalLogMel
+
+    torch.manual_seed(0)
+    mel_cache = IncrementalLogMel(n_mels=80)
+    segments = []
+    # includes a segment shorter than the STFT window and one that is not a multiple of the hop length
+    for step, length in enumerate([120, 960, 4800, 1234, 3200, 960, 16000, 800]):
+        segments.append(torch.randn(length) * 0.1)
+        if step in (4, 6):
+            mel_cache.drop(segments[0].shape[0])
+            segments = segments[1:]
+
+        mel, content_mel_len = mel_cache.update(segments)
+        expected, expected_len = _reference(torch, segments)
+
+        assert content_mel_len == expected_len
+        assert mel.shape == expected.shape
+        assert torch.allclose(mel, expected, atol=1e-5)
+
+
+def test_incremental_mel_only_computes_new_frames(monkeypatch):
+    torch = pytest.importorskip("torch")
+    from matilda_ears.transcription.streaming.vendor.simul_whisper import incremental_mel
+
+    computed = []
+    original = incremental_mel.IncrementalLogMel._raw_frames
+
+    def counting(self, segments, length, start, stop):
+        computed.append(stop - start)
+        return original(self, segments, length, start, stop)
+
+    monkeypatch.setattr(incremental_mel.IncrementalLogMel, "_raw_frames", counting)
+
+    mel_cache = incremental_mel.IncrementalLogMel(n_mels=80)
+    segments = [torch.randn(16000)]
+    mel_cache.update(segments)
+    computed.clear()
+
+    segments.append(torch.randn(1600))
+    mel_cache.update(segments)
+
+    # 10 new hops plus the few frames that still overlap the end of the buffer
+    assert sum(computed) < 15
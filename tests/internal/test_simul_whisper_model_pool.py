@@ -0,0 +1,111 @@
+from types import SimpleNamespace
+
+import pytest
+
+
+def _tiny_whisper(torch):
+    from matilda_ears.transcription.streaming.vendor.simul_whisper.whisper.model import ModelDimensions, Whisper
+
+    torch.manual_seed(0)
+    dims = ModelDimensions(
+        n_mels=80,
+        n_audio_ctx=8,
+        n_audio_state=16,
+        n_audio_head=2,
+        n_audio_layer=1,
+        n_vocab=64,
+        n_text_ctx=16,
+        n_text_state=16,
+        n_text_head=2,
+        n_text_layer=2,
+    )
+    return Whisper(dims).eval()
+
+
+def test_model_pool_loads_each_checkpoint_once():
+    torch = pytest.importorskip("torch")
+
+    from matilda_ears.transcription.streaming.vendor.simul_whisper.model_pool import WhisperModelPool
+
+    pool = WhisperModelPool()
+    loads = []
+
+    def loader(device):
+        loads.append(device)
+        return _tiny_whisper(torch)
+
+    first = pool.get("/models/tiny.pt", loader, device="cpu")
+    second = pool.get("/models/tiny.pt", loader, device="cpu")
+
+    assert first is second
+    assert loads == ["cpu"]
+    assert len(pool) == 1
+    assert first.max_text_len == 16
+    assert first.num_decoder_layers == 2
+
+
+def test_shared_model_hooks_route_to_active_state():
+    torch = pytest.importorskip("torch")
+
+    from matilda_ears.transcription.streaming.vendor.simul_whisper.align_att import AlignmentAttention
+    from matilda_ears.transcription.streaming.vendor.simul_whisper.model_pool import (
+        PreallocatedKVCache,
+        WhisperModelPool,
+    )
+
+    shared = WhisperModelPool().get("/models/tiny.pt", lambda device: _tiny_whisper(torch), device="cpu")
+    audio_features = torch.randn(1, 8, 16)
+    tokens = torch.tensor([[1, 2, 3]])
+
+    def session():
+        return SimpleNamespace(
+            align_attn=AlignmentAttention(shared.align_source, shared.num_align_heads),
+            kv_cache=PreallocatedKVCache(16),
+        )
+
+    session_a = session()
+    session_b = session()
+
+    with torch.no_grad():
+        with shared.activate(session_a):
+            shared.model.decoder(tokens, audio_features, kv_cache=session_a.kv_cache)
+        # Outside of activate() the hooks are inert.
+        shared.model.decoder(tokens, audio_features)
+
+    assert len(session_a.align_attn) == 3
+    assert session_a.kv_cache
+    assert len(session_b.align_attn) == 0
+    assert session_b.kv_cache == {}
+    assert shared.active_state is None
+
+
+def test_preallocated_kv_cache_appends_and_reorders_in_place():
+    torch = pytest.importorskip("torch")
+
+    from matilda_ears.transcription.streaming.vendor.simul_whisper.model_pool import PreallocatedKVCache
+
+    cache = PreallocatedKVCache(capacity=8)
+    first = torch.randn(2, 3, 4)
+    second = torch.randn(2, 1, 4)
+
+    cache.append("k", first)
+    buffer = cache["k"].data_ptr()
+    out = cache.append("k", second)
+
+    assert out.shape == (2, 4, 4)
+    assert torch.equal(out, torch.cat([first, second], dim=1))
+    assert cache["k"].data_ptr() == buffer
+
+    cache.reorder(["k"], [1, 1])
+    assert torch.equal(cache["k"][0], torch.cat([first, second], dim=1)[1])
+    assert cache["k"].data_ptr() == buffer
+
+    cache.clear()
+    assert not cache
+    cache.append("k", second)
+    assert cache["k"].shape == (2, 1, 4)
+    assert cache["k"].data_ptr() == buffer
+
+    # grows past the capacity instead of failing
+    cache.append("k", torch.randn(2, 10, 4))
+    assert cache["k"].shape == (2, 11, 4)
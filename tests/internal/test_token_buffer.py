@@ -0,0 +1,66 @@
+import pytest
+
+
+@pytest.fixture
+def tokenizer():
+    pytest.importorskip("torch")
+    pytest.importorskip("tiktoken")
+    from matilda_ears.transcription.streaming.vendor.simul_whisper.whisper import tokenizer
+
+    return tokenizer.get_tokenizer(multilingual=True, language="en", task="transcribe")
+
+
+class CountingTokenizer:
+    def __init__(self, tokenizer):
+        self.tokenizer = tokenizer
+        self.encodes = 0
+        self.decodes = 0
+
+    def encode(self, text):
+        self.encodes += 1
+        return self.tokenizer.encode(text)
+
+    def decode(self, ids):
+        self.decodes += 1
+        return self.tokenizer.decode(ids)
+
+    def split_to_word_tokens(self, ids):
+        return self.tokenizer.split_to_word_tokens(ids)
+
+
+def test_token_ids_are_kept_without_reencoding(tokenizer):
+    from matilda_ears.transcription.streaming.vendor.token_buffer import TokenBuffer
+
+    counting = CountingTokenizer(tokenizer)
+    buffer = TokenBuffer.from_text(" Hello there.", tokenizer=counting, prefix_token_ids=[tokenizer.sot_prev])
+    assert counting.encodes == 1
+
+    new_ids = tokenizer.encode(" How are you")
+    buffer.append_token_ids(new_ids)
+    for _ in range(3):
+        ids = buffer.as_token_ids()
+
+    assert ids == [tokenizer.sot_prev] + tokenizer.encode(" Hello there.") + new_ids
+    assert counting.encodes == 1
+    assert counting.decodes == 0
+    assert buffer.as_text() == " Hello there. How are you"
+    assert buffer.as_text() == " Hello there. How are you"
+    assert counting.decodes == 1
+
+
+def test_trim_words_keeps_static_prompt(tokenizer):
+    from matilda_ears.transcription.streaming.vendor.token_buffer import TokenBuffer
+
+    buffer = TokenBuffer.from_text(" Glossary: Matilda.", tokenizer=tokenizer)
+    static = len(buffer)
+    buffer.append_text(" one two three")
+
+    first = buffer.trim_words(after=static)
+    second = buffer.trim_words(after=static)
+
+    assert first == len(tokenizer.encode(" one"))
+    assert second == len(tokenizer.encode(" two"))
+    assert buffer.as_text() == " Glossary: Matilda. three"
+    assert buffer.trim_words(after=static) > 0
+    assert buffer.trim_words(after=static) == 0
+    assert buffer.as_text() == " Glossary: Matilda."
@@ -0,0 +1,61 @@
+import hashlib
+import os
+from pathlib import Path
+
+import pytest
+
+
+def _fake_checkpoint(root, content=b"fake whisper checkpoint"):
+    path = os.path.join(root, "tiny.pt")
+    with open(path, "wb") as f:
+        f.write(content)
+    sha256 = hashlib.sha256(content).hexdigest()
+    return path, f"https://example.invalid/models/{sha256}/tiny.pt"
+
+
+def test_download_hashes_cached_checkpoint_once(tmp_path, monkeypatch):
+    pytest.importorskip("torch")
+    from matilda_ears.transcription.streaming.vendor.simul_whisper import whisper
+
+    path, url = _fake_checkpoint(str(tmp_path))
+    calls = []
+    original = whisper._sha256_file
+
+    def counting_sha256(p):
+        calls.append(p)
+        return original(p)
+
+    monkeypatch.setattr(whisper, "_sha256_file", counting_sha256)
+
+    assert whisper._download(url, str(tmp_path), in_memory=False) == path
+    assert whisper._download(url, str(tmp_path), in_memory=False) == path
+    assert whisper._download(url, str(tmp_path), in_memory=True) == b"fake whisper checkpoint"
+
+    assert calls == [path]
+    assert Path(path + ".sha256.json").is_file()
+
+
+def test_checksum_cache_invalidated_when_file_changes(tmp_path, monkeypatch):
+    pytest.importorskip("torch")
+    from matilda_ears.transcription.streaming.vendor.simul_whisper import whisper
+
+    path, _ = _fake_checkpoint(str(tmp_path))
+    assert whisper._verified_sha256(path) == hashlib.sha256(b"fake whisper checkpoint").hexdigest()
+
+    with open(path, "wb") as f:
+        f.write(b"a different, longer checkpoint")
+
+    assert whisper._verified_sha256(path) == hashlib.sha256(b"a different, longer checkpoint").hexdigest()
+
+
+def test_load_checkpoint_memory_maps_file(tmp_path):
+    torch = pytest.importorskip("torch")
+    from matilda_ears.transcription.streaming.vendor.simul_whisper import whisper
+
+    path = str(tmp_path / "ckpt.pt")
+    torch.save({"dims": {"n_mels": 80}, "model_state_dict": {"w": torch.arange(4.0)}}, path)
+
+    checkpoint = whisper._load_checkpoint(path, "cpu")
+
+    assert checkpoint["dims"] == {"n_mels": 80}
+    assert torch.equal(checkpoint["model_state_dict"]["w"], torch.arange(4.0))
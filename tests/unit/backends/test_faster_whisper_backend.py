@@ -146,6 +146,23 @@ class TestFasterWhisperBackend:
                 no_speech_threshold=0.6,
             )
 
+    def test_backend_transcribe_array_passes_samples(self, mock_config, mock_whisper_model):
+        """Verify in-memory audio is handed to faster-whisper without a file."""
+        import numpy as np
+
+        with patch("matilda_ears.transcription.backends.internal.faster_whisper.get_config", return_value=mock_config):
+            from matilda_ears.transcription.backends.internal.faster_whisper import FasterWhisperBackend
+
+            backend = FasterWhisperBackend()
+            backend.model = mock_whisper_model
+
+            audio = np.zeros(16000, dtype=np.float32)
+            text, metadata = backend.transcribe_array(audio, language="en")
+
+            assert text == "Test transcription"
+            assert metadata["duration"] == 2.5
+            assert mock_whisper_model.transcribe.call_args.args[0] is audio
+
     def test_backend_transcribe_not_loaded(self, mock_config):
         """Verify transcribe() raises RuntimeError if model not loaded."""
         with patch("matilda_ears.transcription.backends.internal.faster_whisper.get_config", return_value=mock_config):
@@ -168,6 +168,25 @@ class TestHuggingFaceBackend:
             assert metadata["backend"] == "huggingface"
             assert metadata["model"] == "openai/whisper-base"
 
+    def test_backend_transcribe_array_passes_raw_samples(self, mock_config, mock_pipeline):
+        """Verify in-memory audio reaches the pipeline as raw samples, not a file."""
+        import numpy as np
+
+        with patch("matilda_ears.transcription.backends.internal.huggingface.get_config", return_value=mock_config):
+            from matilda_ears.transcription.backends.internal.huggingface import HuggingFaceBackend
+
+            backend = HuggingFaceBackend()
+            backend.pipe = mock_pipeline
+            backend.device = "cpu"
+
+            audio = np.zeros(16000, dtype=np.float32)
+            text, _metadata = backend.transcribe_array(audio, language="en")
+
+            assert text == "Test transcription from HuggingFace"
+            inputs = mock_pipeline.call_args.args[0]
+            assert inputs["sampling_rate"] == 16000
+            assert inputs["raw"] is audio
+
     def test_backend_transcribe_not_loaded(self, mock_config):
         """Verify transcribe() raises RuntimeError if model not loaded."""
         with patch("matilda_ears.transcription.backends.internal.huggingface.get_config", return_value=mock_config):
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import os
+import wave
+
+import numpy as np
+
+from matilda_ears.transcription.backends import TranscriptionBackend
+from matilda_ears.transcription.backends.internal.dummy import DummyBackend
+
+
+class _FileOnlyBackend(TranscriptionBackend):
+    def __init__(self) -> None:
+        self.paths: list[str] = []
+        self.frames = b""
+
+    async def load(self):
+        pass
+
+    def transcribe(self, audio_path: str, language: str = "en") -> tuple[str, dict]:
+        self.paths.append(audio_path)
+        with wave.open(audio_path, "rb") as wav_file:
+            assert wav_file.getframerate() == 16000
+            assert wav_file.getnchannels() == 1
+            self.frames = wav_file.readframes(wav_file.getnframes())
+        return "from file", {"language": language}
+
+    @property
+    def is_ready(self) -> bool:
+        return True
+
+
+def test_transcribe_array_falls_back_to_a_temporary_wav() -> None:
+    backend = _FileOnlyBackend()
+    audio = np.array([0.0, 0.5, -0.5, 1.0], dtype=np.float32)
+
+    text, info = backend.transcribe_array(audio, language="de")
+
+    assert (text, info) == ("from file", {"language": "de"})
+    assert np.frombuffer(backend.frames, dtype=np.int16).tolist() == [0, 16384, -16384, 32767]
+    assert not os.path.exists(backend.paths[0])
+
+
+def test_dummy_backend_transcribes_arrays_natively() -> None:
+    text, info = DummyBackend(text="hi").transcribe_array(np.zeros(8000, dtype=np.float32))
+
+    assert text == "hi"
+    assert info["duration"] == 0.5
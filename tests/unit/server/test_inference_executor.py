@@ -0,0 +1,175 @@
+import asyncio
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from matilda_ears.service.health import health_handler
+from matilda_ears.transcription.server.internal.inference_executor import (
+    InferenceExecutor,
+    ServerBusyError,
+    default_workers,
+)
+from matilda_ears.transcription.server.internal.transcription import send_error, transcribe_audio_from_wav
+
+
+class _RecordingWebSocket:
+    def __init__(self):
+        self.messages = []
+
+    async def send(self, message):
+        self.messages.append(json.loads(message))
+
+
+def test_default_pool_is_sized_from_the_cpu_count(monkeypatch):
+    monkeypatch.setattr("matilda_ears.transcription.server.internal.inference_executor.os.cpu_count", lambda: 8)
+
+    executor = InferenceExecutor()
+    executor.shutdown()
+
+    assert default_workers() == 12
+    assert executor.workers == 12
+    assert InferenceExecutor(workers=1).workers == 1
+
+
+def test_admit_rejects_when_queue_is_full():
+    executor = InferenceExecutor(workers=1, max_queue=1, latency_budget_seconds=0)
+    release = threading.Event()
+    try:
+        running = executor.submit(release.wait)
+        queued = executor.submit(lambda: None)
+        # the first job holds the only worker, the second fills the queue
+        deadline = time.monotonic() + 2
+        while executor.get_stats()["running"] != 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert executor.queue_depth == 1
+
+        with pytest.raises(ServerBusyError) as excinfo:
+            executor.admit()
+        assert excinfo.value.retry_after >= 1
+        assert executor.get_stats()["rejected"] == 1
+    finally:
+        release.set()
+    running.result(timeout=2)
+    queued.result(timeout=2)
+    executor.admit()
+    executor.shutdown()
+
+
+def test_admit_rejects_when_estimated_wait_exceeds_budget():
+    executor = InferenceExecutor(workers=1, max_queue=0, latency_budget_seconds=0.05)
+    executor.submit(time.sleep, 0.1).result(timeout=2)
+    release = threading.Event()
+    try:
+        blocker = executor.submit(release.wait)
+        executor.submit(lambda: None)
+        # two jobs ahead at ~0.1 s each
+        assert executor.estimated_wait() == pytest.approx(0.2, abs=0.05)
+        with pytest.raises(ServerBusyError):
+            executor.admit()
+    finally:
+        release.set()
+    blocker.result(timeout=2)
+    executor.shutdown()
+
+    stats = executor.get_stats()
+    assert stats["completed"] == 3
+    assert stats["avg_service_seconds"] > 0
+    assert stats["queue_depth"] == 0
+
+
+@pytest.mark.asyncio
+async def test_transcribe_reports_server_busy_without_running_backend():
+    class _Backend:
+        is_ready = True
+        calls = 0
+
+        def transcribe(self, _path, language="en"):
+            self.calls += 1
+            return "text", {}
+
+    class _BusyExecutor:
+        def admit(self):
+            raise ServerBusyError("Server busy: inference queue is full", retry_after=4.0)
+
+    backend = _Backend()
+    server = SimpleNamespace(backend=backend, transcription_semaphore=None, inference_executor=_BusyExecutor())
+
+    success, text, info = await transcribe_audio_from_wav(server, b"RIFF" + b"\x00" * 2000, "client-busy")
+
+    assert success is False
+    assert text == ""
+    assert info["code"] == "server_busy"
+    assert info["retry_after"] == 4.0
+    assert backend.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_transcribe_runs_on_inference_executor():
+    class _Backend:
+        is_ready = True
+
+        def transcribe(self, _path, language="en"):
+            return threading.current_thread().name, {"duration": 1.0, "language": language}
+
+    executor = InferenceExecutor(workers=1)
+    server = SimpleNamespace(backend=_Backend(), transcription_semaphore=None, inference_executor=executor)
+
+    success, text, _info = await transcribe_audio_from_wav(server, b"RIFF" + b"\x00" * 2000, "client-1")
+    executor.shutdown()
+
+    assert success is True
+    assert text.startswith("matilda-inference")
+    assert executor.get_stats()["completed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_send_error_includes_retry_after():
+    ws = _RecordingWebSocket()
+
+    await send_error(ws, "Server busy", code="server_busy", retryable=True, retry_after=3.0)
+    await send_error(ws, "Bad request")
+
+    assert ws.messages[0]["error"] == {
+        "message": "Server busy",
+        "code": "server_busy",
+        "retryable": True,
+        "retry_after": 3.0,
+    }
+    assert "retry_after" not in ws.messages[1]["error"]
+
+
+@pytest.mark.asyncio
+async def test_health_handler_reports_inference_queue():
+    executor = InferenceExecutor(workers=3, max_queue=8)
+    server = SimpleNamespace(
+        backend_name="faster_whisper",
+        backend=SimpleNamespace(is_ready=True),
+        connected_clients=set(),
+        streaming_sessions={},
+        pcm_sessions={},
+        opus_decoder=SimpleNamespace(get_active_sessions=list),
+        ending_sessions=set(),
+        inference_executor=executor,
+    )
+
+    response = await health_handler(server, request=None)
+    payload = json.loads(response.text)
+    executor.shutdown()
+
+    assert payload["inference"]["workers"] == 3
+    assert payload["inference"]["queue_depth"] == 0
+    assert payload["inference"]["max_queue"] == 8
+
+
+def test_executor_works_with_run_in_executor():
+    executor = InferenceExecutor(workers=2)
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        return await asyncio.gather(*(loop.run_in_executor(executor, pow, i, 2) for i in range(4)))
+
+    assert asyncio.run(run()) == [0, 1, 4, 9]
+    executor.shutdown()
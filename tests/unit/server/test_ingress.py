@@ -0,0 +1,189 @@
+import asyncio
+import base64
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from matilda_ears.schemas.frames import CODEC_OPUS, CODEC_PCM16, AudioFrame, decode_frame
+from matilda_ears.transcription.server.core import MatildaWebSocketServer
+from matilda_ears.transcription.server.internal.ingress import (
+    INGRESS_COALESCE,
+    INGRESS_DISCONNECT,
+    INGRESS_DROP_OLDEST,
+    IngressOverflowError,
+    IngressQueue,
+    is_audio_message,
+)
+
+
+def _pcm_chunk(data: bytes, session_id="s1"):
+    return {
+        "type": "pcm_chunk",
+        "session_id": session_id,
+        "sample_rate": 16000,
+        "channels": 1,
+        "audio_data": base64.b64encode(data).decode(),
+    }
+
+
+async def _drain(queue):
+    queue.close()
+    items = []
+    while (item := await queue.get()) is not None:
+        items.append(item)
+    return items
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_discards_audio_but_keeps_control_messages():
+    totals = {}
+    queue = IngressQueue(max_size=2, totals=totals)
+    queue.put({"type": "start_stream"})
+    for i in range(4):
+        queue.put({"type": "audio_chunk", "n": i}, audio=True)
+    queue.put({"type": "end_stream"})
+
+    items = await _drain(queue)
+
+    assert [item.get("n", item["type"]) for item in items] == ["start_stream", 2, 3, "end_stream"]
+    assert queue.stats["dropped"] == 2
+    assert totals["dropped"] == 2
+
+
+@pytest.mark.asyncio
+async def test_coalesce_merges_pcm_chunks_of_the_same_session():
+    queue = IngressQueue(max_size=1, policy=INGRESS_COALESCE)
+    queue.put(_pcm_chunk(b"\x01\x00"), audio=True)
+    queue.put(_pcm_chunk(b"\x02\x00"), audio=True)
+    queue.put(_pcm_chunk(b"\x03\x00"), audio=True)
+
+    items = await _drain(queue)
+
+    assert len(items) == 1
+    assert base64.b64decode(items[0]["audio_data"]) == b"\x01\x00\x02\x00\x03\x00"
+    assert queue.stats["coalesced"] == 2
+
+
+@pytest.mark.asyncio
+async def test_coalesce_merges_pcm_frames_and_drops_opus():
+    def frame(seq, codec, payload):
+        return AudioFrame(stream_id=1, seq=seq, codec=codec, sample_rate=16000, channels=1, payload=payload).encode()
+
+    queue = IngressQueue(max_size=1, policy=INGRESS_COALESCE)
+    queue.put(frame(0, CODEC_PCM16, b"ab"), audio=True)
+    queue.put(frame(1, CODEC_PCM16, b"cd"), audio=True)
+    merged = decode_frame((await _drain(queue))[0])
+    assert (merged.seq, merged.payload) == (1, b"abcd")
+
+    queue = IngressQueue(max_size=1, policy=INGRESS_COALESCE)
+    queue.put(frame(0, CODEC_OPUS, b"ab"), audio=True)
+    queue.put(frame(1, CODEC_OPUS, b"cd"), audio=True)
+    assert [decode_frame(item).seq for item in await _drain(queue)] == [1]
+    assert queue.stats == {"received": 2, "dropped": 1, "coalesced": 0, "high_water": 1}
+
+
+def test_disconnect_policy_raises_on_overflow():
+    totals = {}
+    queue = IngressQueue(max_size=1, policy=INGRESS_DISCONNECT, totals=totals)
+    queue.put(b"ME-frame", audio=True)
+
+    with pytest.raises(IngressOverflowError):
+        queue.put(b"ME-frame", audio=True)
+    assert totals["disconnected"] == 1
+
+
+def test_is_audio_message():
+    assert is_audio_message({"type": "pcm_chunk"})
+    assert is_audio_message(b"ME\x02rest")
+    assert is_audio_message(b"opus", binary_stream=True)
+    assert not is_audio_message(b"RIFF....WAVE")
+    assert not is_audio_message({"type": "end_stream"})
+
+
+class _ScriptedWebSocket:
+    def __init__(self, messages):
+        self.remote_address = ("127.0.0.1", 9999)
+        self.request_headers = {}
+        self.sent = []
+        self.closed_with = None
+        self._messages = list(messages)
+
+    async def send(self, message):
+        self.sent.append(json.loads(message))
+
+    async def close(self, code=1000, reason=""):
+        self.closed_with = code
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._messages:
+            raise StopAsyncIteration
+        await asyncio.sleep(0)
+        return self._messages.pop(0)
+
+
+def _fake_server(process_message, **overrides):
+    server = SimpleNamespace(
+        connected_clients=set(),
+        binary_stream_sessions={},
+        client_sessions={},
+        process_message=process_message,
+        backend=SimpleNamespace(is_ready=True),
+        ingress_queue_size=64,
+        ingress_overflow=INGRESS_DROP_OLDEST,
+        ingress_stats={"dropped": 0, "coalesced": 0, "disconnected": 0},
+        client_tenants={},
+        frame_streams={},
+    )
+    for key, value in overrides.items():
+        setattr(server, key, value)
+    return server
+
+
+@pytest.mark.asyncio
+async def test_handle_client_keeps_reading_while_a_message_is_processed():
+    release = asyncio.Event()
+    handled = []
+
+    async def process_message(_ws, data, _ip, _client_id):
+        if data["type"] == "start_stream":
+            await release.wait()
+        handled.append(data.get("n", data["type"]))
+
+    messages = [json.dumps({"type": "start_stream"})]
+    messages += [json.dumps({"type": "pcm_chunk", "n": i}) for i in range(5)]
+    messages.append(json.dumps({"type": "end_stream"}))
+    ws = _ScriptedWebSocket(messages)
+    server = _fake_server(process_message, ingress_queue_size=3)
+
+    task = asyncio.create_task(MatildaWebSocketServer.handle_client(server, ws))
+    while ws._messages:
+        await asyncio.sleep(0)
+    # the whole stream was read while start_stream was still being handled
+    assert handled == []
+    release.set()
+    await task
+
+    assert handled == ["start_stream", 2, 3, 4, "end_stream"]
+    assert server.ingress_stats["dropped"] == 2
+
+
+@pytest.mark.asyncio
+async def test_handle_client_disconnects_on_overflow_with_disconnect_policy():
+    release = asyncio.Event()
+
+    async def process_message(_ws, _data, _ip, _client_id):
+        await release.wait()
+
+    messages = [json.dumps({"type": "pcm_chunk", "n": i}) for i in range(4)]
+    ws = _ScriptedWebSocket(messages)
+    server = _fake_server(process_message, ingress_queue_size=1, ingress_overflow=INGRESS_DISCONNECT)
+
+    await MatildaWebSocketServer.handle_client(server, ws)
+
+    assert ws.closed_with == 1013
+    assert ws.sent[-1]["error"]["code"] == "ingress_overflow"
+    assert server.ingress_stats["disconnected"] == 1
@@ -0,0 +1,111 @@
+from types import SimpleNamespace
+
+import pytest
+
+from matilda_ears.core.metrics import (
+    BYTES_TOTAL,
+    STAGE_SECONDS,
+    Counter,
+    Histogram,
+    format_gauge,
+    merge_expositions,
+    payload_size,
+)
+from matilda_ears.service.health import METRICS_CONTENT_TYPE, metrics_handler
+from matilda_ears.transcription.server.internal.envelope import send_envelope
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram("test_seconds", "Test.", labelnames=("stage",), buckets=(0.1, 1.0))
+    histogram.observe(0.05, "a")
+    histogram.observe(0.5, "a")
+    histogram.observe(5.0, "a")
+
+    lines = histogram.render()
+
+    assert 'test_seconds_bucket{stage="a",le="0.1"} 1' in lines
+    assert 'test_seconds_bucket{stage="a",le="1"} 2' in lines
+    assert 'test_seconds_bucket{stage="a",le="+Inf"} 3' in lines
+    assert 'test_seconds_sum{stage="a"} 5.55' in lines
+    assert 'test_seconds_count{stage="a"} 3' in lines
+
+
+def test_counter_and_gauge_render_labels():
+    counter = Counter("test_total", "Test.", labelnames=("direction",))
+    counter.inc(3, "in")
+    counter.inc(2, "in")
+
+    assert 'test_total{direction="in"} 5' in counter.render()
+    assert format_gauge("g", "Gauge.", {(("type", 'a"b'),): 1.5})[-1] == 'g{type="a\\"b"} 1.5'
+
+
+def test_merge_expositions_labels_each_process_and_keeps_families_together():
+    worker = '# HELP a_total A.\n# TYPE a_total counter\na_total{dir="in"} 1\n# HELP b B.\n# TYPE b gauge\nb 2\n'
+
+    lines = merge_expositions({"0": worker, "1": worker.replace("b 2", "b 5")}, "worker")
+
+    assert lines == [
+        "# HELP a_total A.",
+        "# TYPE a_total counter",
+        'a_total{worker="0",dir="in"} 1',
+        'a_total{worker="1",dir="in"} 1',
+        "# HELP b B.",
+        "# TYPE b gauge",
+        'b{worker="0"} 2',
+        'b{worker="1"} 5',
+    ]
+
+
+@pytest.mark.asyncio
+async def test_send_envelope_records_stage_time():
+    class _WebSocket:
+        async def send(self, message):
+            pass
+
+    before = STAGE_SECONDS.count("envelope_send")
+    await send_envelope(_WebSocket(), "transcription", result={"text": "hi"})
+
+    assert STAGE_SECONDS.count("envelope_send") == before + 1
+
+
+@pytest.mark.asyncio
+async def test_send_envelope_counts_utf8_bytes():
+    sent = []
+
+    class _WebSocket:
+        async def send(self, message):
+            sent.append(message)
+
+    before = BYTES_TOTAL.value("out")
+    await send_envelope(_WebSocket(), "transcription", result={"text": "café ☕"})
+
+    assert BYTES_TOTAL.value("out") - before == len(sent[0].encode("utf-8"))
+    assert payload_size("é") == 2
+    assert payload_size(b"\x00\x01") == 2
+
+
+@pytest.mark.asyncio
+async def test_metrics_handler_reports_gauges():
+    server = SimpleNamespace(
+        connected_clients={object()},
+        streaming_sessions={"a": object()},
+        pcm_sessions={},
+        opus_decoder=SimpleNamespace(get_active_sessions=lambda: ["x", "y"]),
+        wake_word_sessions={},
+        ending_sessions=set(),
+        inference_executor=SimpleNamespace(
+            get_stats=lambda: {"queue_depth": 4, "running": 1, "workers": 2, "rejected": 7}
+        ),
+        ingress_stats={"dropped": 3, "coalesced": 0, "disconnected": 1},
+    )
+
+    response = await metrics_handler(server, request=None)
+    text = response.body.decode()
+
+    assert response.headers["Content-Type"] == METRICS_CONTENT_TYPE
+    assert "matilda_ears_connected_clients 1" in text
+    assert 'matilda_ears_active_sessions{type="opus"} 2' in text
+    assert "matilda_ears_inference_queue_depth 4" in text
+    assert 'matilda_ears_ingress_overflow_total{outcome="dropped"} 3' in text
+    assert "# TYPE matilda_ears_stage_seconds histogram" in text
+    assert "matilda_ears_rate_limited_total" not in text
@@ -0,0 +1,168 @@
+import asyncio
+import sys
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from matilda_ears.transcription.backends.internal.dummy import DummyBackend
+from matilda_ears.transcription.server.internal import model_swap, transcription
+from matilda_ears.transcription.server.internal.inference_executor import InferenceExecutor
+from matilda_ears.transcription.server.internal.model_swap import BackendSwapper, ModelSwapError
+from matilda_ears.transcription.server.internal.transcription import transcribe_audio_array
+from matilda_ears.transcription.streaming.adapter import release_shared_models
+
+
+async def _server(backend_name="dummy"):
+    backend = DummyBackend(text="old")
+    await backend.load()
+    server = SimpleNamespace(
+        backend=backend,
+        backend_name=backend_name,
+        model_size="tiny",
+        streaming_sessions={},
+        transcription_semaphore=None,
+        inference_executor=InferenceExecutor(workers=2),
+    )
+    server.backend_swapper = BackendSwapper(server, drain_poll_seconds=0.01)
+    return server
+
+
+@pytest.mark.asyncio
+async def test_swap_routes_new_work_and_releases_idle_backend():
+    server = await _server()
+    old = server.backend
+
+    assert await server.backend_swapper.start_swap("dummy", "small")
+    await asyncio.sleep(0.05)
+
+    assert server.backend is not old
+    assert server.model_size == "small"
+    assert not old.is_ready
+    assert server.backend_swapper.get_stats()["retiring"] == []
+
+
+@pytest.mark.asyncio
+async def test_old_backend_stays_loaded_until_its_streaming_session_ends():
+    server = await _server()
+    old = server.backend
+    server.streaming_sessions["s-1"] = SimpleNamespace(backend=old)
+
+    await server.backend_swapper.start_swap("dummy")
+    await asyncio.sleep(0.05)
+
+    assert server.backend is not old
+    assert old.is_ready
+    assert server.backend_swapper.get_stats()["retiring"] == [{"backend": "DummyBackend", "users": 1}]
+
+    del server.streaming_sessions["s-1"]
+    await asyncio.sleep(0.05)
+
+    assert not old.is_ready
+
+
+@pytest.mark.asyncio
+async def test_in_flight_batch_job_finishes_on_the_backend_it_started_with():
+    server = await _server()
+    old = server.backend
+    release = asyncio.Event()
+    loop = asyncio.get_running_loop()
+
+    def slow_transcribe(audio, language="en"):
+        asyncio.run_coroutine_threadsafe(release.wait(), loop).result()
+        return "old", {"duration": 1.0, "language": language}
+
+    old.transcribe_array = slow_transcribe
+    job = asyncio.create_task(transcribe_audio_array(server, np.zeros(16000, dtype=np.float32), "c1"))
+    await asyncio.sleep(0.05)
+
+    await server.backend_swapper.start_swap("dummy")
+    await asyncio.sleep(0.05)
+    assert server.backend is not old
+    assert old.is_ready  # leased by the running job
+
+    release.set()
+    success, text, _ = await job
+    await asyncio.sleep(0.05)
+
+    assert (success, text) == (True, "old")
+    assert not old.is_ready
+
+
+@pytest.mark.asyncio
+async def test_timed_out_job_keeps_its_backend_until_the_thread_returns(monkeypatch):
+    server = await _server()
+    old = server.backend
+    finished = threading.Event()
+    monkeypatch.setattr(transcription, "_transcription_timeout_seconds", lambda: 0.05)
+
+    def slow_transcribe(audio, language="en"):
+        finished.wait(5)
+        return "old", {"duration": 1.0, "language": language}
+
+    old.transcribe_array = slow_transcribe
+    success, _, _ = await transcribe_audio_array(server, np.zeros(16000, dtype=np.float32), "c1")
+    assert not success
+
+    await server.backend_swapper.start_swap("dummy")
+    await asyncio.sleep(0.05)
+    assert old.is_ready  # the timed-out job is still running on it
+
+    finished.set()
+    await asyncio.sleep(0.1)
+    assert not old.is_ready
+
+
+@pytest.mark.asyncio
+async def test_simul_streaming_sessions_do_not_hold_the_backend_but_drop_pooled_models(monkeypatch):
+    server = await _server()
+    old = server.backend
+    server.streaming_sessions["s-1"] = SimpleNamespace(backend=old, uses_backend=False)
+    released = []
+    monkeypatch.setattr(model_swap, "release_shared_models", lambda: released.append(True))
+
+    await server.backend_swapper.start_swap("dummy")
+    await asyncio.sleep(0.05)
+
+    assert released == [True]
+    assert old.is_ready  # unloaded together with the old pooled models once s-1 ends
+    assert server.backend_swapper.get_stats()["retiring"] == [{"backend": "DummyBackend", "users": 1}]
+
+    del server.streaming_sessions["s-1"]
+    await asyncio.sleep(0.05)
+    assert not old.is_ready
+    assert server.backend_swapper.get_stats()["retiring"] == []
+
+
+def test_release_shared_models_clears_a_loaded_pool(monkeypatch):
+    pool = SimpleNamespace(model_pool=SimpleNamespace(cleared=0))
+    pool.model_pool.clear = lambda: setattr(pool.model_pool, "cleared", pool.model_pool.cleared + 1)
+    monkeypatch.setitem(sys.modules, "matilda_ears.transcription.streaming.vendor.simul_whisper.model_pool", pool)
+
+    release_shared_models()
+
+    assert pool.model_pool.cleared == 1
+
+
+@pytest.mark.asyncio
+async def test_swap_rejects_parakeet_switch_and_concurrent_swaps():
+    server = await _server("faster_whisper")
+    with pytest.raises(ModelSwapError):
+        server.backend_swapper.start_swap("parakeet")
+
+    swap = server.backend_swapper.start_swap("dummy")
+    with pytest.raises(ModelSwapError):
+        server.backend_swapper.start_swap("dummy")
+    assert await swap
+
+
+@pytest.mark.asyncio
+async def test_failed_load_keeps_current_backend():
+    server = await _server()
+    old = server.backend
+
+    assert not await server.backend_swapper.start_swap("no_such_backend")
+
+    assert server.backend is old
+    assert server.backend_swapper.get_stats()["last_error"]
@@ -0,0 +1,70 @@
+from matilda_ears.transcription.client.internal.streaming import StreamingAudioClient
+from matilda_ears.transcription.server.internal.partials import (
+    PARTIAL_MODE_DELTA,
+    PARTIAL_MODE_FULL,
+    PartialResultEmitter,
+)
+
+
+def test_full_mode_sends_complete_text_and_skips_duplicates():
+    emitter = PartialResultEmitter(PARTIAL_MODE_FULL)
+
+    first = emitter.next_message("s1", "hello", "wor", now=0.0)
+    assert first == {
+        "type": "partial_result",
+        "session_id": "s1",
+        "is_final": False,
+        "confirmed_text": "hello",
+        "tentative_text": "wor",
+    }
+    assert emitter.next_message("s1", "hello", "wor", now=1.0) is None
+
+
+def test_delta_mode_sends_only_new_confirmed_text():
+    emitter = PartialResultEmitter(PARTIAL_MODE_DELTA)
+
+    first = emitter.next_message("s1", "hello", "wor", now=0.0)
+    second = emitter.next_message("s1", "hello world", "how", now=1.0)
+    third = emitter.next_message("s1", "hello world how", "how", now=2.0)
+
+    assert first["offset"] == 0
+    assert first["confirmed_delta"] == "hello"
+    assert second["offset"] == 5
+    assert second["confirmed_delta"] == " world"
+    assert second["tentative_text"] == "how"
+    assert third["confirmed_delta"] == " how"
+    # tentative text is omitted when unchanged
+    assert "tentative_text" not in third
+    assert "confirmed_text" not in third
+
+
+def test_delta_mode_resends_from_first_revised_character():
+    emitter = PartialResultEmitter(PARTIAL_MODE_DELTA)
+    emitter.next_message("s1", "hello word", "", now=0.0)
+
+    message = emitter.next_message("s1", "hello world", "", now=1.0)
+
+    assert message["offset"] == 9
+    assert message["confirmed_delta"] == "ld"
+
+
+def test_min_interval_drops_updates_that_come_too_fast():
+    emitter = PartialResultEmitter(PARTIAL_MODE_DELTA, min_interval=0.1)
+
+    assert emitter.next_message("s1", "a", "", now=0.0) is not None
+    assert emitter.next_message("s1", "a b", "", now=0.05) is None
+    # the skipped text is folded into the next allowed message
+    message = emitter.next_message("s1", "a b c", "", now=0.2)
+    assert message["offset"] == 1
+    assert message["confirmed_delta"] == " b c"
+
+
+def test_client_reassembles_delta_partials():
+    client = StreamingAudioClient("ws://localhost:1", token="t")
+    emitter = PartialResultEmitter(PARTIAL_MODE_DELTA)
+    updates = [("hello", "wor"), ("hello world", "how"), ("hello world how", "how"), ("hello word how", "")]
+
+    for i, (confirmed, tentative) in enumerate(updates):
+        data = client._reassemble_partial(emitter.next_message("s1", confirmed, tentative, now=float(i)))
+        assert data["confirmed_text"] == confirmed
+        assert data["tentative_text"] == tentative
@@ -0,0 +1,97 @@
+import json
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from matilda_ears.audio.ring_buffer import RingBuffer
+from matilda_ears.transcription.server import stream_handlers
+from matilda_ears.transcription.server.internal.rate_limit import (
+    RateLimiter,
+    charge_audio,
+    enforce_rate_limit,
+    register_tenant,
+)
+
+
+class _RecordingWebSocket:
+    def __init__(self):
+        self.messages = []
+
+    async def send(self, message):
+        self.messages.append(json.loads(message))
+
+
+def test_request_bucket_allows_burst_then_refills():
+    limiter = RateLimiter(requests_per_minute=60, request_burst=3, audio_seconds_per_minute=0)
+
+    assert [limiter.acquire("a", now=0.0) for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter.acquire("a", now=0.0) == pytest.approx(1.0)
+    # other tenants have their own bucket
+    assert limiter.acquire("b", now=0.0) == 0.0
+    assert limiter.acquire("a", now=1.0) == 0.0
+
+
+def test_audio_debt_blocks_new_requests_until_refilled():
+    limiter = RateLimiter(requests_per_minute=0, audio_seconds_per_minute=60, audio_burst_seconds=10)
+
+    assert limiter.acquire("a", now=0.0) == 0.0
+    # a running stream is charged past the burst
+    limiter.charge_audio("a", 14.0, now=0.0)
+
+    assert limiter.acquire("a", now=0.0) == pytest.approx(4.0)
+    assert limiter.acquire("a", now=4.5) == 0.0
+    assert limiter.get_stats()["limited"] == 1
+
+
+def test_full_buckets_are_evicted():
+    limiter = RateLimiter(requests_per_minute=60, request_burst=2, audio_seconds_per_minute=60, evict_interval=10)
+    limiter.acquire("a", now=0.0)
+    limiter.acquire("b", now=0.0)
+    limiter.charge_audio("b", 30.0, now=0.0)
+
+    # both request buckets are full again; b still owes audio
+    assert limiter.evict_idle(now=1.0) == 2
+    assert limiter.get_stats()["tenants"] == 1
+    # eviction also runs on its own during acquire
+    limiter.acquire("c", now=31.0)
+    assert limiter.get_stats()["tenants"] == 1
+
+
+@pytest.mark.asyncio
+async def test_enforce_rate_limit_keys_by_tenant_and_sends_retry_after():
+    server = SimpleNamespace(
+        rate_limiter=RateLimiter(requests_per_minute=1, request_burst=1, audio_seconds_per_minute=0),
+        client_tenants={},
+    )
+    ws = _RecordingWebSocket()
+    register_tenant(server, "conn-1", "10.0.0.5", "alice")
+    register_tenant(server, "conn-2", "10.0.0.6", "alice")
+
+    assert await enforce_rate_limit(server, ws, "10.0.0.5", "conn-1") is True
+    # a second connection of the same tenant from another address shares the bucket
+    assert await enforce_rate_limit(server, ws, "10.0.0.6", "conn-2") is False
+    assert ws.messages[-1]["error"]["code"] == "rate_limited"
+    assert ws.messages[-1]["error"]["retry_after"] == 60.0
+    # loopback clients are exempt
+    assert await enforce_rate_limit(server, ws, "127.0.0.1", "conn-3") is True
+
+
+@pytest.mark.asyncio
+async def test_streamed_pcm_is_charged_to_the_tenant():
+    limiter = RateLimiter(requests_per_minute=0, audio_seconds_per_minute=60, audio_burst_seconds=1)
+    server = SimpleNamespace(
+        rate_limiter=limiter,
+        client_tenants={},
+        streaming_sessions={},
+        wake_word_sessions={},
+    )
+    register_tenant(server, "conn-1", "10.0.0.5", "alice")
+    pcm_session = {"chunk_count": 0, "samples": RingBuffer(32000, dtype=np.float32), "sample_rate": 16000}
+    pcm = np.zeros(32000, dtype=np.int16).tobytes()
+
+    await stream_handlers._process_pcm_bytes(server, _RecordingWebSocket(), "s1", pcm_session, pcm, client_id="conn-1")
+
+    assert limiter.acquire("client:alice", now=limiter._audio["client:alice"].updated) == pytest.approx(1.0)
+    charge_audio(server, "unregistered", 5.0)
+    assert "unregistered" not in limiter._audio
@@ -0,0 +1,94 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from matilda_ears.transcription.server import stream_handlers
+from matilda_ears.transcription.server.internal.audio_utils import StreamingResampler, _polyphase_filter
+
+
+def _tone(rate, seconds=1.0, freq=440.0):
+    t = np.arange(int(rate * seconds)) / rate
+    return (0.5 * np.sin(2 * np.pi * freq * t)).astype(np.float32)
+
+
+@pytest.mark.parametrize("source_rate", [48000, 8000])
+def test_chunked_output_matches_one_shot(source_rate):
+    audio = _tone(source_rate)
+    chunked = StreamingResampler(source_rate)
+    chunk = source_rate // 50  # 20 ms
+
+    streamed = np.concatenate([chunked.process(audio[i : i + chunk]) for i in range(0, len(audio), chunk)])
+    whole = StreamingResampler(source_rate).process(audio)
+
+    assert len(streamed) == 16000
+    np.testing.assert_allclose(streamed, whole, atol=1e-6)
+
+
+@pytest.mark.parametrize("source_rate", [48000, 8000])
+def test_tone_survives_with_small_filter_delay(source_rate):
+    output = StreamingResampler(source_rate).process(_tone(source_rate))
+    expected = _tone(16000)
+
+    delay = min(range(40), key=lambda d: np.mean((output[d + 200 : d + 15000] - expected[200:15000]) ** 2))
+    error = np.sqrt(np.mean((output[delay + 200 : delay + 15000] - expected[200:15000]) ** 2))
+
+    assert delay <= 32  # ~2 ms at 16 kHz
+    assert error < 1e-3
+
+
+@pytest.mark.parametrize("source_rate", [48000, 8000])
+def test_flush_returns_filter_tail_and_resets(source_rate):
+    resampler = StreamingResampler(source_rate)
+    audio = _tone(source_rate)
+    output = np.concatenate([resampler.process(audio), resampler.flush()])
+    expected = _tone(16000)
+
+    delay = len(output) - 16000
+    error = np.sqrt(np.mean((output[delay + 15000 :] - expected[15000:]) ** 2))
+
+    assert 0 < delay <= 32
+    assert error < 1e-2
+    np.testing.assert_allclose(resampler.process(audio), StreamingResampler(source_rate).process(audio), atol=1e-6)
+    assert len(StreamingResampler(source_rate).flush()) == 0
+
+
+def test_downsampling_rejects_content_above_new_nyquist():
+    output = StreamingResampler(48000).process(_tone(48000, freq=12000.0))
+
+    assert np.sqrt(np.mean(output[200:] ** 2)) < 1e-3
+
+
+def test_int16_in_int16_out_and_filters_are_shared():
+    first = StreamingResampler(8000)
+    second = StreamingResampler(8000)
+
+    out = first.process(np.full(160, 1000, dtype=np.int16))
+
+    assert out.dtype == np.int16
+    assert len(out) == 320
+    assert first._filter is second._filter
+    assert _polyphase_filter.cache_info().hits >= 1
+
+
+def test_pcm_session_chunks_use_one_resampler_per_session():
+    server = SimpleNamespace(resamplers={})
+    chunk = np.zeros(160, dtype=np.int16)
+
+    stream_handlers._resample_session_chunk(server, "s1", chunk, 8000)
+    resampler = server.resamplers["s1"]
+    stream_handlers._resample_session_chunk(server, "s1", chunk, 8000)
+
+    assert server.resamplers["s1"] is resampler
+
+
+def test_end_of_session_flushes_and_drops_resampler():
+    server = SimpleNamespace(resamplers={})
+    stream_handlers._resample_session_chunk(server, "s1", np.full(160, 1000, dtype=np.int16), 8000)
+
+    tail = stream_handlers._flush_session_resampler(server, "s1")
+
+    assert tail.dtype == np.int16
+    assert len(tail) > 0
+    assert "s1" not in server.resamplers
+    assert stream_handlers._flush_session_resampler(server, "s1") is None
@@ -0,0 +1,154 @@
+import asyncio
+import base64
+import json
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from matilda_ears.transcription.server.internal import request_handlers
+from matilda_ears.transcription.server.internal.rate_limit import RateLimiter
+from matilda_ears.transcription.server.internal.result_cache import ResultCache, result_cache_key
+
+
+def _counting_transcriber(text="hello", success=True, delay=0.0):
+    calls = []
+
+    async def transcribe():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        return success, text, {"duration": 1.0, "language": "en"}
+
+    return transcribe, calls
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_share_one_transcription():
+    cache = ResultCache()
+    transcribe, calls = _counting_transcriber()
+
+    first, cached = await cache.get_or_transcribe("k", transcribe)
+    second, cached_again = await cache.get_or_transcribe("k", transcribe)
+
+    assert (first, cached) == ((True, "hello", {"duration": 1.0, "language": "en"}), False)
+    assert (second, cached_again) == (first, True)
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_while_first_request_runs_joins_it():
+    cache = ResultCache()
+    transcribe, calls = _counting_transcriber(delay=0.05)
+
+    results = await asyncio.gather(cache.get_or_transcribe("k", transcribe), cache.get_or_transcribe("k", transcribe))
+
+    assert [cached for _, cached in results] == [False, True]
+    assert len(calls) == 1
+    assert cache.get_stats()["joined"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failures_are_not_cached():
+    cache = ResultCache()
+    transcribe, calls = _counting_transcriber(success=False)
+
+    await cache.get_or_transcribe("k", transcribe)
+    await cache.get_or_transcribe("k", transcribe)
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_and_memory_is_bounded(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("matilda_ears.transcription.server.internal.result_cache.time.time", lambda: now[0])
+    cache = ResultCache(max_entries=2, ttl_seconds=10)
+    for key in ("a", "b", "c"):
+        await cache.put(key, key, {})
+
+    assert await cache.get("a") is None
+    assert await cache.get("c") == (True, "c", {})
+    now[0] += 11
+    assert await cache.get("c") is None
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_survives_restart_and_is_pruned(tmp_path):
+    cache = ResultCache(disk_dir=tmp_path, max_disk_entries=10)
+    for key in "abcdefghij":
+        await cache.put(key, key.upper(), {"duration": 2.0})
+    await cache.put("j", "J", {"duration": 2.0})  # overwriting adds no file
+    assert len(list(tmp_path.glob("*.json"))) == 10
+
+    await cache.put("k", "K", {"duration": 2.0})
+    assert len(list(tmp_path.glob("*.json"))) == 9  # pruned to the low-water mark
+    restarted = ResultCache(disk_dir=tmp_path)
+    assert await restarted.get("k") == (True, "K", {"duration": 2.0})
+    assert restarted.get_stats()["disk_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_is_read_and_written_off_the_event_loop(tmp_path, monkeypatch):
+    threads = []
+    for name in ("_read_disk", "_write_disk"):
+        original = getattr(ResultCache, name)
+
+        def recording(self, *args, _original=original):
+            threads.append(threading.current_thread())
+            return _original(self, *args)
+
+        monkeypatch.setattr(ResultCache, name, recording)
+    transcribe, calls = _counting_transcriber()
+
+    await ResultCache(disk_dir=tmp_path).get_or_transcribe("k", transcribe)
+    result, cached = await ResultCache(disk_dir=tmp_path).get_or_transcribe("k", transcribe)
+
+    assert (result, cached) == ((True, "hello", {"duration": 1.0, "language": "en"}), True)
+    assert len(calls) == 1
+    assert len(threads) == 3  # miss, write, hit
+    assert threading.main_thread() not in threads
+
+
+def test_key_depends_on_model_and_audio():
+    server = SimpleNamespace(backend_name="faster_whisper", model_size="base")
+    key = result_cache_key(server, b"audio")
+
+    assert key == result_cache_key(server, b"audio")
+    assert key != result_cache_key(server, b"other")
+    assert key != result_cache_key(SimpleNamespace(backend_name="faster_whisper", model_size="small"), b"audio")
+
+
+@pytest.mark.asyncio
+async def test_handle_transcription_honors_no_cache(monkeypatch):
+    calls = []
+
+    async def fake_transcribe(server, wav_data, client_id):
+        calls.append(wav_data)
+        return True, "hi", {"duration": 1.0, "language": "en"}
+
+    class _WebSocket:
+        def __init__(self):
+            self.messages = []
+
+        async def send(self, message):
+            self.messages.append(json.loads(message))
+
+    monkeypatch.setattr(request_handlers, "transcribe_audio_from_wav", fake_transcribe)
+    server = SimpleNamespace(
+        auth=SimpleNamespace(check=lambda *args: SimpleNamespace(authorized=True, client_id=None, method="local")),
+        backend=SimpleNamespace(is_ready=True),
+        backend_name="dummy",
+        rate_limiter=RateLimiter(),
+        client_tenants={},
+        model_size="base",
+        result_cache=ResultCache(),
+    )
+    ws = _WebSocket()
+    request = {"type": "transcribe", "audio_data": base64.b64encode(b"RIFF" * 300).decode()}
+
+    await request_handlers.handle_transcription(server, ws, request, "127.0.0.1", "c1")
+    await request_handlers.handle_transcription(server, ws, request, "127.0.0.1", "c1")
+    await request_handlers.handle_transcription(server, ws, {**request, "no_cache": True}, "127.0.0.1", "c1")
+
+    assert len(calls) == 2
+    assert [m["result"]["cached"] for m in ws.messages] == [False, True, False]
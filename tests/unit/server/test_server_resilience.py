@@ -9,9 +9,13 @@ from unittest.mock import AsyncMock, Mock
 import numpy as np
 import pytest
 
+from matilda_ears.audio.ring_buffer import RingBuffer
 from matilda_ears.transcription.server.core import MatildaWebSocketServer
 from matilda_ears.service.health import health_handler
-from matilda_ears.transcription.server.internal.transcription import transcribe_audio_from_wav
+from matilda_ears.transcription.server.internal.inference_executor import InferenceExecutor
+from matilda_ears.transcription.server.internal.ingress import INGRESS_DROP_OLDEST
+from matilda_ears.transcription.server.internal.rate_limit import RateLimiter
+from matilda_ears.transcription.server.internal.transcription import pcm_to_wav, transcribe_audio_from_wav
 from matilda_ears.transcription.server import stream_handlers
 
 
@@ -47,9 +51,16 @@ async def test_handle_client_disconnect_cleans_orphaned_streaming_sessions(monke
         session_chunk_counts={session_id: {"received": 1}},
         ending_sessions={session_id},
         streaming_sessions={session_id: object()},
+        partial_emitters={},
+        resamplers={},
+        frame_streams={},
         process_message=AsyncMock(),
         _cleanup_streaming_session=cleanup_mock,
         backend=SimpleNamespace(is_ready=True),
+        ingress_queue_size=64,
+        ingress_overflow=INGRESS_DROP_OLDEST,
+        ingress_stats={"dropped": 0, "coalesced": 0, "disconnected": 0},
+        client_tenants={},
     )
 
     monkeypatch.setattr("matilda_ears.transcription.server.core.uuid.uuid4", lambda: "deadbeef-0000-0000-0000")
@@ -89,7 +100,7 @@ async def test_start_server_delegates_via_lazy_import(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_transcribe_audio_timeout_does_not_lock_serialization_semaphore(monkeypatch):
+async def test_transcribe_audio_timeout_frees_the_inference_worker(monkeypatch):
     class _Config:
         def get(self, key, default=None):
             if key == "transcription.timeout_seconds":
@@ -103,10 +114,7 @@ async def test_transcribe_audio_timeout_does_not_lock_serialization_semaphore(mo
             time.sleep(0.05)
             return "ignored", {"duration": 1.0, "language": language}
 
-    server = SimpleNamespace(
-        backend=_StuckBackend(),
-        transcription_semaphore=asyncio.Semaphore(1),
-    )
+    server = SimpleNamespace(backend=_StuckBackend(), inference_executor=InferenceExecutor(workers=1))
 
     def _get_config() -> _Config:
         return _Config()
@@ -120,7 +128,36 @@ async def test_transcribe_audio_timeout_does_not_lock_serialization_semaphore(mo
     assert success is False
     assert text == ""
     assert "timed out" in info["error"].lower()
-    assert server.transcription_semaphore.locked() is False
+    server.inference_executor.shutdown()  # waits for the stuck job, which holds the only worker until it returns
+    assert server.inference_executor.get_stats()["running"] == 0
+
+
+@pytest.mark.asyncio
+async def test_transcribe_wav_decodes_pcm_in_memory():
+    class _ArrayBackend:
+        is_ready = True
+
+        def __init__(self):
+            self.arrays = []
+
+        def transcribe(self, _path, language="en"):
+            raise AssertionError("16 kHz PCM WAV should not be written to disk")
+
+        def transcribe_array(self, audio, language="en"):
+            self.arrays.append(audio)
+            return "in memory", {"duration": len(audio) / 16000, "language": language}
+
+    backend = _ArrayBackend()
+    server = SimpleNamespace(backend=backend, inference_executor=InferenceExecutor(workers=1))
+    samples = np.full(16000, 16384, dtype=np.int16)
+
+    success, text, info = await transcribe_audio_from_wav(server, pcm_to_wav(samples, 16000), "client-array")
+
+    assert success is True
+    assert text == "in memory"
+    assert info["duration"] == 1.0
+    assert backend.arrays[0].dtype == np.float32
+    assert np.allclose(backend.arrays[0], 0.5)
 
 
 @pytest.mark.asyncio
@@ -162,7 +199,6 @@ async def test_end_stream_removes_empty_client_session_bucket(monkeypatch):
 
     server = SimpleNamespace(
         ending_sessions=set(),
-        check_rate_limit=lambda _ip: True,
         session_chunk_counts={},
         pcm_sessions={},
         opus_decoder=SimpleNamespace(remove_session=lambda _sid: None),
@@ -172,6 +208,9 @@ async def test_end_stream_removes_empty_client_session_bucket(monkeypatch):
         wake_word_sessions={session_id: True},
         wake_word_buffers={session_id: object()},
         wake_word_debug_sessions={session_id: {"last_sent": 0}},
+        partial_emitters={},
+        resamplers={},
+        frame_streams={},
         backend_name="parakeet",
     )
 
@@ -211,15 +250,14 @@ async def test_end_stream_falls_back_to_batch_when_streaming_finalize_empty(monk
 
     send_envelope = AsyncMock()
     send_error = AsyncMock()
-    transcribe_audio_from_wav = AsyncMock(return_value=(True, "fallback transcription", {"language": "en"}))
+    transcribe_audio_array = AsyncMock(return_value=(True, "fallback transcription", {"language": "en"}))
 
     monkeypatch.setattr(stream_handlers, "send_envelope", send_envelope)
     monkeypatch.setattr(stream_handlers, "send_error", send_error)
-    monkeypatch.setattr(stream_handlers, "transcribe_audio_from_wav", transcribe_audio_from_wav)
+    monkeypatch.setattr(stream_handlers, "transcribe_audio_array", transcribe_audio_array)
 
     server = SimpleNamespace(
         ending_sessions=set(),
-        check_rate_limit=lambda _ip: True,
         session_chunk_counts={},
         pcm_sessions={},
         opus_decoder=SimpleNamespace(remove_session=lambda _sid: _Decoder()),
@@ -229,6 +267,9 @@ async def test_end_stream_falls_back_to_batch_when_streaming_finalize_empty(monk
         wake_word_sessions={session_id: True},
         wake_word_buffers={session_id: object()},
         wake_word_debug_sessions={session_id: {"last_sent": 0}},
+        partial_emitters={},
+        resamplers={},
+        frame_streams={},
         backend_name="parakeet",
     )
 
@@ -240,7 +281,10 @@ async def test_end_stream_falls_back_to_batch_when_streaming_finalize_empty(monk
         client_id=client_id,
     )
 
-    transcribe_audio_from_wav.assert_awaited_once()
+    transcribe_audio_array.assert_awaited_once()
+    samples = transcribe_audio_array.await_args.args[1]
+    assert samples.dtype == np.float32
+    assert len(samples) == 16000
     send_error.assert_not_awaited()
     # First envelope may be a final partial from streaming, second is the final batch result.
     assert send_envelope.await_count >= 1
@@ -248,3 +292,182 @@ async def test_end_stream_falls_back_to_batch_when_streaming_finalize_empty(monk
     assert final_payload["type"] == "stream_transcription_complete"
     assert final_payload["confirmed_text"] == "fallback transcription"
     assert final_payload["streaming_mode"] is False
+
+
+@pytest.mark.asyncio
+async def test_end_stream_pcm_fallback_transcribes_ring_view_without_copy(monkeypatch):
+    client_id = "client-pcm"
+    session_id = "s-pcm"
+    ring = RingBuffer(16000 * 2, dtype=np.float32, initial_samples=16000)
+    for _ in range(3):  # wraps once
+        ring.append(np.full(16000, 0.25, dtype=np.float32))
+
+    send_envelope = AsyncMock()
+    transcribe_audio_array = AsyncMock(return_value=(True, "pcm fallback", {"language": "en"}))
+    monkeypatch.setattr(stream_handlers, "send_envelope", send_envelope)
+    monkeypatch.setattr(stream_handlers, "send_error", AsyncMock())
+    monkeypatch.setattr(stream_handlers, "transcribe_audio_array", transcribe_audio_array)
+
+    server = SimpleNamespace(
+        ending_sessions=set(),
+        session_chunk_counts={},
+        pcm_sessions={session_id: {"samples": ring, "sample_rate": 16000, "channels": 1}},
+        opus_decoder=SimpleNamespace(remove_session=lambda _sid: None),
+        streaming_sessions={},
+        client_sessions={client_id: {session_id}},
+        binary_stream_sessions={},
+        wake_word_sessions={},
+        wake_word_buffers={},
+        wake_word_debug_sessions={},
+        partial_emitters={},
+        resamplers={},
+        frame_streams={},
+        backend_name="faster_whisper",
+    )
+
+    await stream_handlers.handle_end_stream(
+        server=server,
+        websocket=_SilentWebSocket(),
+        data={"session_id": session_id},
+        client_ip="127.0.0.1",
+        client_id=client_id,
+    )
+
+    samples = transcribe_audio_array.await_args.args[1]
+    assert samples.dtype == np.float32
+    assert len(samples) == 32000
+    assert np.shares_memory(samples, ring.view())
+    assert send_envelope.await_args_list[-1].args[2]["confirmed_text"] == "pcm fallback"
+
+
+@pytest.mark.asyncio
+async def test_start_stream_acks_before_streaming_session_is_ready(monkeypatch):
+    client_id = "client-warm"
+    session_id = "s-warm"
+    ws = _SilentWebSocket()
+    release = asyncio.Event()
+
+    class _WarmingSession:
+        def start_in_background(self):
+            pass
+
+        async def wait_until_ready(self):
+            await release.wait()
+            return SimpleNamespace(confirmed_text="", tentative_text="")
+
+    streaming_session = _WarmingSession()
+    send_envelope = AsyncMock()
+    monkeypatch.setattr(stream_handlers, "send_envelope", send_envelope)
+    monkeypatch.setattr(stream_handlers, "_streaming_enabled", lambda: True)
+    monkeypatch.setattr(stream_handlers, "_create_streaming_session", lambda **_kwargs: streaming_session)
+
+    server = SimpleNamespace(
+        auth=SimpleNamespace(check=lambda *_args: SimpleNamespace(authorized=True, method="local", client_id=None)),
+        backend=SimpleNamespace(is_ready=True),
+        rate_limiter=RateLimiter(),
+        inference_executor=InferenceExecutor(workers=1),
+        client_tenants={},
+        backend_name="faster_whisper",
+        client_sessions={},
+        opus_decoder=SimpleNamespace(create_session=lambda *_args: None),
+        binary_stream_sessions={},
+        wake_word_sessions={},
+        streaming_sessions={},
+        partial_emitters={},
+        resamplers={},
+        frame_streams={},
+        streaming_vad=None,
+        transcription_semaphore=None,
+    )
+
+    await stream_handlers.handle_start_stream(
+        server=server,
+        websocket=ws,
+        data={"session_id": session_id},
+        client_ip="127.0.0.1",
+        client_id=client_id,
+    )
+
+    assert server.streaming_sessions[session_id] is streaming_session
+    assert send_envelope.await_count == 1
+    started = send_envelope.await_args_list[0].args[2]
+    assert started["type"] == "stream_started"
+    assert started["streaming_enabled"] is True
+    assert started["ready"] is False
+
+    release.set()
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+    assert send_envelope.await_count == 2
+    ready = send_envelope.await_args_list[1].args[2]
+    assert ready["type"] == "stream_ready"
+    assert ready["session_id"] == session_id
+    assert ready["streaming_enabled"] is True
+
+
+@pytest.mark.asyncio
+async def test_start_stream_negotiates_binary_frames(monkeypatch):
+    client_id = "client-v2"
+    send_envelope = AsyncMock()
+    monkeypatch.setattr(stream_handlers, "send_envelope", send_envelope)
+    monkeypatch.setattr(stream_handlers, "_streaming_enabled", lambda: False)
+
+    server = SimpleNamespace(
+        auth=SimpleNamespace(check=lambda *_args: SimpleNamespace(authorized=True, method="local", client_id=None)),
+        backend=SimpleNamespace(is_ready=True),
+        rate_limiter=RateLimiter(),
+        inference_executor=InferenceExecutor(workers=1),
+        client_tenants={},
+        backend_name="faster_whisper",
+        client_sessions={},
+        opus_decoder=SimpleNamespace(create_session=lambda *_args: None),
+        binary_stream_sessions={},
+        wake_word_sessions={},
+        streaming_sessions={},
+        partial_emitters={},
+        resamplers={},
+        frame_streams={},
+    )
+
+    for session_id, data in (("s-1", {"protocol": 2}), ("s-2", {"protocol": 3}), ("s-3", {})):
+        await stream_handlers.handle_start_stream(
+            server=server,
+            websocket=_SilentWebSocket(),
+            data={"session_id": session_id, **data},
+            client_ip="127.0.0.1",
+            client_id=client_id,
+        )
+
+    started = [call.args[2] for call in send_envelope.await_args_list]
+    assert [(s["protocol"], s["stream_id"]) for s in started] == [(2, 1), (2, 2), (1, None)]
+    assert {k: v["session_id"] for k, v in server.frame_streams[client_id].items()} == {1: "s-1", 2: "s-2"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("protocol", [0, -1, "two", 2.5, True, [2]])
+async def test_start_stream_rejects_invalid_protocol(monkeypatch, protocol):
+    ws = _SilentWebSocket()
+    send_error = AsyncMock()
+    monkeypatch.setattr(stream_handlers, "send_error", send_error)
+    server = SimpleNamespace(
+        auth=SimpleNamespace(check=lambda *_args: SimpleNamespace(authorized=True, method="local", client_id=None)),
+        backend=SimpleNamespace(is_ready=True),
+        rate_limiter=RateLimiter(),
+        inference_executor=InferenceExecutor(workers=1),
+        client_tenants={},
+        client_sessions={},
+        frame_streams={},
+    )
+
+    await stream_handlers.handle_start_stream(
+        server=server,
+        websocket=ws,
+        data={"session_id": "s-1", "protocol": protocol},
+        client_ip="127.0.0.1",
+        client_id="client-bad",
+    )
+
+    assert "Invalid protocol" in send_error.await_args.args[1]
+    assert server.client_sessions == {}
+    assert server.frame_streams == {}
@@ -0,0 +1,141 @@
+import asyncio
+import json
+import multiprocessing
+import os
+import signal
+import socket
+import time
+from types import SimpleNamespace
+
+import aiohttp
+import pytest
+import websockets
+
+from matilda_ears.service.supervisor import WorkerSupervisor
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(os, "fork") or not hasattr(socket, "SO_REUSEPORT"), reason="needs fork and SO_REUSEPORT"
+)
+
+
+class _PidServer:
+    """Answers every connection with the pid of the worker that accepted it and of the one that loaded the model."""
+
+    backend_name = "dummy"
+    ssl_enabled = False
+    ssl_context = None
+
+    def __init__(self):
+        self.host = "127.0.0.1"
+        self.port = None
+        self.backend = SimpleNamespace(is_ready=True)
+        self.connected_clients = set()
+        self.streaming_sessions = {}
+        self.pcm_sessions = {}
+        self.ending_sessions = set()
+        self.opus_decoder = SimpleNamespace(get_active_sessions=list)
+        self.loaded_in = None
+
+    async def load_model(self):
+        self.loaded_in = os.getpid()
+
+    async def handle_client(self, websocket, path=None):
+        self.connected_clients.add(websocket)
+        try:
+            await websocket.send(json.dumps({"pid": os.getpid(), "loaded_in": self.loaded_in}))
+            await websocket.wait_closed()
+        finally:
+            self.connected_clients.discard(websocket)
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _run_supervisor(port, health_port, health_dir):
+    supervisor = WorkerSupervisor(
+        _PidServer(),
+        2,
+        "127.0.0.1",
+        port,
+        health_port=health_port,
+        worker_health_dir=health_dir,
+        grace_seconds=1.0,
+        ready_timeout=20.0,
+    )
+    asyncio.run(supervisor.run())
+
+
+async def _health(health_port):
+    try:
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=2)) as session:
+            async with session.get(f"http://127.0.0.1:{health_port}/health") as response:
+                return response.status, await response.json()
+    except (aiohttp.ClientError, OSError, TimeoutError):
+        return None, None
+
+
+async def _metrics(health_port):
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5)) as session:
+        async with session.get(f"http://127.0.0.1:{health_port}/metrics") as response:
+            return response.status, await response.text()
+
+
+def _wait_for(predicate, health_port, timeout=20.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        status, payload = asyncio.run(_health(health_port))
+        if status == 200 and predicate(payload):
+            return payload
+        time.sleep(0.2)
+    raise AssertionError(f"supervisor health never matched (last: {payload})")
+
+
+async def _accepting_pids(port, connections=8):
+    pids = set()
+    for _ in range(connections):
+        async with websockets.connect(f"ws://127.0.0.1:{port}") as ws:
+            reply = json.loads(await ws.recv())
+            # Every worker loads its own model after the fork
+            assert reply["loaded_in"] == reply["pid"]
+            pids.add(reply["pid"])
+    return pids
+
+
+def test_supervisor_serves_from_workers_and_rolls_them(tmp_path):
+    port, health_port = _free_port(), _free_port()
+    process = multiprocessing.get_context("fork").Process(
+        target=_run_supervisor, args=(port, health_port, str(tmp_path))
+    )
+    process.start()
+    try:
+        payload = _wait_for(lambda p: len(p["workers"]) == 2, health_port)
+        first_pids = {w["pid"] for w in payload["workers"]}
+        assert payload["mode"] == "supervisor"
+        assert all(w["health"]["service"] == "ears" for w in payload["workers"])
+
+        assert asyncio.run(_accepting_pids(port)) <= first_pids
+
+        status, metrics = asyncio.run(_metrics(health_port))
+        assert status == 200
+        assert "matilda_ears_workers 2" in metrics
+        assert metrics.count("# TYPE matilda_ears_connected_clients gauge") == 1
+        assert 'matilda_ears_connected_clients{worker="0"}' in metrics
+        assert 'matilda_ears_connected_clients{worker="1"}' in metrics
+
+        os.kill(process.pid, signal.SIGHUP)
+        payload = _wait_for(
+            lambda p: len(p["workers"]) == 2 and not {w["pid"] for w in p["workers"]} & first_pids,
+            health_port,
+        )
+        second_pids = {w["pid"] for w in payload["workers"]}
+        assert payload["restarts"] == 2
+        assert asyncio.run(_accepting_pids(port)) <= second_pids
+    finally:
+        os.kill(process.pid, signal.SIGTERM)
+        process.join(timeout=15)
+
+    assert process.exitcode == 0
+    assert not list(tmp_path.glob("ears-worker-*.sock"))
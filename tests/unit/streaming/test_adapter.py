@@ -1,5 +1,7 @@
 """Tests for SimulStreaming adapter with alpha/omega text separation."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pytest
 
@@ -88,6 +90,25 @@ class TestStreamingAdapter:
         assert adapter.config.language == "fr"
         assert adapter.config.model_size == "medium"
 
+    @pytest.mark.asyncio
+    async def test_start_builds_on_inference_executor(self):
+        class RecordingExecutor(ThreadPoolExecutor):
+            submitted = 0
+
+            def submit(self, fn, /, *args, **kwargs):
+                RecordingExecutor.submitted += 1
+                return super().submit(fn, *args, **kwargs)
+
+        executor = RecordingExecutor(max_workers=1)
+        adapter = StreamingAdapter(executor=executor)
+        adapter._build = lambda: ("wrapper", None)
+
+        await adapter.start()
+        executor.shutdown()
+
+        assert adapter.is_initialized
+        assert RecordingExecutor.submitted == 1
+
     @pytest.mark.asyncio
     async def test_process_chunk_before_start_raises(self):
         adapter = StreamingAdapter()
@@ -96,6 +117,69 @@ class TestStreamingAdapter:
         with pytest.raises(RuntimeError, match="not started"):
             await adapter.process_chunk(pcm)
 
+    def test_drain_runs_single_inference_pass(self):
+        class CountingWrapper:
+            def __init__(self):
+                self.inserted = []
+                self.iterations = 0
+
+            def insert_audio_chunk(self, audio):
+                self.inserted.append(audio)
+
+            def process_iter(self):
+                self.iterations += 1
+                return {"alpha": "hello", "omega": ""}
+
+        adapter = StreamingAdapter()
+        adapter._wrapper = CountingWrapper()
+        chunks = [np.full(960, 1000, dtype=np.int16) for _ in range(5)]
+
+        result = adapter._add_audio_chunks(chunks)
+
+        assert result["alpha"] == "hello"
+        assert len(adapter._wrapper.inserted) == 5
+        assert adapter._wrapper.iterations == 1
+        assert adapter._wrapper.inserted[0].dtype == np.float32
+
+    def test_per_chunk_drain_when_coalescing_disabled(self):
+        class CountingWrapper:
+            iterations = 0
+
+            def insert_audio_chunk(self, audio):
+                pass
+
+            def process_iter(self):
+                self.iterations += 1
+                return {"alpha": "", "omega": ""}
+
+        adapter = StreamingAdapter(StreamingConfig(coalesce_drain=False))
+        adapter._wrapper = CountingWrapper()
+
+        adapter._add_audio_chunks([np.zeros(960, dtype=np.int16) for _ in range(3)])
+
+        assert adapter._wrapper.iterations == 3
+
+    def test_parakeet_drain_concatenates_chunks(self):
+        from matilda_ears.transcription.streaming.internal.parakeet_adapter import ParakeetStreamingAdapter
+
+        class RecordingTranscriber:
+            def __init__(self):
+                self.calls = []
+
+            def add_audio(self, audio):
+                self.calls.append(audio)
+                return "result"
+
+        adapter = ParakeetStreamingAdapter(backend=object())
+        adapter._transcriber = RecordingTranscriber()
+
+        result = adapter._add_audio_chunks([np.full(960, 16384, dtype=np.int16) for _ in range(4)])
+
+        assert result == "result"
+        assert len(adapter._transcriber.calls) == 1
+        assert adapter._transcriber.calls[0].shape == (3840,)
+        assert adapter._transcriber.calls[0][0] == pytest.approx(0.5)
+
 
 class TestAlphaOmegaWrapper:
     """Test AlphaOmegaWrapper behavior with mock objects."""
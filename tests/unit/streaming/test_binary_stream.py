@@ -1,9 +1,14 @@
+import json
+
 import numpy as np
 import pytest
 
 from matilda_ears.audio.decoder import OpusStreamDecoder
 from matilda_ears.audio.encoder import OpusEncoder
+from matilda_ears.schemas import CODEC_OPUS, CODEC_PCM16, FRAME_FLAG_ACK, AudioFrame, FrameError, decode_frame
+from matilda_ears.transcription.client.internal.streaming import StreamingAudioClient
 from matilda_ears.transcription.server import handlers
+from matilda_ears.transcription.server.internal.rate_limit import RateLimiter
 
 
 class DummyWebSocket:
@@ -31,6 +36,9 @@ async def test_binary_stream_chunk_updates_session_counts():
     server.ending_sessions = set()
     server.streaming_sessions = {}
     server.binary_stream_sessions = {client_id: session_id}
+    server.rate_limiter = RateLimiter()
+    server.client_tenants = {}
+    server.resamplers = {}
 
     websocket = DummyWebSocket()
 
@@ -38,3 +46,128 @@ async def test_binary_stream_chunk_updates_session_counts():
 
     assert session_id in server.session_chunk_counts
     assert server.session_chunk_counts[session_id]["received"] == 1
+
+
+def _frame_server(client_id, session_id):
+    server = type("Server", (), {})()
+    server.opus_decoder = OpusStreamDecoder()
+    server.opus_decoder.create_session(session_id, 16000, 1)
+    server.session_chunk_counts = {}
+    server.ending_sessions = set()
+    server.streaming_sessions = {}
+    server.pcm_sessions = {}
+    server.client_sessions = {}
+    server.wake_word_sessions = {}
+    server.rate_limiter = RateLimiter()
+    server.client_tenants = {}
+    server.resamplers = {}
+    server.frame_streams = {client_id: {7: {"session_id": session_id, "next_seq": 0}}}
+    return server
+
+
+def test_frame_round_trip():
+    frame = AudioFrame(stream_id=3, seq=41, codec=CODEC_PCM16, sample_rate=8000, channels=2, payload=b"\x01\x02")
+
+    decoded = decode_frame(frame.encode())
+
+    assert decoded == frame
+    with pytest.raises(FrameError):
+        decode_frame(b"RIFF" + b"\x00" * 40)
+    with pytest.raises(FrameError):
+        decode_frame(frame.encode()[:10])
+
+
+@pytest.mark.asyncio
+async def test_binary_frame_routes_opus_to_session_and_acks():
+    encoder = OpusEncoder(sample_rate=16000, channels=1)
+    encoded = encoder.encode_chunk(np.zeros(960, dtype=np.int16))
+    server = _frame_server("client-1", "s-1")
+    websocket = DummyWebSocket()
+
+    for seq in (0, 2):
+        frame = AudioFrame(
+            stream_id=7,
+            seq=seq,
+            codec=CODEC_OPUS,
+            sample_rate=16000,
+            channels=1,
+            payload=encoded,
+            flags=FRAME_FLAG_ACK,
+        )
+        await handlers.handle_binary_frame(server, websocket, frame.encode(), "127.0.0.1", "client-1")
+
+    assert server.session_chunk_counts["s-1"]["received"] == 2
+    assert server.frame_streams["client-1"][7]["next_seq"] == 3
+    acks = [json.loads(message)["result"] for message in websocket.sent]
+    assert [ack["type"] for ack in acks] == ["chunk_received", "chunk_received"]
+
+
+@pytest.mark.asyncio
+async def test_binary_frame_pcm_creates_pcm_session_from_header():
+    server = _frame_server("client-1", "s-1")
+    websocket = DummyWebSocket()
+    pcm = np.full(800, 1000, dtype=np.int16)
+    frame = AudioFrame(stream_id=7, seq=0, codec=CODEC_PCM16, sample_rate=8000, channels=1, payload=pcm.tobytes())
+
+    await handlers.handle_binary_frame(server, websocket, frame.encode(), "127.0.0.1", "client-1")
+
+    session = server.pcm_sessions["s-1"]
+    assert session["sample_rate"] == 8000
+    assert session["needs_resampling"] is True
+    assert len(session["samples"]) == 1600
+    assert websocket.sent == []
+
+
+@pytest.mark.asyncio
+async def test_binary_frame_for_unknown_stream_is_rejected():
+    server = _frame_server("client-1", "s-1")
+    websocket = DummyWebSocket()
+    frame = AudioFrame(stream_id=99, seq=0, codec=CODEC_OPUS, sample_rate=16000, channels=1, payload=b"x")
+
+    await handlers.handle_binary_frame(server, websocket, frame.encode(), "127.0.0.1", "client-1")
+
+    assert "Unknown stream" in json.loads(websocket.sent[0])["error"]["message"]
+
+
+def test_streaming_client_sends_frames_once_negotiated():
+    client = StreamingAudioClient("ws://localhost:1", token="t")
+    client.session_id = "s-1"
+
+    legacy = client._opus_message(b"abc")
+    client.stream_id = 5
+    first, second = client._opus_message(b"abc"), client._opus_message(b"def")
+
+    assert json.loads(legacy)["type"] == "audio_chunk"
+    assert (decode_frame(first).seq, decode_frame(second).seq) == (0, 1)
+    assert decode_frame(second).stream_id == 5
+    assert decode_frame(second).payload == b"def"
+
+
+@pytest.mark.asyncio
+async def test_ingress_routes_only_frames_to_frame_handler(monkeypatch):
+    from matilda_ears.transcription.server.core import _process_ingress
+    from matilda_ears.transcription.server.internal.ingress import IngressQueue
+
+    routed = []
+    for name in ("handle_binary_frame", "handle_binary_stream_chunk", "handle_binary_audio"):
+
+        async def _record(_server, _ws, message, _ip, _client_id, name=name):
+            routed.append((name, message[:4]))
+
+        monkeypatch.setattr(handlers, name, _record)
+
+    server = _frame_server("client-1", "s-1")
+    server.binary_stream_sessions = {}
+    frame = AudioFrame(stream_id=7, seq=0, codec=CODEC_PCM16, sample_rate=16000, channels=1, payload=b"\x00\x00")
+    queue = IngressQueue()
+    for message in (frame.encode(), b"RIFF" + b"\x00" * 40, b"ME"):
+        queue.put(message)
+    queue.close()
+
+    await _process_ingress(server, DummyWebSocket(), queue, "127.0.0.1", "client-1")
+
+    assert routed == [
+        ("handle_binary_frame", b"ME\x02\x00"),
+        ("handle_binary_audio", b"RIFF"),
+        ("handle_binary_audio", b"ME"),
+    ]
@@ -0,0 +1,93 @@
+"""Tests for StreamingSession background warm-up."""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from matilda_ears.transcription.streaming import StreamingConfig, StreamingResult, StreamingSession
+
+
+class _SlowAdapter:
+    def __init__(self):
+        self.release = asyncio.Event()
+        self.chunks = []
+        self.reset_called = False
+
+    async def start(self):
+        await self.release.wait()
+
+    async def process_chunk(self, pcm):
+        self.chunks.append(pcm)
+        return StreamingResult(alpha_text="hello", audio_duration_seconds=len(pcm) / 16000)
+
+    async def finalize(self):
+        return StreamingResult(alpha_text="hello", is_final=True)
+
+    async def reset(self):
+        self.reset_called = True
+
+
+def _session_with(adapter):
+    session = StreamingSession("s-1", config=StreamingConfig(backend="simul_streaming"))
+    session._adapter = adapter
+    return session
+
+
+@pytest.mark.asyncio
+async def test_chunks_are_buffered_until_session_is_ready():
+    adapter = _SlowAdapter()
+    session = _session_with(adapter)
+
+    session.start_in_background()
+    first = await session.process_chunk(np.ones(160, dtype=np.int16))
+    second = await session.process_chunk(np.ones(320, dtype=np.int16))
+
+    assert not session.is_ready
+    assert first.confirmed_text == ""
+    assert second.confirmed_text == ""
+    assert adapter.chunks == []
+
+    adapter.release.set()
+    result = await session.wait_until_ready()
+
+    assert session.is_ready
+    assert result.confirmed_text == "hello"
+    assert len(adapter.chunks) == 1
+    assert adapter.chunks[0].size == 480
+
+    await session.process_chunk(np.ones(160, dtype=np.int16))
+    assert len(adapter.chunks) == 2
+
+
+@pytest.mark.asyncio
+async def test_finalize_waits_for_warm_up():
+    adapter = _SlowAdapter()
+    session = _session_with(adapter)
+
+    session.start_in_background()
+    await session.process_chunk(np.ones(160, dtype=np.int16))
+    finalize = asyncio.create_task(session.finalize())
+    await asyncio.sleep(0)
+    assert not finalize.done()
+
+    adapter.release.set()
+    result = await finalize
+
+    assert result.is_final
+    assert len(adapter.chunks) == 1
+
+
+@pytest.mark.asyncio
+async def test_abort_cancels_pending_warm_up():
+    adapter = _SlowAdapter()
+    session = _session_with(adapter)
+
+    session.start_in_background()
+    await session.process_chunk(np.ones(160, dtype=np.int16))
+    await session.abort()
+
+    assert adapter.reset_called
+    assert adapter.chunks == []
+    with pytest.raises(RuntimeError):
+        await session.process_chunk(np.ones(160, dtype=np.int16))
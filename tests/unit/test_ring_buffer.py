@@ -0,0 +1,69 @@
+import numpy as np
+import opuslib
+import pytest
+
+from matilda_ears.audio.decoder import OpusDecoder
+from matilda_ears.audio.ring_buffer import RingBuffer
+
+
+def test_ring_keeps_the_most_recent_samples_in_order():
+    ring = RingBuffer(max_samples=10, initial_samples=4)
+    for start in range(0, 25, 3):
+        ring.append(np.arange(start, start + 3, dtype=np.int16))
+
+    assert ring.capacity == 10
+    assert ring.total_samples == 27
+    assert ring.dropped_samples == 17
+    np.testing.assert_array_equal(ring.view(), np.arange(17, 27))
+
+
+def test_view_is_zero_copy_and_read_only():
+    ring = RingBuffer(max_samples=8, dtype=np.float32, initial_samples=8)
+    ring.append(np.ones(6, dtype=np.float32))
+    ring.append(np.full(5, 2.0, dtype=np.float32))  # wraps
+
+    view = ring.view()
+
+    assert view.flags.c_contiguous
+    assert np.shares_memory(view, ring._storage)
+    np.testing.assert_array_equal(view, [1, 1, 1, 2, 2, 2, 2, 2])
+    with pytest.raises(ValueError):
+        view[0] = 0
+
+
+def test_chunk_larger_than_capacity_keeps_its_tail():
+    ring = RingBuffer(max_samples=4)
+    ring.append(np.arange(10, dtype=np.int16))
+
+    np.testing.assert_array_equal(ring.view(), [6, 7, 8, 9])
+    ring.clear()
+    assert len(ring) == 0
+    assert ring.total_samples == 0
+
+
+def test_storage_stays_flat_once_full():
+    ring = RingBuffer(max_samples=1000, initial_samples=100)
+    for _ in range(50):
+        ring.append(np.zeros(960, dtype=np.int16))
+    storage = ring._storage
+
+    for _ in range(500):
+        ring.append(np.zeros(960, dtype=np.int16))
+
+    assert ring._storage is storage
+    assert len(ring) == 1000
+
+
+def test_opus_decoder_caps_accumulated_pcm(monkeypatch):
+    monkeypatch.setattr("matilda_ears.audio.internal.decoder.MAX_BUFFER_SECONDS", 1)
+    encoder = opuslib.Encoder(16000, 1, opuslib.APPLICATION_VOIP)
+    decoder = OpusDecoder()
+    frame = (np.sin(np.arange(960) / 8.0) * 8000).astype(np.int16).tobytes()
+
+    for _ in range(40):  # 2.4 s of audio
+        decoder.decode_chunk(encoder.encode(frame, 960))
+
+    assert decoder.sample_count == 40 * 960
+    assert decoder.get_pcm_array().size == 16000
+    assert decoder.get_stats()["buffer_size_bytes"] == 32000
+    assert len(decoder.get_wav_data()) == 44 + 32000
@@ -76,3 +76,51 @@ def test_one_time_token_usage_saves(token_manager):
         # validate with mark_as_used=True should trigger save
         token_manager.validate_token(token, mark_as_used=True)
         assert mock_save.call_count >= 1
+
+
+def test_validation_reuses_decoded_payload(token_manager):
+    token = token_manager.generate_token("cached_client")["token"]
+
+    with patch("matilda_ears.core.token_manager.jwt.decode", wraps=__import__("jwt").decode) as mock_decode:
+        first = token_manager.validate_token(token)
+        second = token_manager.validate_token(token)
+
+    assert mock_decode.call_count == 1
+    assert first == second
+    # callers get their own copy
+    second["client_name"] = "changed"
+    assert token_manager.validate_token(token)["client_name"] == "cached_client"
+
+
+def test_revoked_token_is_not_served_from_cache(token_manager):
+    token_info = token_manager.generate_token("revoked_client")
+    assert token_manager.validate_token(token_info["token"]) is not None
+
+    token_manager.revoke_token(token_info["token_id"])
+
+    assert not token_manager._decoded_cache
+    assert token_manager.validate_token(token_info["token"]) is None
+
+
+def test_key_rotation_invalidates_cache(token_manager):
+    token = token_manager.generate_token("rotated_client")["token"]
+    assert token_manager.validate_token(token) is not None
+
+    token_manager.secret_key = "another_secret_key_for_unit_tests____32_bytes_min____"
+
+    assert token_manager.validate_token(token) is None
+
+
+def test_cached_payload_expires_with_ttl(token_manager):
+    token = token_manager.generate_token("ttl_client")["token"]
+    token_manager.cache_ttl = 10.0
+
+    with patch("matilda_ears.core.token_manager.time.time", return_value=1_000.0):
+        token_manager.validate_token(token)
+    with (
+        patch("matilda_ears.core.token_manager.time.time", return_value=1_011.0),
+        patch("matilda_ears.core.token_manager.jwt.decode", wraps=__import__("jwt").decode) as mock_decode,
+    ):
+        assert token_manager.validate_token(token) is not None
+
+    mock_decode.assert_called_once()
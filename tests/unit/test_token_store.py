@@ -0,0 +1,161 @@
+import json
+import multiprocessing
+import os
+
+import pytest
+
+from matilda_ears.core.token_manager import TokenManager
+from matilda_ears.core.token_store import AppendOnlyTokenStore, SqliteTokenStore, UsedTokenStore, open_used_token_store
+
+TEST_SECRET_KEY = "test_secret_key_for_unit_tests____32_bytes_minimum____"
+
+
+@pytest.fixture(params=["log", "sqlite"])
+def store_kind(request):
+    return request.param
+
+
+def test_store_persists_each_add(tmp_path, store_kind):
+    store = open_used_token_store(store_kind, tmp_path)
+    assert store.load() == set()
+    store.add("a")
+    store.add("b")
+    store.close()
+
+    assert open_used_token_store(store_kind, tmp_path).load() == {"a", "b"}
+
+
+def test_store_migrates_legacy_json(tmp_path, store_kind):
+    (tmp_path / "used_tokens.json").write_text(json.dumps({"used_tokens": ["old-1", "old-2"]}))
+
+    store = open_used_token_store(store_kind, tmp_path)
+    assert store.load() == {"old-1", "old-2"}
+    store.add("new")
+    store.close()
+
+    assert not (tmp_path / "used_tokens.json").exists()
+    assert (tmp_path / "used_tokens.json.migrated").exists()
+    assert open_used_token_store(store_kind, tmp_path).load() == {"old-1", "old-2", "new"}
+
+
+def test_compact_drops_ids_not_kept(tmp_path, store_kind):
+    store = open_used_token_store(store_kind, tmp_path)
+    store.load()
+    for token_id in ("a", "b", "c"):
+        store.add(token_id)
+
+    store.compact({"b"})
+    store.close()
+
+    assert open_used_token_store(store_kind, tmp_path).load() == {"b"}
+
+
+def test_append_only_log_is_one_line_per_use(tmp_path):
+    store = AppendOnlyTokenStore(tmp_path / "used.log")
+    store.load()
+    store.add("a")
+    store.add("b")
+
+    assert (tmp_path / "used.log").read_text() == "a\nb\n"
+
+
+def test_unshared_store_claims_by_appending(tmp_path):
+    store = AppendOnlyTokenStore(tmp_path / "used.log")
+    store.load()
+
+    assert store.claim("a") is True
+    assert store.contains("a") is False  # the caller's in-memory set covers this process
+    assert (tmp_path / "used.log").read_text() == "a\n"
+    with pytest.raises(TypeError):
+        UsedTokenStore()
+
+
+def test_sqlite_store_uses_wal(tmp_path):
+    store = SqliteTokenStore(tmp_path / "used.sqlite3")
+
+    assert store._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    store.close()
+
+
+def test_one_time_token_stays_spent_after_restart(tmp_path, store_kind):
+    manager = TokenManager(secret_key=TEST_SECRET_KEY, data_dir=tmp_path, used_token_store=store_kind)
+    token = manager.generate_token("once", one_time_use=True)["token"]
+    assert manager.validate_token(token, mark_as_used=True) is not None
+
+    restarted = TokenManager(secret_key=TEST_SECRET_KEY, data_dir=tmp_path, used_token_store=store_kind)
+
+    assert restarted.validate_token(token) is None
+
+
+def test_revoking_token_compacts_its_used_entry(tmp_path):
+    manager = TokenManager(secret_key=TEST_SECRET_KEY, data_dir=tmp_path)
+    token_info = manager.generate_token("once", one_time_use=True)
+    manager.validate_token(token_info["token"], mark_as_used=True)
+
+    manager.revoke_token(token_info["token_id"])
+
+    assert manager.used_tokens == set()
+    assert (tmp_path / "used_tokens.log").read_text() == ""
+
+
+def test_sqlite_store_claims_each_token_once_across_connections(tmp_path):
+    first = SqliteTokenStore(tmp_path / "used.sqlite3")
+    second = SqliteTokenStore(tmp_path / "used.sqlite3")
+
+    assert first.claim("a") is True
+    assert second.contains("a") is True
+    assert second.claim("a") is False
+    first.close()
+    second.close()
+
+
+def test_one_time_token_is_spent_for_every_process_sharing_the_store(tmp_path):
+    worker_a = TokenManager(secret_key=TEST_SECRET_KEY, data_dir=tmp_path)
+    token = worker_a.generate_token("once", one_time_use=True)["token"]
+    worker_a.share_used_tokens()
+    worker_b = TokenManager(secret_key=TEST_SECRET_KEY, data_dir=tmp_path, used_token_store="sqlite")
+
+    assert worker_a.validate_token(token, mark_as_used=True) is not None
+
+    assert worker_b.validate_token(token) is None
+    assert worker_b.validate_token(token, mark_as_used=True) is None
+
+
+def test_share_used_tokens_keeps_ids_spent_before_the_switch(tmp_path):
+    manager = TokenManager(secret_key=TEST_SECRET_KEY, data_dir=tmp_path)
+    token = manager.generate_token("once", one_time_use=True)["token"]
+    manager.validate_token(token, mark_as_used=True)
+
+    manager.share_used_tokens()
+
+    assert manager.used_token_store.shared
+    restarted = TokenManager(secret_key=TEST_SECRET_KEY, data_dir=tmp_path, used_token_store="sqlite")
+    assert restarted.validate_token(token) is None
+
+
+def _claim_in_child(store, token_id, results):
+    results.put(store.claim(token_id))
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork")
+def test_sqlite_store_reconnects_after_fork(tmp_path):
+    store = SqliteTokenStore(tmp_path / "used.sqlite3")
+    store.load()
+    context = multiprocessing.get_context("fork")
+    results = context.Queue()
+
+    child = context.Process(target=_claim_in_child, args=(store, "forked", results))
+    child.start()
+    child.join(timeout=10)
+
+    assert results.get(timeout=5) is True
+    assert store.claim("forked") is False
+    store.close()
+
+
+def test_sqlite_store_syncs_every_commit(tmp_path):
+    store = SqliteTokenStore(tmp_path / "used.sqlite3")
+
+    # 2 = FULL: the WAL is synced on each commit, not only at checkpoints
+    assert store._conn.execute("PRAGMA synchronous").fetchone()[0] == 2
+    store.close()
@@ -0,0 +1,97 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from matilda_ears.audio.vad import MultiStreamVAD, VADStream, speech_probability  # noqa: E402
+
+
+class FakeSilero:
+    """Mimics the state handling of the silero-vad model wrappers."""
+
+    def __init__(self):
+        self.batch_sizes = []
+        self.reset_states()
+
+    def reset_states(self, batch_size=1):
+        self._state = torch.zeros(2, batch_size, 128)
+        self._context = torch.zeros(0)
+        self._last_sr = 0
+        self._last_batch_size = 0
+
+    def __call__(self, x, sr):
+        if x.dim() == 1:
+            x = x.unsqueeze(0)
+        batch_size = x.shape[0]
+        self.batch_sizes.append(batch_size)
+        if not self._last_batch_size or self._last_batch_size != batch_size:
+            self.reset_states(batch_size)
+        if not len(self._context):
+            self._context = torch.zeros(batch_size, 64)
+        x = torch.cat([self._context, x], dim=1)
+        self._state = self._state * 0.5 + x.abs().mean(dim=1).view(1, batch_size, 1)
+        self._context = x[..., -64:]
+        self._last_sr = sr
+        self._last_batch_size = batch_size
+        return torch.sigmoid(self._state[0, :, :1] * 10 - 1)
+
+
+def _sequential_probs(chunks):
+    """Reference: one model per stream, one frame at a time."""
+    model = FakeSilero()
+    probs = []
+    remainder = np.zeros(0, dtype=np.float32)
+    for chunk in chunks:
+        audio = np.concatenate([remainder, chunk.astype(np.float32) / 32768.0])
+        count = audio.size // 512
+        remainder = audio[count * 512 :]
+        frame_probs = [float(model(torch.from_numpy(audio[i * 512 : (i + 1) * 512]), 16000)) for i in range(count)]
+        probs.append(max(frame_probs) if frame_probs else (probs[-1] if probs else 0.0))
+    return probs
+
+
+def test_streams_keep_independent_state_in_batched_steps():
+    engine = MultiStreamVAD(model=FakeSilero())
+    rng = np.random.default_rng(0)
+    loud = [(rng.standard_normal(960) * 8000).astype(np.int16) for _ in range(5)]
+    quiet = [(rng.standard_normal(960) * 50).astype(np.int16) for _ in range(5)]
+    a, b = engine.stream(), engine.stream()
+
+    async def run():
+        probs_a, probs_b = [], []
+        for chunk_a, chunk_b in zip(loud, quiet, strict=True):
+            pa, pb = await asyncio.gather(speech_probability(a, chunk_a), speech_probability(b, chunk_b))
+            probs_a.append(pa)
+            probs_b.append(pb)
+        return probs_a, probs_b
+
+    probs_a, probs_b = asyncio.run(run())
+
+    assert probs_a == pytest.approx(_sequential_probs(loud), abs=1e-6)
+    assert probs_b == pytest.approx(_sequential_probs(quiet), abs=1e-6)
+    # both streams were scored in the same model calls
+    assert set(engine.model.batch_sizes) == {2}
+
+
+def test_reset_states_forgets_stream_history():
+    engine = MultiStreamVAD(model=FakeSilero())
+    stream = engine.stream()
+    chunk = np.full(1024, 4000, dtype=np.int16)
+
+    first = stream.process_chunk(chunk)
+    stream.process_chunk(chunk)
+    stream.reset_states()
+
+    assert stream.process_chunk(chunk) == pytest.approx(first)
+    assert stream.threshold == engine.threshold
+
+
+def test_speech_probability_uses_plain_vad_synchronously():
+    class PlainVAD:
+        def process_chunk(self, chunk):
+            return 0.7
+
+    assert not isinstance(PlainVAD(), VADStream)
+    assert asyncio.run(speech_probability(PlainVAD(), np.zeros(512, dtype=np.int16))) == 0.7